@@ -0,0 +1,146 @@
+import os
+import uuid
+from datetime import datetime, time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from names import diff_rosters
+
+# Snapshots are stored one row per (member, office held) and partitioned by
+# term on disk, so term filters skip whole directories and office/status
+# filters are pushed down to the Parquet row groups.
+ARCHIVE_SCHEMA = pa.schema([
+    ('Last Name', pa.string()),
+    ('First Name', pa.string()),
+    ('Current Office', pa.string()),
+    ('Office', pa.string()),
+    ('Status', pa.string()),
+    ('Snapshot', pa.timestamp('s')),
+    ('Source', pa.string()),
+    ('term', pa.string()),
+])
+PARTITIONING = ds.partitioning(pa.schema([('term', pa.string())]), flavor='hive')
+
+def term_for(date):
+    """
+    Returns the term a date falls in, as a sortable key: '2025-1' (spring) or '2025-2' (fall).
+    """
+    return f'{date.year}-{1 if date.month <= 6 else 2}'
+
+def archive_roster(df, archive_dir, snapshot=None, term=None, source=None):
+    """
+    Appends a full roster (as returned by readers.read_roster) to the archive as
+    one snapshot. Returns the snapshot timestamp.
+    """
+    snapshot = (snapshot or datetime.now()).replace(microsecond=0)
+    term = term or term_for(snapshot)
+
+    offices = df['Current Office'].astype('string').str.split('/').explode().str.strip()
+    rows = df.loc[offices.index].assign(
+        **{
+            'Current Office': lambda d: d['Current Office'].astype('string'),
+            'Office': offices.replace('', pd.NA).to_numpy(),
+            'Status': lambda d: d['Status'].astype('string'),
+            'Snapshot': snapshot,
+            'Source': source,
+            'term': term,
+        }
+    )
+    table = pa.Table.from_pandas(rows[ARCHIVE_SCHEMA.names], schema=ARCHIVE_SCHEMA, preserve_index=False)
+
+    ds.write_dataset(
+        table, archive_dir, format='parquet', partitioning=PARTITIONING,
+        basename_template=f"snapshot-{snapshot:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+        existing_data_behavior='overwrite_or_ignore',
+    )
+    return snapshot
+
+def _dataset(archive_dir):
+    return ds.dataset(archive_dir, format='parquet', partitioning=PARTITIONING, schema=ARCHIVE_SCHEMA)
+
+def query(archive_dir, terms=None, office=None, status=None, snapshot=None, columns=None):
+    """
+    Reads archived rows matching the given filters. Every filter is pushed into
+    the scan: `terms` prunes partitions, the rest prune row groups.
+    """
+    if not os.path.isdir(archive_dir):
+        return pd.DataFrame(columns=columns or ARCHIVE_SCHEMA.names)
+
+    conditions = []
+    if terms is not None:
+        conditions.append(ds.field('term').isin(list(terms)))
+    if office is not None:
+        conditions.append(ds.field('Office') == office)
+    if status is not None:
+        conditions.append(ds.field('Status') == status)
+    if snapshot is not None:
+        conditions.append(ds.field('Snapshot') == pa.scalar(snapshot, pa.timestamp('s')))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return _dataset(archive_dir).to_table(filter=expression, columns=columns).to_pandas()
+
+def _members(rows):
+    # Collapse the per-office rows of one snapshot back into one row per member
+    return (rows.drop_duplicates(['Last Name', 'First Name'])
+                .loc[:, ['Last Name', 'First Name', 'Current Office', 'Status']]
+                .reset_index(drop=True))
+
+def _latest_snapshot(archive_dir, terms, before=None):
+    """
+    Returns (snapshot, term) of the latest snapshot in `terms` (all terms
+    if None) taken no later than `before`, or (None, None).
+    """
+    rows = query(archive_dir, terms=terms, columns=['Snapshot', 'term'])
+    if before is not None:
+        if not isinstance(before, datetime):
+            before = datetime.combine(before, time.max)  # A date includes the whole day
+        rows = rows[rows['Snapshot'] <= pd.Timestamp(before)]
+    if rows.empty:
+        return None, None
+    latest = rows.loc[rows['Snapshot'].idxmax()]
+    return latest['Snapshot'], latest['term']
+
+def as_of(archive_dir, date, status='Active'):
+    """
+    Returns the membership recorded by the latest snapshot taken on or before `date`.
+    Only the partitions of that term and the one before it are scanned, and
+    the snapshot itself is read from its own term's partition.
+    """
+    term = term_for(date)
+    year, half = map(int, term.split('-'))
+    previous = f'{year - 1}-2' if half == 1 else f'{year}-1'
+    snapshot, term = _latest_snapshot(archive_dir, [previous, term], before=date)
+    if snapshot is None:
+        # Nothing that recent; fall back to scanning every term
+        snapshot, term = _latest_snapshot(archive_dir, None, before=date)
+    if snapshot is None:
+        return pd.DataFrame(columns=['Last Name', 'First Name', 'Current Office', 'Status'])
+    return _members(query(archive_dir, terms=[term], status=status, snapshot=snapshot.to_pydatetime()))
+
+def office_tenure(archive_dir, office, terms=None):
+    """
+    Lists everyone recorded as holding `office` in `terms` (every term if
+    None), with the first and last snapshot and the terms they held it in.
+    """
+    rows = query(archive_dir, terms=terms, office=office, columns=['Last Name', 'First Name', 'Snapshot', 'term'])
+    return (rows.groupby(['Last Name', 'First Name'], as_index=False)
+                .agg(First=('Snapshot', 'min'), Last=('Snapshot', 'max'), Terms=('term', lambda t: sorted(set(t))))
+                .sort_values('First')
+                .reset_index(drop=True))
+
+def term_diff(archive_dir, from_term, to_term, status='Active'):
+    """
+    Compares the last snapshot of two terms: who joined, left or changed office.
+    """
+    rosters = []
+    for term in (from_term, to_term):
+        snapshot, _ = _latest_snapshot(archive_dir, [term])
+        if snapshot is None:
+            raise ValueError(f"No archived roster for term {term}")
+        rows = query(archive_dir, terms=[term], status=status, snapshot=snapshot.to_pydatetime())
+        rosters.append(_members(rows).drop(columns='Status'))
+    return diff_rosters(*rosters)
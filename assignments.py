@@ -0,0 +1,151 @@
+import os
+import csv
+import argparse
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import date, timedelta
+
+from members import Member, name_key
+
+# One member's term in one office. `start` and `end` are the first and last
+# day held; None means before the records begin / still held.
+Assignment = namedtuple('Assignment', ['last_name', 'first_name', 'office', 'start', 'end'])
+
+ASSIGNMENT_COLUMNS = ['Last Name', 'First Name', 'Office', 'Start', 'End']
+
+# Status given to office holders who are no longer on the roster; they are
+# also marked Member.former, so they are listed with the officers but not
+# counted as active (voting) members
+FORMER_STATUS = 'Alumni'
+
+def _date(text, line, column):
+    text = (text or '').strip()
+    if not text:
+        return None
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"Line {line}: {column} must be a date like 2025-01-31, got {text!r}")
+
+def read_assignments(path):
+    """
+    Reads effective-dated office assignments from a CSV with the columns in
+    ASSIGNMENT_COLUMNS, dates as YYYY-MM-DD. A blank Start or End leaves
+    that side of the term open.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in ASSIGNMENT_COLUMNS if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{os.path.basename(path)} is missing column(s): {', '.join(missing)}")
+
+        assignments = []
+        for line, row in enumerate(reader, 2):
+            office = (row['Office'] or '').strip()
+            if not office:
+                continue
+            start, end = _date(row['Start'], line, 'Start'), _date(row['End'], line, 'End')
+            if start and end and end < start:
+                raise ValueError(f"Line {line}: {office} ends before it starts")
+            last, first = (' '.join((row[c] or '').split()) or None for c in ('Last Name', 'First Name'))
+            assignments.append(Assignment(last, first, office, start, end))
+    return assignments
+
+class OfficeIndex:
+    """
+    Interval index over office assignments. Each office's timeline is cut
+    at every date a term starts or ends, and each piece stores who held the
+    office throughout it, so the holders on any date are one bisect away.
+    """
+    def __init__(self, assignments):
+        by_office = {}
+        for a in assignments:
+            if a.end == date.max:
+                a = a._replace(end=None)  # 9999-12-31 is how some exports write "still held"
+            by_office.setdefault(a.office, []).append(a)
+
+        self._bounds = {}   # office -> sorted dates where the holders change
+        self._holders = {}  # office -> holders from each bound up to the next
+        for office, terms in by_office.items():
+            # Ends are stored as the day after, so every piece is [bound, next bound)
+            bounds = sorted({a.start or date.min for a in terms} | {a.end + timedelta(days=1) for a in terms if a.end})
+            pieces = [[] for _ in bounds]
+            for a in sorted(terms, key=lambda a: a.start or date.min):
+                first = bisect_left(bounds, a.start or date.min)
+                last = bisect_left(bounds, a.end + timedelta(days=1)) if a.end else len(bounds)
+                for piece in pieces[first:last]:
+                    piece.append(a)
+            self._bounds[office] = bounds
+            self._holders[office] = [tuple(piece) for piece in pieces]
+
+    @property
+    def offices(self):
+        return list(self._bounds)
+
+    def holders(self, office, on):
+        """
+        Returns the assignments of everyone holding `office` on date `on`.
+        """
+        bounds = self._bounds.get(office)
+        if not bounds:
+            return ()
+        i = bisect_right(bounds, on) - 1
+        return self._holders[office][i] if i >= 0 else ()
+
+    def held_on(self, on):
+        """
+        Returns {office: assignments} for every office held by someone on `on`.
+        """
+        held = {}
+        for office in self._bounds:
+            holders = self.holders(office, on)
+            if holders:
+                held[office] = holders
+        return held
+
+def roster_as_of(members, index, on):
+    """
+    Returns the roster with each member's Current Office as of date `on`.
+    Offices the index knows (in any case) are taken from it; any other
+    office (an advisor role, say) is kept from the roster. Holders missing
+    from the roster, such as officers who have since graduated, are added
+    with FORMER_STATUS and marked `former`: they are listed with the
+    officers, but don't count towards the active members or the quorum.
+    """
+    held = {}
+    for office, holders in index.held_on(on).items():
+        for a in holders:
+            entry = held.setdefault((name_key(a.last_name), name_key(a.first_name)), [a, []])
+            entry[1].append(office)
+
+    known = {office.lower() for office in index.offices}
+    result = []
+    for m in members:
+        offices = [p for p in m.positions if p and p.lower() not in known]
+        entry = held.pop((name_key(m.last_name), name_key(m.first_name)), None)
+        if entry:
+            offices += entry[1]
+        result.append(Member(m.last_name, m.first_name, '/'.join(offices) or None, m.status, m.row))
+
+    for a, offices in held.values():
+        result.append(Member(a.last_name, a.first_name, '/'.join(offices), FORMER_STATUS, former=True))
+    return result
+
+if __name__ == "__main__":
+    from generator import read_members, print_warnings, write
+
+    parser = argparse.ArgumentParser(description="Generate minutes and rosters for a meeting date from effective-dated office assignments.")
+    parser.add_argument('roster')
+    parser.add_argument('assignments', help="CSV of Last Name, First Name, Office, Start, End")
+    parser.add_argument('date', type=date.fromisoformat, help="Meeting date (YYYY-MM-DD)")
+    parser.add_argument('--output', default='.', help="Output folder (Minutes and Rosters are created inside)")
+    parser.add_argument('--show', action='store_true', help="Only list who held each office on that date")
+    args = parser.parse_args()
+
+    if args.show:
+        for office, holders in OfficeIndex(read_assignments(args.assignments)).held_on(args.date).items():
+            print(f"{office}: {', '.join(f'{a.first_name} {a.last_name}' for a in holders)}")
+    else:
+        active, staff = print_warnings(read_members(args.roster, assignments=args.assignments, as_of=args.date))
+        write(active, staff, docx_output_dir=os.path.join(args.output, 'Minutes'),
+              xlsx_output_dir=os.path.join(args.output, 'Rosters'))
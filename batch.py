@@ -0,0 +1,123 @@
+import os
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from profiles import load_profile, apply_profile
+
+def load_manifest(manifest_path):
+    """
+    Reads a batch manifest of the form
+        {"chapters": [{"id": ..., "roster": ..., "profile": ..., "output": ...}]}
+    Relative paths are resolved against the manifest's directory. `profile`
+    is optional and `output` defaults to a folder named after the chapter id.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, encoding='utf-8') as f:
+        chapters = json.load(f)['chapters']
+
+    seen = set()
+    for chapter in chapters:
+        if chapter['id'] in seen:
+            raise ValueError(f"Duplicate chapter id in manifest: {chapter['id']}")
+        seen.add(chapter['id'])
+        chapter['roster'] = os.path.join(base_dir, chapter['roster'])
+        chapter['output'] = os.path.join(base_dir, chapter.get('output', chapter['id']))
+        if chapter.get('profile'):
+            chapter['profile'] = os.path.join(base_dir, chapter['profile'])
+    return chapters
+
+def read_checkpoint(checkpoint_path):
+    """
+    Returns the ids of chapters already completed according to the checkpoint log.
+    """
+    done = set()
+    if os.path.isfile(checkpoint_path):
+        with open(checkpoint_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn final line from an interrupted run
+                if entry.get('status') == 'done':
+                    done.add(entry['id'])
+    return done
+
+def _record(log, chapter_id, status, error=None):
+    entry = {'id': chapter_id, 'status': status}
+    if error:
+        entry['error'] = error
+    log.write(json.dumps(entry) + '\n')
+    log.flush()
+    os.fsync(log.fileno())
+
+def run_chapter(chapter, profile):
+    """
+    Generates one chapter's roster and outlines in the current (worker) process.
+    """
+    # Workers only pay for the generator imports once they are handed a chapter
+    from generator import read, write
+
+    apply_profile(profile)
+    active_df, advisor_df = read(chapter['roster'])
+    write(
+        active_df, advisor_df,
+        docx_output_dir=os.path.join(chapter['output'], 'Minutes'),
+        xlsx_output_dir=os.path.join(chapter['output'], 'Rosters'),
+    )
+    return chapter['id']
+
+def run_batch(manifest_path, workers=None, checkpoint_path=None):
+    """
+    Runs every chapter in the manifest across a pool of worker processes.
+    Completed chapters are appended to the checkpoint log as they finish, so
+    rerunning an interrupted batch only processes what is left. Failed chapters
+    are logged but not checkpointed and will be retried on the next run.
+    Returns (completed ids, {failed id: error}).
+    """
+    chapters = load_manifest(manifest_path)
+    checkpoint_path = checkpoint_path or manifest_path + '.checkpoint'
+    done = read_checkpoint(checkpoint_path)
+    pending = [c for c in chapters if c['id'] not in done]
+
+    completed, failed = [], {}
+    if not pending:
+        return completed, failed
+
+    profiles = {c['id']: load_profile(c.get('profile')) for c in pending}
+
+    torn = False
+    if os.path.isfile(checkpoint_path) and os.path.getsize(checkpoint_path):
+        with open(checkpoint_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b'\n'
+
+    with open(checkpoint_path, 'a', encoding='utf-8') as log, ProcessPoolExecutor(max_workers=workers) as pool:
+        if torn:
+            # End the line an interrupted run left half-written, or the next entry joins it
+            log.write('\n')
+        futures = {pool.submit(run_chapter, c, profiles[c['id']]): c['id'] for c in pending}
+        for future in as_completed(futures):
+            chapter_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed[chapter_id] = str(e)
+                _record(log, chapter_id, 'failed', str(e))
+            else:
+                completed.append(chapter_id)
+                _record(log, chapter_id, 'done')
+
+    return completed, failed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate minutes and rosters for every chapter in a manifest.")
+    parser.add_argument('manifest', help="JSON manifest listing chapters")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes")
+    parser.add_argument('--checkpoint', default=None, help="Checkpoint log (default: <manifest>.checkpoint)")
+    args = parser.parse_args()
+
+    completed, failed = run_batch(args.manifest, args.workers, args.checkpoint)
+    print(f"Completed {len(completed)} chapter(s), {len(failed)} failed.")
+    for chapter_id, error in failed.items():
+        print(f"  {chapter_id}: {error}")
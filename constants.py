@@ -1,8 +1,16 @@
+# The chapter configuration below can be overridden per chapter (see
+# profiles.py), so it is read as constants.<name> at use time and left out
+# of `from constants import *`.
+__all__ = ['emDash']
+
 officers = ['Alpha', 'Beta', 'Pi', 'Iota', 'Sigma', 'Tau', 'Chi', 'Theta One', 'Theta Two', 'Theta Three', 'Upsilon', 'Psi', 'Phi', 'Lambda', 'Asst. Tau', 'Epsilon', 'Gamma']
 events = ['Chi', 'Pi', 'Upsilon', 'Psi', 'Phi', 'Gamma', 'Sigma']
 exec = ['Alpha', 'Beta', 'Pi', 'Iota', 'Sigma', 'Tau', 'Chi']
 advisors = ['Resident Advisor', 'Chapter Advisor', 'Asst. Chapter Advisor']
 
+# Offices exactly one active member must hold for the outlines to make sense
+required_offices = ['Alpha', 'Sigma']
+
 table_positions = {
     'EXECUTIVE COUNCIL COMMITTEE' : 0,      # Column A
     'HOUSE' : 5,                            # Column F    
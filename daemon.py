@@ -0,0 +1,290 @@
+import os
+import sys
+import json
+import stat
+import time
+import secrets
+import argparse
+import threading
+import subprocess
+from multiprocessing.connection import Listener, Client, AuthenticationError
+
+# A warm generator: one long-lived process that has already imported pandas,
+# python-docx, openpyxl and lxml and keeps its caches (crest images, styles)
+# between jobs. Clients find it through a state file holding its address and
+# a random auth key, kept in a directory only the user who started it can
+# enter. Replies are unpickled, so a state file planted by anyone else would
+# hand them code execution; such files are never read.
+IDLE_TIMEOUT = 15 * 60
+STARTUP_TIMEOUT = 30
+STATE_NAME = 'daemon.json'
+
+# Permission checks only mean something where files have POSIX owners
+_POSIX = hasattr(os, 'getuid')
+
+class DaemonError(RuntimeError):
+    pass
+
+def state_dir():
+    """
+    Returns the per-user directory holding the state file, creating it:
+    $XDG_RUNTIME_DIR when set, otherwise a 0700 folder under ~/.cache
+    (%LOCALAPPDATA% on Windows).
+    """
+    base = os.environ.get('XDG_RUNTIME_DIR')
+    if not base or not os.path.isdir(base):
+        base = os.environ.get('LOCALAPPDATA') if sys.platform == 'win32' else None
+        base = base or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, 'minute-roster-generator')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if _POSIX:
+        info = os.lstat(path)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+            raise DaemonError(f"{path} is not a directory owned by this user")
+        if stat.S_IMODE(info.st_mode) != 0o700:
+            os.chmod(path, 0o700)
+    return path
+
+def _state_path():
+    return os.path.join(state_dir(), STATE_NAME)
+
+def _write_state(address, authkey):
+    path = _state_path()
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.remove(tmp_path)  # Left behind by a crashed daemon that had the same pid
+    except FileNotFoundError:
+        pass
+    # A fresh user-only file, never one that already exists or a symlink
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_NOFOLLOW', 0), 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump({'address': list(address), 'authkey': authkey.hex(), 'pid': os.getpid()}, f)
+    os.replace(tmp_path, path)
+
+def _read_state():
+    try:
+        fd = os.open(_state_path(), os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    except (OSError, DaemonError):
+        return None
+    with os.fdopen(fd, encoding='utf-8') as f:
+        info = os.fstat(fd)
+        if _POSIX and (not stat.S_ISREG(info.st_mode) or info.st_uid != os.getuid()
+                       or stat.S_IMODE(info.st_mode) != 0o600):
+            return None
+        try:
+            state = json.load(f)
+            return tuple(state['address']), bytes.fromhex(state['authkey'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+def _remove_state(address):
+    # Only remove the state file if it still describes this daemon
+    state = _read_state()
+    if state and state[0] == tuple(address):
+        try:
+            os.remove(_state_path())
+        except OSError:
+            pass
+
+def _run_job(job):
+    from generator import read, write
+    from profiles import load_profile, apply_profile
+
+    # Relative paths (outputs, the crest images under data/) are the client's
+    os.chdir(job['cwd'])
+    apply_profile(load_profile(job.get('profile')))
+
+    kind, args, kwargs = job['kind'], job.get('args', ()), job.get('kwargs', {})
+    if kind == 'read':
+        return read(*args, **kwargs)
+    if kind == 'write':
+        return write(*args, **kwargs)
+    if kind == 'generate':
+        # read + write in one round trip, so the roster never crosses the socket
+        roster_file, = args
+        read_options = {k: kwargs.pop(k) for k in ('validate', 'archive_dir') if k in kwargs}
+        return write(*read(roster_file, **read_options), **kwargs)
+    raise ValueError(f"Unknown job kind: {kind}")
+
+def serve(idle_timeout=IDLE_TIMEOUT):
+    """
+    Runs the daemon until it has been idle for `idle_timeout` seconds or is
+    told to stop. Jobs are handled one at a time, in the order they connect.
+    """
+    # Paying the import cost up front is the point of the daemon
+    import generator
+
+    authkey = secrets.token_bytes(32)
+    with Listener(('127.0.0.1', 0), authkey=authkey) as listener:
+        _write_state(listener.address, authkey)
+        last_active = [time.monotonic()]
+        stopping = threading.Event()
+
+        def idle():
+            return time.monotonic() - last_active[0] >= idle_timeout
+
+        def watchdog():
+            while not stopping.wait(min(idle_timeout, 5)):
+                if idle():
+                    # Wake the accept() below with a shutdown request of our own
+                    try:
+                        with Client(listener.address, authkey=authkey) as conn:
+                            conn.send({'kind': 'shutdown', 'idle': True})
+                            conn.recv()
+                    except (OSError, EOFError):
+                        return
+
+        threading.Thread(target=watchdog, daemon=True).start()
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, AuthenticationError):
+                    continue
+                with conn:
+                    try:
+                        job = conn.recv()
+                    except (EOFError, OSError):
+                        continue
+                    if job.get('kind') == 'shutdown':
+                        # An idle shutdown queued behind a job that just ran is stale
+                        if job.get('idle') and not idle():
+                            conn.send(('ok', False))
+                            continue
+                        conn.send(('ok', True))
+                        break
+                    if job.get('kind') == 'ping':
+                        conn.send(('ok', os.getpid()))
+                        continue
+                    last_active[0] = time.monotonic()
+                    try:
+                        result = ('ok', _run_job(job))
+                    except Exception as e:
+                        # Exceptions don't all survive pickling; the message is what clients show
+                        result = ('error', str(e))
+                    last_active[0] = time.monotonic()
+                    try:
+                        conn.send(result)
+                    except OSError:
+                        pass
+        finally:
+            stopping.set()
+            _remove_state(listener.address)
+
+def _connect():
+    state = _read_state()
+    if state is None:
+        return None
+    address, authkey = state
+    try:
+        return Client(address, authkey=authkey)
+    except (OSError, AuthenticationError, EOFError):
+        return None
+
+def start_daemon(idle_timeout=IDLE_TIMEOUT):
+    """
+    Starts a detached daemon process and waits until it accepts connections.
+    """
+    if getattr(sys, 'frozen', False):
+        # The bundled executable has no daemon.py to run; main.py hands 'serve' on to main below
+        command = [sys.executable, 'serve']
+        cwd = os.path.dirname(sys.executable)
+    else:
+        command = [sys.executable, os.path.abspath(__file__), 'serve']
+        cwd = os.path.dirname(os.path.abspath(__file__))
+    command += ['--idle-timeout', str(idle_timeout)]
+    options = {'stdin': subprocess.DEVNULL, 'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL, 'cwd': cwd}
+    if sys.platform == 'win32':
+        options['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        options['start_new_session'] = True
+    subprocess.Popen(command, **options)
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        conn = _connect()
+        if conn is not None:
+            return conn
+        time.sleep(0.1)
+    raise DaemonError("The generator daemon did not start")
+
+def submit(kind, *args, start=True, profile=None, **kwargs):
+    """
+    Runs a 'read', 'write' or 'generate' job in the daemon and returns its
+    result, starting the daemon first if none is running and `start` is set.
+    """
+    conn = _connect()
+    if conn is None:
+        if not start:
+            raise DaemonError("The generator daemon is not running")
+        conn = start_daemon()
+    with conn:
+        conn.send({'kind': kind, 'cwd': os.getcwd(), 'profile': profile, 'args': args, 'kwargs': kwargs})
+        try:
+            status, value = conn.recv()
+        except EOFError:
+            raise DaemonError("The generator daemon exited during the job")
+    if status == 'error':
+        raise DaemonError(value)
+    return value
+
+def stop():
+    """
+    Asks a running daemon to exit. Returns False if none was running.
+    """
+    conn = _connect()
+    if conn is None:
+        return False
+    with conn:
+        conn.send({'kind': 'shutdown'})
+        conn.recv()
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep a warm generator running in the background.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_cmd = commands.add_parser('serve', help="Run the daemon in the foreground")
+    serve_cmd.add_argument('--idle-timeout', type=float, default=IDLE_TIMEOUT, help="Seconds idle before exiting")
+
+    generate = commands.add_parser('generate', help="Generate outputs for a roster through the daemon")
+    generate.add_argument('roster')
+    generate.add_argument('output', help="Output folder (Minutes and Rosters are created inside)")
+    generate.add_argument('--outputs', nargs='+', default=None, help="Only these outputs")
+    generate.add_argument('--profile', default=None)
+    generate.add_argument('--deterministic', action='store_true')
+    generate.add_argument('--combined', action='store_true', help="Put all outlines into one document")
+    generate.add_argument('--append', action='store_true', help="Add the roster to the existing workbook as a dated sheet")
+    generate.add_argument('--patch', action='store_true', help="Update existing outlines in place, keeping typed notes")
+    generate.add_argument('--archive', default=None, metavar='DIR', help="Also add the roster to the roster history in DIR")
+
+    commands.add_parser('stop', help="Stop the running daemon")
+    commands.add_parser('status', help="Show whether a daemon is running")
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        serve(args.idle_timeout)
+    elif args.command == 'generate':
+        try:
+            submit(
+                'generate', os.path.abspath(args.roster), profile=args.profile and os.path.abspath(args.profile),
+                docx_output_dir=os.path.join(args.output, 'Minutes'),
+                xlsx_output_dir=os.path.join(args.output, 'Rosters'),
+                deterministic=args.deterministic, outputs=args.outputs, combined=args.combined,
+                append=args.append, patch=args.patch, archive_dir=args.archive and os.path.abspath(args.archive),
+            )
+        except DaemonError as e:
+            sys.exit(str(e))
+    elif args.command == 'stop':
+        print('stopped' if stop() else 'not running')
+    else:
+        conn = _connect()
+        if conn is None:
+            print('not running')
+        else:
+            with conn:
+                conn.send({'kind': 'ping'})
+                print(f'running (pid {conn.recv()[1]})')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+import os
+import sys
+import json
+import random
+import shutil
+import hashlib
+import zipfile
+import argparse
+
+import pandas as pd
+from lxml import etree
+from openpyxl import load_workbook
+
+import constants
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+def w(tag):
+    return f'{{{W}}}{tag}'
+
+# ---------------------------------------------------------------------------
+# Package canonicalization
+# ---------------------------------------------------------------------------
+
+def _relationships(zf, partname):
+    """
+    Maps rIds of a part to '<type>:<target>' so renumbered ids compare equal.
+    """
+    folder, name = os.path.split(partname)
+    rels_name = f'{folder}/_rels/{name}.rels' if folder else f'_rels/{name}.rels'
+    if rels_name not in zf.namelist():
+        return {}
+    root = etree.fromstring(zf.read(rels_name))
+    return {
+        rel.get('Id'): f"{rel.get('Type').rsplit('/', 1)[-1]}:{rel.get('Target')}"
+        for rel in root.iter(f'{{{PKG_REL}}}Relationship')
+    }
+
+def canonical_parts(path):
+    """
+    Returns {part name: canonical XML bytes} for every XML part of a package.
+    Zip order and timestamps disappear with the zip, attribute order is fixed
+    by C14N, relationship ids are replaced by their targets, rsid revision
+    marks are dropped and core-property dates are blanked.
+    """
+    parts = {}
+    with zipfile.ZipFile(path) as zf:
+        for name in sorted(zf.namelist()):
+            if not name.endswith(('.xml', '.rels')):
+                parts[name] = zf.read(name)
+                continue
+            root = etree.fromstring(zf.read(name))
+            rels = _relationships(zf, name)
+            for el in root.iter():
+                for attr in list(el.attrib):
+                    if attr.startswith(f'{{{W}}}rsid'):
+                        del el.attrib[attr]
+                    elif attr.startswith(f'{{{R}}}') and el.attrib[attr] in rels:
+                        el.attrib[attr] = rels[el.attrib[attr]]
+            if name.endswith('.rels'):
+                # Ids are arbitrary labels; order relationships by what they point at
+                for rel in root:
+                    rel.attrib.pop('Id', None)
+                root[:] = sorted(root, key=lambda rel: (rel.get('Type'), rel.get('Target')))
+            if name == 'docProps/core.xml':
+                for el in root:
+                    if etree.QName(el).localname in ('created', 'modified', 'lastPrinted'):
+                        el.text = None
+            parts[name] = etree.tostring(root, method='c14n')
+    return parts
+
+# ---------------------------------------------------------------------------
+# Semantic summaries
+# ---------------------------------------------------------------------------
+
+class _Styles:
+    """
+    Resolves effective run and paragraph properties through the style basedOn
+    chain, so direct formatting and equivalent style formatting compare equal.
+    """
+    def __init__(self, styles_xml):
+        root = etree.fromstring(styles_xml)
+        self.styles = {s.get(w('styleId')): s for s in root.iter(w('style'))}
+        self.default_rpr = root.find(f'{w("docDefaults")}/{w("rPrDefault")}/{w("rPr")}')
+        self.default_paragraph = next(
+            (sid for sid, s in self.styles.items() if s.get(w('type')) == 'paragraph' and s.get(w('default')) == '1'),
+            None,
+        )
+
+    def chain(self, style_id):
+        seen = set()
+        while style_id and style_id in self.styles and style_id not in seen:
+            seen.add(style_id)
+            style = self.styles[style_id]
+            yield style
+            based_on = style.find(w('basedOn'))
+            style_id = based_on.get(w('val')) if based_on is not None else None
+
+    def name(self, style_id):
+        style = self.styles.get(style_id)
+        name = style.find(w('name')) if style is not None else None
+        return name.get(w('val')) if name is not None else style_id
+
+def _rpr_value(rpr, prop):
+    if rpr is None:
+        return None
+    if prop == 'font':
+        fonts = rpr.find(w('rFonts'))
+        return fonts.get(w('ascii')) if fonts is not None else None
+    el = rpr.find(w(prop))
+    if el is None:
+        return None
+    if prop == 'b':
+        return el.get(w('val'), 'true') not in ('0', 'false')
+    return el.get(w('val'))
+
+def _ppr_value(ppr, prop):
+    if ppr is None:
+        return None
+    if prop == 'ind':
+        ind = ppr.find(w('ind'))
+        return ind.get(w('left')) or ind.get(w('start')) if ind is not None else None
+    if prop == 'numbered':
+        return True if ppr.find(w('numPr')) is not None else None
+    el = ppr.find(w(prop))
+    return el.get(w('val')) if el is not None else None
+
+def _run_props(styles, run, paragraph_style):
+    rpr = run.find(w('rPr'))
+    rstyle = rpr.find(w('rStyle')) if rpr is not None else None
+    sources = [rpr]
+    if rstyle is not None:
+        sources += [s.find(w('rPr')) for s in styles.chain(rstyle.get(w('val')))]
+    sources += [s.find(w('rPr')) for s in styles.chain(paragraph_style)]
+    sources.append(styles.default_rpr)
+
+    def first(prop):
+        return next((v for v in (_rpr_value(r, prop) for r in sources) if v is not None), None)
+
+    return first('font'), first('sz'), bool(first('b'))
+
+def _paragraph(styles, p):
+    ppr = p.find(w('pPr'))
+    pstyle = ppr.find(w('pStyle')) if ppr is not None else None
+    style_id = pstyle.get(w('val')) if pstyle is not None else styles.default_paragraph
+    chain = [ppr] + [s.find(w('pPr')) for s in styles.chain(style_id)]
+
+    def first(prop):
+        return next((v for v in (_ppr_value(x, prop) for x in chain) if v is not None), None)
+
+    runs = []
+    for r in p.iter(w('r')):
+        text = ''.join(
+            t.text or '' if t.tag == w('t') else '\t' if t.tag == w('tab') else '\n'
+            for t in r if t.tag in (w('t'), w('tab'), w('br'), w('cr'))
+        )
+        if r.find(f'.//{w("drawing")}') is not None:
+            text += '[drawing]'
+        if not text:
+            continue
+        props = _run_props(styles, r, style_id)
+        # Adjacent runs with identical formatting are one run semantically
+        if runs and runs[-1][1:] == props:
+            runs[-1] = (runs[-1][0] + text,) + props
+        else:
+            runs.append((text,) + props)
+
+    borders = ppr.find(w('pBdr')) if ppr is not None else None
+    return {
+        'text': ''.join(r[0] for r in runs),
+        'runs': runs,
+        'align': first('jc'),
+        'indent': first('ind'),
+        'numbered': bool(first('numbered')),
+        'borders': sorted(etree.QName(b).localname for b in borders) if borders is not None else [],
+        'page_break': any(br.get(w('type')) == 'page' for br in p.iter(w('br'))),
+    }
+
+def _cell(styles, tc):
+    tcpr = tc.find(w('tcPr'))
+
+    def val(tag, default=None):
+        el = tcpr.find(w(tag)) if tcpr is not None else None
+        return el.get(w('val'), default) if el is not None else default
+
+    shd = tcpr.find(w('shd')) if tcpr is not None else None
+    paragraphs = [_paragraph(styles, p) for p in tc.iter(w('p'))]
+    return {
+        'text': '\n'.join(p['text'] for p in paragraphs),
+        'span': int(val('gridSpan', 1)),
+        'vmerge': val('vMerge'),
+        'fill': shd.get(w('fill')) if shd is not None else None,
+        'align': [p['align'] for p in paragraphs],
+    }
+
+def docx_summary(path):
+    """
+    Reduces a .docx to what a reader sees: body paragraphs with effective run
+    formatting, tables with cell text, merges and shading, and header text.
+    """
+    with zipfile.ZipFile(path) as zf:
+        styles = _Styles(zf.read('word/styles.xml'))
+        body = etree.fromstring(zf.read('word/document.xml')).find(w('body'))
+        headers = {
+            name: [_paragraph(styles, p)['text'] for p in etree.fromstring(zf.read(name)).iter(w('p'))]
+            for name in sorted(zf.namelist()) if name.startswith('word/header')
+        }
+        images = sorted(hashlib.sha1(zf.read(name)).hexdigest() for name in zf.namelist() if name.startswith('word/media/'))
+
+    blocks = []
+    for el in body:
+        if el.tag == w('p'):
+            blocks.append(('p', _paragraph(styles, el)))
+        elif el.tag == w('tbl'):
+            rows = [[_cell(styles, tc) for tc in tr.iter(w('tc'))] for tr in el.iter(w('tr'))]
+            blocks.append(('tbl', rows))
+
+    return {'blocks': blocks, 'headers': sorted(headers.values()), 'images': images}
+
+def xlsx_summary(path, widths=True):
+    """
+    Reduces an .xlsx to cell values, fonts, alignment, fills, merged ranges and column widths.
+    """
+    wb = load_workbook(path)
+    summary = {}
+    for ws in wb.worksheets:
+        cells = {}
+        for row in ws.iter_rows():
+            for c in row:
+                fill = c.fill.fgColor.rgb if c.fill is not None and c.fill.fill_type else None
+                if c.value is None and not c.font.b and not c.alignment.horizontal and not fill:
+                    continue
+                cells[c.coordinate] = (c.value, bool(c.font.b), c.alignment.horizontal, fill)
+        summary[ws.title] = {
+            'cells': cells,
+            'merges': sorted(str(r) for r in ws.merged_cells.ranges),
+            'widths': {k: d.width for k, d in sorted(ws.column_dimensions.items())} if widths else None,
+        }
+    return summary
+
+def summarize(path, widths=True):
+    if path.endswith('.docx'):
+        return docx_summary(path)
+    if path.endswith('.xlsx'):
+        return xlsx_summary(path, widths)
+    raise ValueError(f"Unsupported file type: {path}")
+
+def _diff(a, b, where, out, limit):
+    if len(out) >= limit:
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key in sorted(set(a) | set(b), key=str):
+            if key not in a or key not in b:
+                out.append(f'{where}/{key}: only in {"second" if key not in a else "first"}')
+            else:
+                _diff(a[key], b[key], f'{where}/{key}', out, limit)
+    elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        if len(a) != len(b):
+            out.append(f'{where}: length {len(a)} != {len(b)}')
+        for i, (x, y) in enumerate(zip(a, b)):
+            _diff(x, y, f'{where}[{i}]', out, limit)
+    elif a != b:
+        out.append(f'{where}: {a!r} != {b!r}')
+
+def compare_packages(first, second):
+    """
+    Returns the names of parts whose canonical form differs between two packages.
+    Stricter than compare_files: any markup change counts, not just visible ones.
+    """
+    a, b = canonical_parts(first), canonical_parts(second)
+    return sorted(name for name in set(a) | set(b) if a.get(name) != b.get(name))
+
+def compare_files(first, second, limit=20, **options):
+    """
+    Semantically compares two generated files. Returns a list of differences, empty if equivalent.
+    """
+    differences = []
+    _diff(summarize(first, **options), summarize(second, **options), os.path.basename(first), differences, limit)
+    return differences[:limit]
+
+def compare_dirs(first, second, limit=20, **options):
+    """
+    Compares every .docx/.xlsx under two output trees. Returns {relative path: differences}.
+    """
+    def files(root):
+        return {
+            os.path.relpath(os.path.join(d, f), root)
+            for d, _, names in os.walk(root) for f in names if f.endswith(('.docx', '.xlsx'))
+        }
+
+    a, b = files(first), files(second)
+    result = {name: ['missing'] for name in a ^ b}
+    for name in sorted(a & b):
+        differences = compare_files(os.path.join(first, name), os.path.join(second, name), limit, **options)
+        if differences:
+            result[name] = differences
+    return result
+
+# ---------------------------------------------------------------------------
+# Synthetic rosters and golden outputs
+# ---------------------------------------------------------------------------
+
+def synthetic_roster(seed=0, brothers=40, double_offices=1, vacant=()):
+    """
+    Builds a reproducible roster DataFrame: one holder per office (minus
+    `vacant`), `double_offices` members holding two offices, `brothers`
+    members without office and one of each advisor.
+    """
+    rng = random.Random(seed)
+    rows = []
+    holders = [o for o in constants.officers if o not in vacant]
+    for i, office in enumerate(holders):
+        rows.append({'Last Name': f'Officer{i:02d}', 'First Name': f'Name{rng.randrange(1000)}',
+                     'Current Office': office, 'Status': 'Active'})
+    for i in range(min(double_offices, len(rows) // 2)):
+        rows[i]['Current Office'] += '/' + rows.pop()['Current Office']
+    for i in range(brothers):
+        rows.append({'Last Name': f'Brother{rng.randrange(10 ** 6):06d}', 'First Name': f'Name{i}',
+                     'Current Office': None, 'Status': 'Active'})
+    for i, advisor in enumerate(constants.advisors):
+        rows.append({'Last Name': f'Advisor{i}', 'First Name': f'Name{rng.randrange(1000)}',
+                     'Current Office': advisor, 'Status': 'Alumni'})
+    return pd.DataFrame(rows)
+
+# Outputs of the original generator for GOLDEN_ROSTERS, checked in so every
+# later version is compared with the baseline rather than with itself, and
+# the placeholder crest images they were rendered with
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'golden')
+GOLDEN_IMAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'data')
+
+# Fixed inputs the golden outputs are rendered from
+GOLDEN_ROSTERS = {
+    'small': dict(seed=1, brothers=3, double_offices=0),
+    'typical': dict(seed=2, brothers=40, double_offices=1),
+    'large': dict(seed=3, brothers=400, double_offices=3),
+    'vacancies': dict(seed=4, brothers=10, double_offices=0, vacant=('Lambda', 'Epsilon', 'Gamma')),
+}
+
+def render(roster_kwargs, output_dir):
+    from generator import split_roster, write
+
+    active_df, advisor_df = split_roster(synthetic_roster(**roster_kwargs))
+    write(active_df, advisor_df,
+          docx_output_dir=os.path.join(output_dir, 'Minutes'),
+          xlsx_output_dir=os.path.join(output_dir, 'Rosters'))
+
+def render_golden(golden_dir):
+    """
+    Renders every GOLDEN_ROSTERS case into `golden_dir`/<case> with the
+    current code. Only for re-baselining after a deliberate output change;
+    the crests under data/ must be the GOLDEN_IMAGES.
+    """
+    for name, kwargs in GOLDEN_ROSTERS.items():
+        render(kwargs, os.path.join(golden_dir, name))
+
+def check_golden(work_dir, golden_dir=GOLDEN_DIR, **options):
+    """
+    Renders every case into `work_dir`, with the crests the goldens were
+    rendered with, and compares it with the golden outputs.
+    Returns {case: {file: differences}} for the cases that differ.
+    """
+    golden_dir = os.path.abspath(golden_dir)
+    shutil.copytree(GOLDEN_IMAGES, os.path.join(work_dir, 'data'), dirs_exist_ok=True)
+
+    failures = {}
+    cwd = os.getcwd()
+    os.chdir(work_dir)  # The outlines load their crests from data/
+    try:
+        for name, kwargs in GOLDEN_ROSTERS.items():
+            render(kwargs, name)
+            differences = compare_dirs(os.path.join(golden_dir, name), name, **options)
+            if differences:
+                failures[name] = differences
+    finally:
+        os.chdir(cwd)
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check generated documents against golden outputs.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    golden = commands.add_parser('golden', help="Re-render the golden outputs with the current code")
+    golden.add_argument('golden_dir', nargs='?', default=GOLDEN_DIR)
+    check = commands.add_parser('check', help="Render into WORK_DIR and compare with the golden outputs")
+    check.add_argument('work_dir')
+    check.add_argument('--golden', default=GOLDEN_DIR, help="Golden outputs (default: the checked-in baseline)")
+    check.add_argument('--ignore-widths', action='store_true', help="Do not compare roster column widths")
+    diff = commands.add_parser('diff', help="Compare two files or output directories")
+    diff.add_argument('first')
+    diff.add_argument('second')
+    diff.add_argument('--ignore-widths', action='store_true', help="Do not compare roster column widths")
+    args = parser.parse_args()
+
+    if args.command == 'golden':
+        render_golden(args.golden_dir)
+    elif args.command == 'check':
+        failures = check_golden(args.work_dir, args.golden, widths=not args.ignore_widths)
+        print(json.dumps(failures, indent=2) if failures else 'All outputs match.')
+        sys.exit(1 if failures else 0)
+    else:
+        if os.path.isdir(args.first):
+            differences = compare_dirs(args.first, args.second, widths=not args.ignore_widths)
+        else:
+            differences = compare_files(args.first, args.second, widths=not args.ignore_widths)
+        print(json.dumps(differences, indent=2) if differences else 'Equivalent.')
+        sys.exit(1 if differences else 0)
@@ -0,0 +1,77 @@
+import os
+import csv
+import html
+import argparse
+
+from roster import build_roster_tables
+
+# Tables consumers actually check people in against; the blank fill-in
+# templates (NEW MEMBERS, OTHERS) only make sense on paper.
+EXPORT_TABLES = [
+    'EXECUTIVE COUNCIL COMMITTEE', 'EVENTS COMMITTEE', 'FINANCE COMMITTEE',
+    'INTERNAL OPERATIONS COMMITTEE', 'BYLAWS COMMITTEE', 'OFFICERS', 'BROTHERS', 'ADVISORS'
+]
+
+def table_filename(title, extension):
+    """
+    Turns a table title such as 'EVENTS COMMITTEE' into 'events_committee.csv'.
+    """
+    return f"{title.lower().replace(' ', '_')}.{extension}"
+
+def write_csv(table, path):
+    """
+    Streams a table to CSV row by row, header first.
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(table.columns)
+        writer.writerows(table.rows)
+
+def write_html(tables, path, title='Officer Roster and Minutes Rosters'):
+    """
+    Writes all tables into a single static HTML page, one section per table.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n')
+        f.write(f'<title>{html.escape(title)}</title>\n')
+        f.write(
+            '<style>\n'
+            'body { font-family: Calibri, sans-serif; }\n'
+            'table { border-collapse: collapse; margin-bottom: 1.5em; }\n'
+            'th { background: #000; color: #fff; }\n'
+            'th, td { border: 1px solid #000; padding: 2px 8px; }\n'
+            'tbody tr:nth-child(odd) { background: #ccc; }\n'
+            '</style>\n</head>\n<body>\n'
+        )
+        f.write(f'<h1>{html.escape(title)}</h1>\n')
+        for name, table in tables.items():
+            f.write(f'<section>\n<h2>{html.escape(name)}</h2>\n<table>\n<thead><tr>')
+            f.write(''.join(f'<th>{html.escape(str(c))}</th>' for c in table.columns))
+            f.write('</tr></thead>\n<tbody>\n')
+            for values in table.rows:
+                f.write('<tr>' + ''.join(f'<td>{html.escape("" if v is None else str(v))}</td>' for v in values) + '</tr>\n')
+            f.write('</tbody>\n</table>\n</section>\n')
+        f.write('</body>\n</html>\n')
+
+def export_rosters(active, staff, output_dir='Exports'):
+    """
+    Renders the roster committee tables to one CSV per table plus a single
+    HTML page, without building the Excel workbook or any Word outline.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    all_tables = build_roster_tables(active, staff)
+    tables = {name: all_tables[name] for name in EXPORT_TABLES}
+
+    for name, table in tables.items():
+        write_csv(table, os.path.join(output_dir, table_filename(name, 'csv')))
+    write_html(tables, os.path.join(output_dir, 'rosters.html'))
+
+if __name__ == "__main__":
+    from generator import read_members, print_warnings
+
+    parser = argparse.ArgumentParser(description="Export the roster tables as CSV files and one HTML page.")
+    parser.add_argument('roster')
+    parser.add_argument('--output', default='Exports', help="Folder the CSV and HTML files are written to")
+    args = parser.parse_args()
+
+    export_rosters(*print_warnings(read_members(args.roster)), output_dir=args.output)
@@ -0,0 +1,167 @@
+import os
+import sys
+from datetime import date
+
+import constants
+from minutes import *
+from roster import create_roster, append_roster, DerivedTables, ROSTER_FILENAME
+from ooxml import make_deterministic
+from readers import read_roster, read_roster_columns, ROSTER_EXTENSIONS
+from members import members_from_columns, split_members, as_members
+from validation import check_roster, check_members, validate_roster, ValidationReport, RosterValidationError
+
+class Rosters(tuple):
+    """
+    (active members, chapter advisors) as read, unpacking like a pair, with
+    the roster's ValidationReport, warnings included, as `report` (None if
+    it wasn't validated).
+    """
+    def __new__(cls, active, staff, report=None):
+        rosters = super().__new__(cls, (active, staff))
+        rosters.report = report
+        return rosters
+
+    def __getnewargs__(self):
+        return (*self, self.report)
+
+def print_warnings(rosters, file=None):
+    """
+    Prints the warnings found while reading `rosters` (see Rosters) to
+    stderr, for the command-line tools, and returns `rosters`.
+    """
+    warnings = rosters.report.warnings if rosters.report else []
+    if warnings:
+        print(ValidationReport(warnings), file=file or sys.stderr)
+    return rosters
+
+def read(roster_file, validate=True, archive_dir=None):
+    # The DataFrame path, for patching and archiving; generating only
+    # needs read_members, which works without pandas
+    from names import clean_names
+
+    # Stray whitespace would otherwise end up in every generated name
+    df = clean_names(read_roster(roster_file))
+    # Fail fast on a bad roster instead of deep inside a generator
+    report = check_roster(df) if validate else None
+    if archive_dir:
+        # pyarrow is only needed when keeping a roster history
+        from archive import archive_roster
+        archive_roster(df, archive_dir, source=os.path.basename(roster_file))
+    return Rosters(*split_roster(df), report)
+
+def archive(roster_file, archive_dir):
+    """
+    Adds the whole roster, every status included, to the roster history in
+    `archive_dir` (see archive.py) as a snapshot taken now. Needs pandas
+    and pyarrow.
+    """
+    from names import clean_names
+    from archive import archive_roster
+
+    return archive_roster(clean_names(read_roster(roster_file)), archive_dir, source=os.path.basename(roster_file))
+
+def read_members(roster_file, validate=True, assignments=None, as_of=None):
+    """
+    Reads a roster into (active members, chapter advisors) as Member records,
+    without pandas, as Rosters carrying the validation report. Validation
+    is the same as read's. With `assignments`, a CSV of effective-dated office
+    assignments (see assignments.py), offices are those held on `as_of`
+    (default today) rather than the roster's Current Office.
+    """
+    columns = read_roster_columns(roster_file)
+    members = members_from_columns(columns)
+    if assignments:
+        from assignments import OfficeIndex, read_assignments, roster_as_of
+        members = roster_as_of(members, OfficeIndex(read_assignments(assignments)), as_of or date.today())
+    report = check_members(members, list(columns)) if validate else None
+    return Rosters(*split_members(members), report)
+
+def split_roster(df):
+    """
+    Splits a full roster into the active members and the chapter advisors.
+    """
+    active_df = df[df['Status'] == 'Active'][['Last Name', 'First Name', 'Current Office']]
+    advisor_df = df[df['Current Office'].isin(constants.advisors)][['Last Name', 'First Name', 'Current Office']]
+
+    return active_df, advisor_df
+
+# Outline name -> (generator, builder, roster content (see minutes.RosterContent),
+# whether they also take the advisors and the shared derived tables)
+OUTLINES = {
+    'bylaws': (create_bylaws_minutes, build_bylaws_minutes, bylaws_roster_content, False),
+    'chapter': (create_chapter_minutes, build_chapter_minutes, chapter_roster_content, True),
+    'events': (create_events_minutes, build_events_minutes, events_roster_content, False),
+    'exec': (create_exec_minutes, build_exec_minutes, exec_roster_content, False),
+    'finance': (create_finance_minutes, build_finance_minutes, finance_roster_content, False),
+    'house': (create_house_minutes, build_house_minutes, house_roster_content, True),
+    'ioc': (create_IOC_minutes, build_IOC_minutes, IOC_roster_content, False),
+}
+# Section order of the combined outline document
+COMBINED_ORDER = ['chapter', 'house', 'exec', 'events', 'finance', 'ioc', 'bylaws']
+OUTPUTS = ['roster'] + list(OUTLINES)
+
+def write(active, staff, docx_output_dir='Minutes', xlsx_output_dir='Rosters', deterministic=False, outputs=None, combined=False, derived=None, append=False, patch=False):
+    """
+    Generates the requested outputs (see OUTPUTS; all of them by default)
+    from the rosters returned by read_members or read.
+    Derived tables are computed lazily and shared, so only the ones the
+    requested outputs use are ever built. With `combined`, the outlines go
+    into a single document, one section each, instead of one file apiece.
+    `derived` passes in DerivedTables already built for these rosters.
+    With `append`, the roster is added to the existing roster workbook as a
+    sheet named for today's date instead of replacing it. With `patch`,
+    outlines and a roster workbook that already exist are updated in place
+    (see patch.py), keeping notes and roll marks already typed into them;
+    a combined outline is always written afresh.
+    """
+    outputs = OUTPUTS if outputs is None else list(outputs)
+    unknown = [name for name in outputs if name not in OUTPUTS]
+    if unknown:
+        raise ValueError(f"Unknown output(s): {', '.join(unknown)}")
+
+    # Converted once here, so every output works on the same records
+    active, staff = as_members(active), as_members(staff)
+    derived = derived or DerivedTables(active, staff)
+    written = []
+
+    if 'roster' in outputs:
+        os.makedirs(xlsx_output_dir, exist_ok=True)
+        if append:
+            append_roster(xlsx_output_dir, active, staff, derived)
+        elif patch:
+            from patch import patch_roster
+            patch_roster(xlsx_output_dir, active, staff, derived)
+        else:
+            create_roster(xlsx_output_dir, active, staff, derived)
+        written.append(os.path.join(xlsx_output_dir, ROSTER_FILENAME))
+
+    outlines = [name for name in OUTLINES if name in outputs]
+    if outlines:
+        os.makedirs(docx_output_dir, exist_ok=True)
+    if combined and outlines:
+        builders = []
+        for name in sorted(outlines, key=COMBINED_ORDER.index):
+            _, build, _, uses_advisors = OUTLINES[name]
+            args = (active, staff, derived) if uses_advisors else (active,)
+            builders.append((build, args))
+        written.append(create_combined_minutes(docx_output_dir, builders))
+        outlines = []
+    if patch and outlines:
+        # patch.py builds on OUTLINES, so it is only imported once they exist
+        from patch import OUTLINE_FILES, patch_outline
+        existing = [name for name in outlines if os.path.isfile(os.path.join(docx_output_dir, OUTLINE_FILES[name]))]
+        for name in existing:
+            patch_outline(docx_output_dir, name, active, staff, derived)
+            written.append(os.path.join(docx_output_dir, OUTLINE_FILES[name]))
+        outlines = [name for name in outlines if name not in existing]
+    for name in outlines:
+        create, _, _, uses_advisors = OUTLINES[name]
+        if uses_advisors:
+            written.append(create(docx_output_dir, active, staff, derived))
+        else:
+            written.append(create(docx_output_dir, active))
+
+    if deterministic:
+        # Byte-identical output for identical input, plus a manifest of hashes;
+        # only the files written here are touched
+        make_deterministic(written)
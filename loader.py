@@ -0,0 +1,90 @@
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+
+from generator import read_members
+from roster import DerivedTables, build_roster_tables
+
+# Everything a run needs from a roster before it writes anything, and the
+# validation report, whose warnings are shown once it is picked
+LoadedRoster = namedtuple('LoadedRoster', ['active', 'staff', 'derived', 'tables', 'report'])
+
+class LoadCancelled(CancelledError):
+    pass
+
+def _file_key(path):
+    # A finished load is only reused while the file is unchanged
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+def load_roster(path, cancelled=None):
+    """
+    Reads and validates a roster and builds the derived tables every output
+    shares, plus the roster tables the preview shows. `cancelled`, a
+    threading.Event, is checked between steps.
+    """
+    def check():
+        if cancelled is not None and cancelled.is_set():
+            raise LoadCancelled(path)
+
+    rosters = read_members(path)
+    active, staff = rosters
+    check()
+    derived = DerivedTables(active, staff)
+    tables = build_roster_tables(active, staff, derived)
+    check()
+    derived.sorted_brothers  # The chapter and house outlines list these
+    return LoadedRoster(active, staff, derived, tables, rosters.report)
+
+class RosterLoader:
+    """
+    Loads rosters speculatively on a background thread as soon as one is
+    picked, so that generating only has to write. Picking another file
+    cancels the load that is queued or running (at its next step), and a
+    finished load is reused for as long as its file is unchanged.
+    """
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='roster-loader')
+        self._lock = threading.Lock()
+        self._key = None
+        self._future = None
+        self._cancelled = None
+
+    def request(self, path):
+        """
+        Starts loading `path` unless that file, unchanged, is already loading
+        or loaded. Returns the Future of its LoadedRoster.
+        """
+        key = _file_key(path)
+        with self._lock:
+            future = self._future
+            # A failed load is retried, in case the file was only briefly unreadable
+            if key == self._key and not future.cancelled() and not (future.done() and future.exception()):
+                return future
+            self._cancel()
+            self._key, self._cancelled = key, threading.Event()
+            self._future = self._executor.submit(load_roster, key[0], self._cancelled)
+            return self._future
+
+    def result(self, path, timeout=None):
+        """
+        Returns the LoadedRoster for `path`, waiting for the speculative load
+        if one is under way and loading it now otherwise.
+        """
+        return self.request(path).result(timeout)
+
+    def _cancel(self):
+        if self._future is not None:
+            self._cancelled.set()
+            self._future.cancel()
+        self._key = self._future = self._cancelled = None
+
+    def cancel(self):
+        with self._lock:
+            self._cancel()
+
+    def close(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,46 +1,69 @@
 import sys
 import os
+import subprocess
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QPushButton,
-    QLabel, QFileDialog, QLineEdit, QMessageBox
+    QApplication, QWidget, QVBoxLayout, QGridLayout, QPushButton,
+    QLabel, QFileDialog, QLineEdit, QMessageBox, QGroupBox, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 
-from constants import *
-from minutes import *
-from roster import create_roster
+from generator import *
+from preview import RosterPreview
+from loader import RosterLoader, LoadCancelled
+import daemon
 
 class ExcelDropLineEdit(QLineEdit):
     def __init__(self):
         super().__init__()
         self.setAcceptDrops(True)
-        self.setPlaceholderText("Drag & drop an Excel file here or click to browse...")
+        self.setPlaceholderText("Drag & drop a roster file (.xlsx, .csv, .parquet) here or click to browse...")
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             path = event.mimeData().urls()[0].toLocalFile()
-            if path.endswith('.xlsx'):
+            if path.endswith(ROSTER_EXTENSIONS):
                 event.acceptProposedAction()
 
     def dropEvent(self, event):
         path = event.mimeData().urls()[0].toLocalFile()
-        if os.path.isfile(path) and path.endswith('.xlsx'):
+        if os.path.isfile(path) and path.endswith(ROSTER_EXTENSIONS):
             self.setText(path)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            file, _ = QFileDialog.getOpenFileName(self, "Select Excel File", "", "Excel Files (*.xlsx)")
+            file, _ = QFileDialog.getOpenFileName(self, "Select Roster File", "", "Roster Files (*.xlsx *.csv *.parquet)")
             if file:
                 self.setText(file)
 
+OUTPUT_LABELS = {
+    'roster': 'Roster Workbook',
+    'chapter': 'Chapter Meeting',
+    'house': 'House Meeting',
+    'exec': 'Executive Council',
+    'events': 'Events Committee',
+    'finance': 'Finance Committee',
+    'ioc': 'Internal Operations Committee',
+    'bylaws': 'Bylaws Committee',
+}
+
+# How long typing in the roster field must pause before the file is looked at
+PREVIEW_DELAY_MS = 300
+
 class MinutesGeneratorApp(QWidget):
+    # (path, Future) from the loader thread; delivered on the GUI thread
+    roster_loaded = pyqtSignal(str, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Meeting Minutes Generator")
         self.setMinimumWidth(500)
 
+        # Parses a roster in the background as soon as it is picked
+        self.loader = RosterLoader()
+        self.roster_loaded.connect(self.show_loaded_roster)
+
         self.layout = QVBoxLayout()
-        self.label_file = QLabel("Select an Excel Roster File:")
+        self.label_file = QLabel("Select a Roster File:")
         self.excel_input = ExcelDropLineEdit()
 
         self.label_folder = QLabel("Select an Output Folder:")
@@ -49,17 +72,50 @@ class MinutesGeneratorApp(QWidget):
         self.output_folder_input.setReadOnly(True)
         self.output_folder_input.mousePressEvent = self.select_output_folder
 
+        self.outputs_box = QGroupBox("Documents to Generate")
+        outputs_layout = QGridLayout()
+        self.output_checks = {}
+        for i, (name, label) in enumerate(OUTPUT_LABELS.items()):
+            check = QCheckBox(label)
+            check.setChecked(True)
+            self.output_checks[name] = check
+            outputs_layout.addWidget(check, i // 2, i % 2)
+        self.combined_check = QCheckBox("Combine the outlines into one document")
+        outputs_layout.addWidget(self.combined_check, (len(OUTPUT_LABELS) + 1) // 2, 0, 1, 2)
+        self.append_check = QCheckBox("Add the roster to the existing workbook as a dated sheet")
+        outputs_layout.addWidget(self.append_check, (len(OUTPUT_LABELS) + 1) // 2 + 1, 0, 1, 2)
+        self.patch_check = QCheckBox("Update existing outlines in place, keeping notes already typed in")
+        outputs_layout.addWidget(self.patch_check, (len(OUTPUT_LABELS) + 1) // 2 + 2, 0, 1, 2)
+        self.archive_check = QCheckBox("Keep a dated copy of the roster in the Roster History folder")
+        outputs_layout.addWidget(self.archive_check, (len(OUTPUT_LABELS) + 1) // 2 + 3, 0, 1, 2)
+        self.outputs_box.setLayout(outputs_layout)
+
+        self.daemon_check = QCheckBox("Keep the generator running in the background (faster repeat runs)")
+
         self.run_button = QPushButton("Generate Documents")
         self.status_label = QLabel("")
 
+        self.label_preview = QLabel("Preview:")
+        self.preview = RosterPreview()
+
         self.run_button.clicked.connect(self.run_generator)
+        # textChanged fires on every keystroke; only the pause after the last one loads
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.update_preview)
+        self.excel_input.textChanged.connect(lambda _: self.preview_timer.start())
 
         self.layout.addWidget(self.label_file)
         self.layout.addWidget(self.excel_input)
         self.layout.addWidget(self.label_folder)
         self.layout.addWidget(self.output_folder_input)
+        self.layout.addWidget(self.outputs_box)
+        self.layout.addWidget(self.daemon_check)
         self.layout.addWidget(self.run_button)
         self.layout.addWidget(self.status_label)
+        self.layout.addWidget(self.label_preview)
+        self.layout.addWidget(self.preview)
         self.setLayout(self.layout)
 
     def select_output_folder(self, event):
@@ -68,24 +124,77 @@ class MinutesGeneratorApp(QWidget):
             if folder:
                 self.output_folder_input.setText(folder)
 
+    def clear_preview(self, status=""):
+        self.loader.cancel()
+        self.preview.clear_tables()
+        self.status_label.setText(status)
+
+    def update_preview(self):
+        excel_file = self.excel_input.text().strip()
+        if not excel_file.endswith(ROSTER_EXTENSIONS):
+            self.clear_preview()
+            return
+        try:
+            future = self.loader.request(excel_file)
+        except OSError:
+            # A path still being typed, or a file moved away since it was picked
+            self.clear_preview("File not found.")
+            return
+
+        self.status_label.setText("Reading roster...")
+        future.add_done_callback(lambda f: self.roster_loaded.emit(excel_file, f))
+
+    def show_loaded_roster(self, excel_file, future):
+        # Results for a file that is no longer selected are dropped
+        if future.cancelled() or excel_file != self.excel_input.text().strip():
+            return
+        try:
+            loaded = future.result()
+            self.preview.show_tables(loaded.tables)
+            # Warnings don't stop generating, but are worth a look first
+            warnings = loaded.report.warnings if loaded.report else []
+            self.status_label.setText(str(ValidationReport(warnings)) if warnings else "")
+        except LoadCancelled:
+            return
+        except Exception as e:
+            self.preview.clear_tables()
+            self.status_label.setText(str(e))
+
     def run_generator(self):
         excel_file = self.excel_input.text().strip()
         base_output_dir = self.output_folder_input.text().strip()
 
-        if not os.path.isfile(excel_file) or not excel_file.endswith('.xlsx'):
-            QMessageBox.critical(self, "Invalid File", "Please select a valid Excel (.xlsx) file.")
+        if not os.path.isfile(excel_file) or not excel_file.endswith(ROSTER_EXTENSIONS):
+            QMessageBox.critical(self, "Invalid File", "Please select a valid roster (.xlsx, .csv or .parquet) file.")
             return
 
         if not base_output_dir or not os.path.isdir(base_output_dir):
             QMessageBox.critical(self, "Invalid Folder", "Please select a valid output folder.")
             return
 
-        try:
-            active_df, advisor_df = read(excel_file)
+        outputs = [name for name, check in self.output_checks.items() if check.isChecked()]
+        combined = self.combined_check.isChecked()
+        append = self.append_check.isChecked()
+        patch = self.patch_check.isChecked()
+        archive_dir = self.archive_check.isChecked() and os.path.abspath(os.path.join(base_output_dir, 'Roster History'))
+        if not outputs:
+            QMessageBox.critical(self, "Nothing Selected", "Please select at least one document to generate.")
+            return
 
+        try:
             docx_output = os.path.join(base_output_dir, 'Minutes')
             xlsx_output = os.path.join(base_output_dir, 'Rosters')
-            write(active_df, advisor_df, docx_output_dir=docx_output, xlsx_output_dir=xlsx_output)
+            if self.daemon_check.isChecked():
+                daemon.submit('generate', os.path.abspath(excel_file), docx_output_dir=os.path.abspath(docx_output),
+                              xlsx_output_dir=os.path.abspath(xlsx_output), outputs=outputs, combined=combined, append=append,
+                              patch=patch, archive_dir=archive_dir or None)
+            else:
+                # Usually already parsed in the background when the file was picked
+                loaded = self.loader.result(excel_file)
+                if archive_dir:
+                    archive(excel_file, archive_dir)
+                write(loaded.active, loaded.staff, docx_output_dir=docx_output, xlsx_output_dir=xlsx_output,
+                      outputs=outputs, combined=combined, derived=loaded.derived, append=append, patch=patch)
 
             self.status_label.setText("Documents generated!")
             QMessageBox.information(self, "Success", "Minutes and Rosters created.")
@@ -101,30 +210,17 @@ class MinutesGeneratorApp(QWidget):
             self.status_label.setText("An error occurred.")
             QMessageBox.critical(self, "Error", str(e))
 
+    def closeEvent(self, event):
+        self.loader.close()
+        super().closeEvent(event)
 
-def read(excel_file):
-    df = pd.read_excel(excel_file, header=1)
-    active_df = df[df['Status'] == 'Active'][['Last Name', 'First Name', 'Current Office']]
-    advisor_df = df[df['Current Office'].isin(advisors)][['Last Name', 'First Name', 'Current Office']]
-
-    return active_df, advisor_df
-
-def write(active_df, advisor_df, docx_output_dir='Minutes', xlsx_output_dir='Rosters'):
-    os.makedirs(docx_output_dir, exist_ok=True)
-    os.makedirs(xlsx_output_dir, exist_ok=True)
-
-    with pd.ExcelWriter(os.path.join(xlsx_output_dir, 'Officer Roster and Minutes Rosters.xlsx'), engine='openpyxl') as writer:
-        create_roster(writer, xlsx_output_dir, active_df, advisor_df)
-
-    create_bylaws_minutes(docx_output_dir, active_df)
-    create_chapter_minutes(docx_output_dir, active_df, advisor_df)
-    create_events_minutes(docx_output_dir, active_df)
-    create_exec_minutes(docx_output_dir, active_df)
-    create_finance_minutes(docx_output_dir, active_df)
-    create_house_minutes(docx_output_dir, active_df, advisor_df)
-    create_IOC_minutes(docx_output_dir, active_df)
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ['serve']:
+        # How the frozen executable runs its background daemon (see daemon.start_daemon)
+        daemon.main(sys.argv[1:])
+        sys.exit()
+
     app = QApplication(sys.argv)
     window = MinutesGeneratorApp()
     window.show()
@@ -0,0 +1,259 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import combinations
+
+import constants
+
+# Member attribute for each roster column, in ROSTER_COLUMNS order
+MEMBER_FIELDS = {
+    'Last Name': 'last_name',
+    'First Name': 'first_name',
+    'Current Office': 'office',
+    'Status': 'status',
+}
+
+SOUNDEX_CODES = {c: d for d, letters in {
+    '1': 'BFPV', '2': 'CGJKQSXZ', '3': 'DT', '4': 'L', '5': 'MN', '6': 'R'
+}.items() for c in letters}
+
+class Member:
+    """
+    One roster row. Slotted, so a roster costs one small object per member
+    and filtering, ranking and sorting are plain Python over a list, with no
+    pandas import or per-row Series. Blank fields are None; `row` is the
+    position in the roster file (what a DataFrame's index would be).
+    `former` marks someone off the roster who still held an office on the
+    meeting date (see assignments.roster_as_of): listed with the officers,
+    but not a voting member.
+    """
+    __slots__ = ('last_name', 'first_name', 'office', 'status', 'row', 'former')
+
+    def __init__(self, last_name=None, first_name=None, office=None, status=None, row=None, former=False):
+        self.last_name = last_name
+        self.first_name = first_name
+        self.office = office
+        self.status = status
+        self.row = row
+        self.former = former
+
+    @property
+    def name(self):
+        return f'{_str(self.first_name)} {_str(self.last_name)}'
+
+    @property
+    def positions(self):
+        # 'Alpha/ Beta' -> ['Alpha', 'Beta']
+        return [] if self.office is None else [p.strip() for p in self.office.split('/')]
+
+    def __repr__(self):
+        return f'Member({self.last_name!r}, {self.first_name!r}, {self.office!r}, {self.status!r})'
+
+class Table:
+    """
+    A roster table as plain rows: what the workbook, the exports and the
+    preview render. `columns` are the header labels.
+    """
+    __slots__ = ('columns', 'rows')
+
+    def __init__(self, columns=(), rows=()):
+        self.columns = list(columns)
+        self.rows = list(rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def empty(self):
+        return not self.rows or not self.columns
+
+def _str(value):
+    return '' if value is None else str(value)
+
+def _missing(value):
+    try:
+        return value is None or value != value  # NaN
+    except TypeError:  # pd.NA refuses to be a bool
+        return True
+
+def name_key(name):
+    """
+    Comparison key for a single name: accents, case, punctuation and extra
+    whitespace removed ('  José  O'Neil' -> 'jose oneil').
+    """
+    if _missing(name):
+        return ''
+    name = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode()
+    return ' '.join(re.sub(r"[^\w\s]", '', name).casefold().split())
+
+def clean_name(name):
+    """
+    Strips and collapses whitespace in a name, as names.clean_names does for a DataFrame.
+    """
+    return ' '.join(name.split()) if isinstance(name, str) else name
+
+def members_from_columns(columns):
+    """
+    Builds Member records from {roster column: values}, as returned by
+    readers.read_roster_columns. Names are cleaned on the way in.
+    """
+    count = max(map(len, columns.values()), default=0)
+    values = [columns.get(c) or [None] * count for c in MEMBER_FIELDS]
+    return [
+        Member(clean_name(last), clean_name(first), office, status, row)
+        for row, (last, first, office, status) in enumerate(zip(*values))
+    ]
+
+def as_members(roster):
+    """
+    Returns a roster as a list of Members: a DataFrame (as returned by
+    generator.read) is converted, keeping its index labels as rows; a list
+    of Members is returned as is.
+    """
+    if not hasattr(roster, 'columns'):
+        return roster
+    columns = [roster[c].tolist() if c in roster.columns else [None] * len(roster) for c in MEMBER_FIELDS]
+    return [
+        Member(*(None if _missing(v) else v for v in values), row=row)
+        for row, values in zip(roster.index.tolist(), zip(*columns))
+    ]
+
+def split_members(members):
+    """
+    Splits a full roster into the active members and the chapter advisors.
+    Former office holders go with the active members, so the outlines list
+    them with the officers; voting_members leaves them out of the counts.
+    """
+    return [m for m in members if m.status == 'Active' or m.former], [m for m in members if m.office in constants.advisors]
+
+def voting_members(members):
+    """
+    The members who count towards the active and voting totals, the quorum
+    and the blackball minimum: everyone but former office holders.
+    """
+    return [m for m in members if not m.former]
+
+# The queries below mirror the pandas string methods the outlines used, so
+# they select the same members in the same (roster) order.
+
+def office_contains(members, pattern):
+    """
+    Members whose Current Office contains the regex `pattern` (Series.str.contains).
+    """
+    pattern = re.compile(pattern)
+    return [m for m in members if m.office is not None and pattern.search(m.office)]
+
+def office_matches(members, pattern):
+    """
+    Members whose Current Office starts with the regex `pattern` (Series.str.match).
+    """
+    pattern = re.compile(pattern)
+    return [m for m in members if m.office is not None and pattern.match(m.office)]
+
+def office_is(members, office):
+    return [m for m in members if m.office == office]
+
+def without_offices(members, roles):
+    """
+    Members holding none of `roles`, including those with no office at all.
+    """
+    pattern = re.compile('|'.join(roles))
+    return [m for m in members if m.office is None or not pattern.search(m.office)]
+
+def officers_of(members, roles):
+    """
+    Yields (role, member) for every holder of each role, role by role,
+    matching whole offices case-insensitively ('alpha' in 'Alpha/Beta').
+    """
+    held = [(m, {p.lower() for p in m.positions}) for m in members]
+    for role in roles:
+        key = role.lower()
+        for member, positions in held:
+            if key in positions:
+                yield role, member
+
+def sorted_by_name(members):
+    """
+    Sorts by last then first name, ignoring case, blanks last; stable.
+    """
+    def key(m):
+        return (m.last_name is None, (m.last_name or '').lower(),
+                m.first_name is None, (m.first_name or '').lower())
+    return sorted(members, key=key)
+
+def soundex(name):
+    """
+    American Soundex code of a name key, e.g. 'robert' -> 'R163'.
+    """
+    letters = [c for c in name.upper() if c.isalpha()]
+    if not letters:
+        return ''
+    code = letters[0]
+    previous = SOUNDEX_CODES.get(letters[0], '')
+    for c in letters[1:]:
+        digit = SOUNDEX_CODES.get(c, '')
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        if c not in 'HW':
+            previous = digit
+    return code.ljust(4, '0')
+
+@lru_cache(maxsize=None)
+def _digits(key):
+    return ''.join(c for c in key if c.isdigit())
+
+def name_similarity(a, b, floor=0.0):
+    """
+    0-1 similarity of two name keys. Pairs that can't reach `floor` may
+    be scored 0 without the full comparison.
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    # 'Smith 2' / 'Smith 3', or numbered placeholders, are never the same person
+    if _digits(a) != _digits(b):
+        return 0.0
+    # 'jon' / 'jonathan': a short form that is a prefix of the long one
+    if a.startswith(b) or b.startswith(a):
+        return 0.9
+    # Upper bounds on ratio(), cheapest first: the length bound needs no
+    # matcher at all, and the full diff is skipped when either rules the pair out
+    if 2 * min(len(a), len(b)) < floor * (len(a) + len(b)):
+        return 0.0
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.quick_ratio() < floor:
+        return 0.0
+    return matcher.ratio()
+
+def find_member_duplicates(members, threshold=0.85, max_block_size=500):
+    """
+    names.find_duplicates for Member records, without pandas: the same
+    blocking keys and score. Returns (member, member, score) for each
+    candidate pair, best matches first.
+    """
+    keys = [(name_key(m.last_name), name_key(m.first_name)) for m in members]
+    blocks = {}
+    for i, (last, first) in enumerate(keys):
+        if last and first:
+            blocks.setdefault(('sound', soundex(last), first[:1]), []).append(i)
+            blocks.setdefault(('prefix', last[:4], soundex(first)), []).append(i)
+    pairs = set()
+    for rows in blocks.values():
+        if len(rows) <= max_block_size:
+            pairs.update(combinations(rows, 2))
+
+    result = []
+    for a, b in sorted(pairs):
+        last_score = name_similarity(keys[a][0], keys[b][0], threshold)
+        if last_score < threshold:
+            continue
+        first_score = name_similarity(keys[a][1], keys[b][1], (threshold - 0.4) / 0.6)
+        # Surnames must agree closely; first names may be nicknames
+        score = min(last_score, 0.4 * last_score + 0.6 * first_score)
+        if score >= threshold:
+            result.append((members[a], members[b], score))
+    return sorted(result, key=lambda pair: -pair[2])
@@ -1,16 +1,45 @@
 import os
 import math
+from collections import namedtuple
 
 from docx import Document
 from docx.oxml import register_element_cls, OxmlElement
 from docx.shared import Inches, Pt
+from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from utils import *
+import constants
 from constants import *
-
-def create_bylaws_minutes(docx_output_dir, active_df):
-    doc = Document()
+from roster import DerivedTables
+from members import as_members, office_contains, office_matches, office_is, without_offices, officers_of, voting_members
+from ooxml import save_document
+
+# Floating images (the crests) need the custom anchor element; registering it
+# once at import is enough for every document built afterwards
+register_element_cls('wp:anchor', CT_Anchor)
+
+# The parts of an outline that come from the roster: the lines of its roster
+# paragraphs, keyed by the start of the paragraph's first run, and the data
+# rows of its roll tables, keyed by the first header cell, with the columns
+# centered. The builders render exactly this, and patch.py edits an existing
+# outline to match it.
+RosterContent = namedtuple('RosterContent', ['paragraphs', 'tables'])
+
+def _blank_rows(count, columns):
+    return [['', ''] + ['P'] * (columns - 2) for _ in range(count)]
+
+def bylaws_roster_content(active):
+    active = as_members(active)
+    roles = [('Chair', 'Sigma'), ('Secretary', 'Sigma')]
+    officers = [[position, member.name, 'P'] for position in ['Chair', 'Secretary'] for member in office_contains(active, 'Sigma')]
+    others = _blank_rows(min(len(without_offices(active, constants.officers)), 5), 3)
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles]},
+        {'Officers': (officers, [2]), 'Others': (others, [2])})
+
+def build_bylaws_minutes(doc, active):
+    active = as_members(active)
     add_header(doc, 'Bylaws Committee Meeting\nXX-XX-XX', False)
 
     title = doc.add_paragraph()
@@ -24,11 +53,11 @@ def create_bylaws_minutes(docx_output_dir, active_df):
     set_font(bylaws.add_run('Date'), 'Times New Roman', 11)
     insertHR(bylaws)
 
+    roster_content = bylaws_roster_content(active)
     parliamentary_officers = doc.add_paragraph()
     set_font(parliamentary_officers.add_run('Parliamentary Officers\n'), 'Times New Roman', 14)
-    roles = [('Chair', 'Sigma'), ('Secretary', 'Sigma')]
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary_officers, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary_officers.add_run(line))
     insertHR(parliamentary_officers)
 
     set_font(doc.add_paragraph().add_run(f'Call to Order {emDash} Time'), 'Times New Roman', 11, bold=True)
@@ -49,7 +78,7 @@ def create_bylaws_minutes(docx_output_dir, active_df):
     table_title = doc.add_table(rows=1, cols=1)
     cell = table_title.cell(0, 0)
     cell.text = 'BYLAWS COMMITTEE'
-    cell.paragraphs[0].style = 'No Spacing'
+    cell.paragraphs[0].style = get_stylesheet(doc).paragraph('No Spacing')
     cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     officers_table = doc.add_table(rows=1, cols=3)
@@ -61,12 +90,7 @@ def create_bylaws_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    for position in ['Chair', 'Secretary']:
-        officer_data = active_df[active_df['Current Office'].str.contains('Sigma', na=False)]
-        for _, row in officer_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            r_index = add_table_row(officers_table, [position, name, 'P'], r_index, center_cols=[2])
+    add_table_rows(officers_table, *roster_content.tables['Officers'])
 
     brothers_table = doc.add_table(rows=1, cols=3)
     hdr_cells = brothers_table.rows[0].cells
@@ -77,18 +101,46 @@ def create_bylaws_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    others_data = active_df[~active_df['Current Office'].str.contains('|'.join(officers), na=False)]
-    for _, row in others_data.iterrows():
-        if r_index >= 5:
-            break
-        r_index = add_table_row(brothers_table, ['', '', 'P'], r_index, center_cols=[2])
-
-    doc.save(os.path.join(docx_output_dir, 'Bylaws Committe Minutes Outline.docx'))
+    add_table_rows(brothers_table, *roster_content.tables['Others'])
 
-def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
-    register_element_cls('wp:anchor', CT_Anchor)
+def create_bylaws_minutes(docx_output_dir, active):
     doc = Document()
+    build_bylaws_minutes(doc, active)
+    path = os.path.join(docx_output_dir, 'Bylaws Committe Minutes Outline.docx')
+    save_document(doc, path)
+    return path
+
+def chapter_roster_content(active, staff, derived=None):
+    active, staff = as_members(active), as_members(staff)
+    derived = derived or DerivedTables(active, staff)
+    roles = [('Chair', 'Alpha'), ('Secretary', 'Sigma'), ('Treasurer', 'Tau'), 
+             ('Chaplain', 'Beta'), ('Sergeants-at-Arms', 'Theta One, Theta Two, Theta Three')]
+    num_members = len(voting_members(active))
+    quorum = int(num_members // (3/2))
+    blackball = math.ceil(num_members * 0.10)
+    stats = [
+        f'Total active members: {num_members}\n',
+        f'Total voting members: {num_members}\n',
+        'Total members in attendance: Attendance\n',
+        f'Quorum minimum {quorum}\n',
+        f'Blackball minimum: {blackball} \t(10%)\n'
+    ]
+
+    officers = [[officer, member.name, 'P', 'P'] for officer, member in officers_of(active, constants.officers)]
+    brothers = [[member.last_name, member.first_name, 'P', 'P'] for member in derived.sorted_brothers]
+    advisors = []
+    for advisor in constants.advisors:
+        symbol = 'E' if advisor in ['Chapter Advisor', 'Asst. Chapter Advisor'] else 'P'
+        advisors += [[advisor, member.name, symbol, symbol] for member in office_is(staff, advisor)]
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles],
+         'Total active members': stats},
+        {'Officers': (officers, [2, 3]), 'Brothers': (brothers, [2, 3]), 'Role': (advisors, [2, 3])})
+
+def build_chapter_minutes(doc, active, staff, derived=None):
+    active, staff = as_members(active), as_members(staff)
+    derived = derived or DerivedTables(active, staff)
+    roster_content = chapter_roster_content(active, staff, derived)
     add_header(doc, 'Formal Meeting Minutes\nDate', True)
 
     paragraph = doc.add_paragraph()
@@ -104,26 +156,15 @@ def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
     insertHR(meeting, position='top')
     set_font(meeting.add_run('Date'))
 
-    roles = [('Chair', 'Alpha'), ('Secretary', 'Sigma'), ('Treasurer', 'Tau'), 
-             ('Chaplain', 'Beta'), ('Sergeants-at-Arms', 'Theta One, Theta Two, Theta Three')]
     parliamentary = doc.add_paragraph()
     set_font(parliamentary.add_run('Parliamentary Officers\n'), size=14)
     insertHR(parliamentary, position='top')
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary.add_run(line))
     insertHR(parliamentary)
 
     stats = doc.add_paragraph()
-    num_members = len(active_df)
-    quorum = int(num_members // (3/2))
-    blackball = math.ceil(num_members * 0.10)
-    for line in [
-        f'Total active members: {num_members}\n',
-        f'Total voting members: {num_members}\n',
-        'Total members in attendance: Attendance\n',
-        f'Quorum minimum {quorum}\n',
-        f'Blackball minimum: {blackball} \t(10%)\n'
-    ]:
+    for line in roster_content.paragraphs['Total active members']:
         set_font(stats.add_run(line))
     insertHR(stats)
 
@@ -138,19 +179,18 @@ def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
         p = doc.add_paragraph()
         set_font(p.add_run(header), font_name='Helvetica Neue', bold=True)
 
+    stylesheet = get_stylesheet(doc)
     nms = {
         'NM1': ['Pi:', 'Iota:', 'PF:', '+:', '-:', 'C:', 'Pass:'],
         'NM2': ['Pi:', 'Iota:', 'PF:', '+:', '-:', 'C:', 'Pass:'],
         'NM3': ['Pi:', 'Iota:', 'PF:', '+:', '-:', 'C:', 'Pass:']
     }
     for nm, items in nms.items():
-        bullet = doc.add_paragraph(style='List Bullet')
+        bullet = doc.add_paragraph(style=stylesheet.bullet())
         set_font(bullet.add_run(nm), font_name='Helvetica Neue')
-        set_paragraph_indentation(bullet, 36)
         for sub in items:
-            sub_bullet = doc.add_paragraph(style='List Bullet 2')
+            sub_bullet = doc.add_paragraph(style=stylesheet.bullet(2))
             set_font(sub_bullet.add_run(sub), font_name='Helvetica Neue')
-            set_paragraph_indentation(sub_bullet, 72)
 
     report_titles = ['Reports of Officers and Committees -']
     committees = [
@@ -164,9 +204,8 @@ def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
         p = doc.add_paragraph()
         set_font(p.add_run(title), font_name='Helvetica Neue', bold=True)
     for c in committees:
-        bullet = doc.add_paragraph(style='List Bullet')
+        bullet = doc.add_paragraph(style=stylesheet.bullet())
         set_font(bullet.add_run(c), font_name='Helvetica Neue')
-        set_paragraph_indentation(bullet, 36)
 
     for section in [
         'Elections -', 'Unfinished Business -', 'New Business -',
@@ -177,12 +216,10 @@ def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
         set_font(p.add_run(section), font_name='Helvetica Neue', bold=True)
 
     for header in ['Announcements', 'Betterment']:
-        bullet = doc.add_paragraph(style='List Bullet')
+        bullet = doc.add_paragraph(style=stylesheet.bullet())
         set_font(bullet.add_run(header), font_name='Helvetica Neue')
-        set_paragraph_indentation(bullet, 36)
-        sub = doc.add_paragraph(style='List Bullet 2')
+        sub = doc.add_paragraph(style=stylesheet.bullet(2))
         set_font(sub.add_run(''), font_name='Helvetica Neue')
-        set_paragraph_indentation(sub, 72)
 
     adj = doc.add_paragraph()
     set_font(adj.add_run('Adjournment - Time'), font_name='Helvetica Neue', bold=True)
@@ -204,10 +241,7 @@ def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    for officer, row in get_officers_from_df(active_df, officers):
-        name = f'{row["First Name"]} {row["Last Name"]}'
-        r_index = add_table_row(officers_table, [officer, name, 'P', 'P'], r_index, center_cols=[2, 3])
+    add_table_rows(officers_table, *roster_content.tables['Officers'])
 
     brothers_table = doc.add_table(rows=1, cols=4)
     hdr_cells = brothers_table.rows[0].cells
@@ -220,26 +254,32 @@ def create_chapter_minutes(docx_output_dir, active_df, advisor_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    brothers_data = filter_sorted_brothers(active_df, officers)
-    r_index = 0
-    for _, row in brothers_data.iterrows():
-        r_index = add_table_row(brothers_table, [row["Last Name"], row["First Name"], 'P', 'P'], r_index, center_cols=[2, 3])
+    add_table_rows(brothers_table, *roster_content.tables['Brothers'])
 
     advisor_table = doc.add_table(rows=1, cols=4)
     set_table_headers(advisor_table, ['Role', 'Chapter Staff', 'Opening Roll', 'Closing Roll'])
 
-    r_index = 0
-    for advisor in advisors:
-        advisor_data = advisor_df[advisor_df['Current Office'] == advisor]
-        for _, row in advisor_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            symbol = 'E' if advisor in ['Chapter Advisor', 'Asst. Chapter Advisor'] else 'P'
-            r_index = add_table_row(advisor_table, [advisor, name, symbol, symbol], r_index, center_cols=[2, 3])
-
-    doc.save(os.path.join(docx_output_dir, 'Chapter Minutes Outline.docx'))
+    add_table_rows(advisor_table, *roster_content.tables['Role'])
 
-def create_events_minutes(docx_output_dir, active_df):
+def create_chapter_minutes(docx_output_dir, active, staff, derived=None):
     doc = Document()
+    build_chapter_minutes(doc, active, staff, derived)
+    path = os.path.join(docx_output_dir, 'Chapter Minutes Outline.docx')
+    save_document(doc, path)
+    return path
+
+def events_roster_content(active):
+    active = as_members(active)
+    roles = [('Chair', 'Chi'), ('Secretary', 'Sigma')]
+    officers = [[role, member.name, 'P'] for role in constants.events for member in office_contains(active, role)]
+    others = _blank_rows(min(len(without_offices(active, constants.officers)), 5), 3)
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles]},
+        {'Brothers': (officers, [2]), 'Others': (others, [2])})
+
+def build_events_minutes(doc, active):
+    active = as_members(active)
+    roster_content = events_roster_content(active)
     add_header(doc, 'Events Committee\nXX-XX-XX', False)
 
     title = doc.add_paragraph()
@@ -255,9 +295,8 @@ def create_events_minutes(docx_output_dir, active_df):
 
     parliamentary_officer = doc.add_paragraph()
     set_font(parliamentary_officer.add_run('Parliamentary Officers\n'), 'Times New Roman', 14)
-    roles = [('Chair', 'Chi'), ('Secretary', 'Sigma')]
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary_officer, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary_officer.add_run(line))
     insertHR(parliamentary_officer)
 
     call = doc.add_paragraph()
@@ -285,7 +324,7 @@ def create_events_minutes(docx_output_dir, active_df):
     table_title = doc.add_table(rows=1, cols=1)
     cell = table_title.cell(0, 0)
     cell.text = 'EVENTS COMMITTEE'
-    cell.paragraphs[0].style = 'No Spacing'
+    cell.paragraphs[0].style = get_stylesheet(doc).paragraph('No Spacing')
     cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     officers_table = doc.add_table(rows=1, cols=3)
@@ -296,12 +335,7 @@ def create_events_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    for role in events:
-        officer_data = active_df[active_df['Current Office'].str.contains(role, na=False)]
-        for _, row in officer_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            r_index = add_table_row(officers_table, [role, name, 'P'], r_index, center_cols=[2])
+    add_table_rows(officers_table, *roster_content.tables['Brothers'])
 
     brothers_table = doc.add_table(rows=1, cols=3)
     hdr_cells = brothers_table.rows[0].cells
@@ -311,18 +345,26 @@ def create_events_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
         
-    r_index = 0
-    others_data = active_df[~active_df['Current Office'].str.contains('|'.join(officers), na=False)]
-    for _, row in others_data.iterrows():
-        if r_index >= 5:
-            break
-        r_index = add_table_row(brothers_table, ['', '', 'P'], r_index, center_cols=[2])
+    add_table_rows(brothers_table, *roster_content.tables['Others'])
 
-    doc.save(os.path.join(docx_output_dir, 'Events Committe Minutes Outline.docx'))
-
-def create_exec_minutes(docx_output_dir, active_df):
-    register_element_cls('wp:anchor', CT_Anchor)
+def create_events_minutes(docx_output_dir, active):
     doc = Document()
+    build_events_minutes(doc, active)
+    path = os.path.join(docx_output_dir, 'Events Committe Minutes Outline.docx')
+    save_document(doc, path)
+    return path
+
+def exec_roster_content(active):
+    active = as_members(active)
+    roles = [('Chair', 'Alpha'), ('Secretary', 'Sigma')]
+    officers = [[officer, member.name, 'P', 'P'] for officer in constants.exec for member in office_matches(active, officer)]
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles]},
+        {'Officers': (officers, [2, 3])})
+
+def build_exec_minutes(doc, active):
+    active = as_members(active)
+    roster_content = exec_roster_content(active)
 
     paragraph = doc.add_paragraph()
     add_float_picture(paragraph, 'data/AEPKS_FAST_F.png', width=Inches(2.25), height=Inches(2.75), pos_x=Pt(90), pos_y=Pt(70))
@@ -340,9 +382,8 @@ def create_exec_minutes(docx_output_dir, active_df):
 
     parliamentary_officer = doc.add_paragraph('Parliamentary Officers\n')
     set_font(parliamentary_officer.add_run(), 'Times New Roman', 14)
-    roles = [('Chair', 'Alpha'), ('Secretary', 'Sigma')]
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary_officer, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary_officer.add_run(line))
     insertHR(parliamentary_officer)
 
     set_font(doc.add_paragraph().add_run('Call to Order - Time'), 'Times New Roman', 11, True)
@@ -357,7 +398,7 @@ def create_exec_minutes(docx_output_dir, active_df):
     title_table = doc.add_table(rows=1, cols=1)
     title_cell = title_table.cell(0, 0)
     title_cell.text = 'EXECUTIVE COUNCIL MEETING'
-    title_cell.paragraphs[0].style = 'No Spacing'
+    title_cell.paragraphs[0].style = get_stylesheet(doc).paragraph('No Spacing')
     title_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     officers_table = doc.add_table(rows=1, cols=4)
@@ -369,17 +410,28 @@ def create_exec_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    for officer in exec:
-        officer_data = active_df[active_df['Current Office'].str.match(officer, na=False)]
-        for _, row in officer_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            r_index = add_table_row(officers_table, [officer, name, 'P', 'P'], r_index, center_cols=[2, 3])
-
-    doc.save(os.path.join(docx_output_dir, 'Exec Minutes Outline.docx'))
+    add_table_rows(officers_table, *roster_content.tables['Officers'])
 
-def create_finance_minutes(docx_output_dir, active_df):
+def create_exec_minutes(docx_output_dir, active):
     doc = Document()
+    build_exec_minutes(doc, active)
+    path = os.path.join(docx_output_dir, 'Exec Minutes Outline.docx')
+    save_document(doc, path)
+    return path
+
+def finance_roster_content(active):
+    active = as_members(active)
+    roles = [('Chair', 'Asst. Tau'), ('Secretary', 'Sigma')]
+    committee = ['Asst. Tau', 'Sigma']
+    officers = [[role, member.name, 'P'] for role in committee for member in office_contains(active, role)]
+    others = _blank_rows(min(len(without_offices(active, committee)), 6), 3)
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles]},
+        {'Officers': (officers, [2]), 'Others': (others, [2])})
+
+def build_finance_minutes(doc, active):
+    active = as_members(active)
+    roster_content = finance_roster_content(active)
     add_header(doc, 'Finance Committee Meeting\nXX-XX-XX', False)
 
     title = doc.add_paragraph()
@@ -395,9 +447,8 @@ def create_finance_minutes(docx_output_dir, active_df):
 
     parliamentary_officer = doc.add_paragraph()
     set_font(parliamentary_officer.add_run('Parliamentary Officers\n'), 'Times New Roman', 14)
-    roles = [('Chair', 'Asst. Tau'), ('Secretary', 'Sigma')]
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary_officer, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary_officer.add_run(line))
     insertHR(parliamentary_officer)
 
     set_font(doc.add_paragraph().add_run(f'Call to Order {emDash} Time'), 'Times New Roman', 11, True)
@@ -413,7 +464,7 @@ def create_finance_minutes(docx_output_dir, active_df):
     table_title = doc.add_table(rows=1, cols=1)
     title_cell = table_title.cell(0, 0)
     title_cell.text = 'FINANCE COMMITTEE'
-    title_cell.paragraphs[0].style = 'No Spacing'
+    title_cell.paragraphs[0].style = get_stylesheet(doc).paragraph('No Spacing')
     title_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     officers_table = doc.add_table(rows=1, cols=3)
@@ -424,13 +475,7 @@ def create_finance_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    roles = ['Asst. Tau', 'Sigma']
-    for role in roles:
-        officer_data = active_df[active_df['Current Office'].str.contains(role, na=False)]
-        for _, row in officer_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            r_index = add_table_row(officers_table, [role, name, 'P'], r_index, center_cols=[2])
+    add_table_rows(officers_table, *roster_content.tables['Officers'])
 
     brothers_table = doc.add_table(rows=1, cols=3)
     hdr_cells = brothers_table.rows[0].cells
@@ -440,18 +485,35 @@ def create_finance_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    others_data = active_df[~active_df['Current Office'].str.contains('|'.join(roles), na=False)]
-    for _, row in others_data.iterrows():
-        if r_index >= 6:
-            break
-        r_index = add_table_row(brothers_table, ['', '', 'P'], r_index, center_cols=[2])
+    add_table_rows(brothers_table, *roster_content.tables['Others'])
 
-    doc.save(os.path.join(docx_output_dir, 'Finance Committee Outline.docx'))
-
-def create_house_minutes(docx_output_dir, active_df, advisor_df):
-    register_element_cls('wp:anchor', CT_Anchor)
+def create_finance_minutes(docx_output_dir, active):
     doc = Document()
+    build_finance_minutes(doc, active)
+    path = os.path.join(docx_output_dir, 'Finance Committee Outline.docx')
+    save_document(doc, path)
+    return path
+
+def house_roster_content(active, staff, derived=None):
+    active, staff = as_members(active), as_members(staff)
+    derived = derived or DerivedTables(active, staff)
+    roles = [('Chair', 'Alpha'), ('Secretary', 'Sigma')]
+    officers = [[officer, member.name, 'P', 'P'] for officer, member in officers_of(active, constants.officers)]
+    brothers = [[member.last_name, member.first_name, 'P', 'P'] for member in derived.sorted_brothers]
+    advisors = []
+    for advisor in constants.advisors:
+        symbol = 'E' if advisor in ['Resident Advisor', 'Chapter Advisor', 'Asst. Chapter Advisor'] else 'P'
+        advisors += [[member.name, symbol, symbol, advisor] for member in office_is(staff, advisor)]
+    new_members = _blank_rows(len(derived.sorted_brothers), 4)
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles]},
+        {'Officers': (officers, [2, 3]), 'Brothers': (brothers, [2, 3]),
+         'Chapter Staff': (advisors, [1, 2]), 'Last Name': (new_members, [2, 3])})
+
+def build_house_minutes(doc, active, staff, derived=None):
+    active, staff = as_members(active), as_members(staff)
+    derived = derived or DerivedTables(active, staff)
+    roster_content = house_roster_content(active, staff, derived)
 
     paragraph = doc.add_paragraph()
     add_float_picture(paragraph, 'data/AEPKS_BLACK_MALTESE_CROSS.png', width=Inches(3.65), height=Inches(3.95), pos_x=Pt(5), pos_y=Pt(92))
@@ -470,9 +532,8 @@ def create_house_minutes(docx_output_dir, active_df, advisor_df):
     parliamentary_officer = doc.add_paragraph()
     set_font(parliamentary_officer.add_run('Parliamentary Officers\n'), 'Times New Roman', 14)
     insertHR(parliamentary_officer, 'top')
-    roles = [('Chair', 'Alpha'), ('Secretary', 'Sigma')]
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary_officer, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary_officer.add_run(line))
 
     doc.add_page_break()
 
@@ -500,10 +561,7 @@ def create_house_minutes(docx_output_dir, active_df, advisor_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    for officer, row in get_officers_from_df(active_df, officers):
-        name = f'{row["First Name"]} {row["Last Name"]}'
-        r_index = add_table_row(officers_table, [officer, name, 'P', 'P'], r_index, center_cols=[2, 3])
+    add_table_rows(officers_table, *roster_content.tables['Officers'])
 
     brothers_table = doc.add_table(rows=1, cols=4)
     hdr_cells = brothers_table.rows[0].cells
@@ -514,40 +572,44 @@ def create_house_minutes(docx_output_dir, active_df, advisor_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    brothers_data = filter_sorted_brothers(active_df, officers)
-    for _, row in brothers_data.iterrows():
-        r_index = add_table_row(brothers_table, [row["Last Name"], row["First Name"], 'P', 'P'], r_index, center_cols=[2, 3])
+    add_table_rows(brothers_table, *roster_content.tables['Brothers'])
 
     advisor_table = doc.add_table(rows=1, cols=4)
     set_table_headers(advisor_table, ['Chapter Staff', 'Opening Roll', 'Closing Roll', 'Role'])
 
-    r_index = 0
-    for advisor in advisors:
-        advisor_data = advisor_df[advisor_df['Current Office'] == advisor]
-        for _, row in advisor_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            symbol = 'E' if advisor in ['Resident Advisor', 'Chapter Advisor', 'Asst. Chapter Advisor'] else 'P'
-            r_index = add_table_row(advisor_table, [name, symbol, symbol, advisor], r_index, center_cols=[1, 2])
+    add_table_rows(advisor_table, *roster_content.tables['Chapter Staff'])
 
     new_members_table_header = doc.add_table(rows=1, cols=1)
     cell = new_members_table_header.cell(0, 0)
     cell.text = 'NEW MEMBERS'
-    cell.paragraphs[0].style = 'No Spacing'
+    cell.paragraphs[0].style = get_stylesheet(doc).paragraph('No Spacing')
     cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     new_members_table = doc.add_table(rows=1, cols=4)
     set_table_headers(new_members_table, ['Last Name', 'First Name', 'Opening Roll', 'Closing Roll'])
 
-    r_index = 0
-    blank_data = filter_sorted_brothers(active_df, officers)
-    for _, _ in blank_data.iterrows():
-        r_index = add_table_row(new_members_table, ['', '', 'P', 'P'], r_index, center_cols=[2, 3])
+    add_table_rows(new_members_table, *roster_content.tables['Last Name'])
 
-    doc.save(os.path.join(docx_output_dir, 'House Minutes Outline.docx'))
-
-def create_IOC_minutes(docx_output_dir, active_df):
+def create_house_minutes(docx_output_dir, active, staff, derived=None):
     doc = Document()
+    build_house_minutes(doc, active, staff, derived)
+    path = os.path.join(docx_output_dir, 'House Minutes Outline.docx')
+    save_document(doc, path)
+    return path
+
+def IOC_roster_content(active):
+    active = as_members(active)
+    roles = [('Chair', 'Beta'), ('Secretary', 'Sigma')]
+    committee = ['Beta', 'Theta One', 'Theta Two', 'Theta Three', 'Sigma']
+    officers = [[role, member.name, 'P'] for role in committee for member in office_contains(active, role)]
+    others = _blank_rows(min(len(without_offices(active, committee)), 3), 3)
+    return RosterContent(
+        {'Parliamentary Officers': [parliamentary_line(title, role, active) for title, role in roles]},
+        {'Officers': (officers, [2]), 'Others': (others, [2])})
+
+def build_IOC_minutes(doc, active):
+    active = as_members(active)
+    roster_content = IOC_roster_content(active)
     add_header(doc, 'Internal Operation Committee\nXX-XX-XX', False)
 
     title = doc.add_paragraph()
@@ -563,9 +625,8 @@ def create_IOC_minutes(docx_output_dir, active_df):
 
     parliamentary_officer = doc.add_paragraph()
     set_font(parliamentary_officer.add_run('Parliamentary Officers\n'), 'Times New Roman', 14)
-    roles = [('Chair', 'Beta'), ('Secretary', 'Sigma')]
-    for title, role in roles:
-        add_parliamentary_officers(parliamentary_officer, title, role, active_df)
+    for line in roster_content.paragraphs['Parliamentary Officers']:
+        set_font(parliamentary_officer.add_run(line))
     insertHR(parliamentary_officer)
 
     set_font(doc.add_paragraph().add_run(f'Call to Order {emDash} Time'), 'Times New Roman', 11, True)
@@ -580,7 +641,7 @@ def create_IOC_minutes(docx_output_dir, active_df):
     table_title = doc.add_table(rows=1, cols=1)
     title_cell = table_title.cell(0, 0)
     title_cell.text = 'INTERNAL OPERATIONS COMMITTEE'
-    title_cell.paragraphs[0].style = 'No Spacing'
+    title_cell.paragraphs[0].style = get_stylesheet(doc).paragraph('No Spacing')
     title_cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     officers_table = doc.add_table(rows=1, cols=3)
@@ -591,13 +652,7 @@ def create_IOC_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    roles = ['Beta', 'Theta One', 'Theta Two', 'Theta Three', 'Sigma']
-    for role in roles:
-        officer_data = active_df[active_df['Current Office'].str.contains(role, na=False)]
-        for _, row in officer_data.iterrows():
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            r_index = add_table_row(officers_table, [role, name, 'P'], r_index, center_cols=[2])
+    add_table_rows(officers_table, *roster_content.tables['Officers'])
 
     brothers_table = doc.add_table(rows=1, cols=3)
     hdr_cells = brothers_table.rows[0].cells
@@ -607,11 +662,30 @@ def create_IOC_minutes(docx_output_dir, active_df):
     for cell in hdr_cells:
         apply_table_header_style(cell)
 
-    r_index = 0
-    others_data = active_df[~active_df['Current Office'].str.contains('|'.join(roles), na=False)]
-    for _, row in others_data.iterrows():
-        if r_index >= 3:
-            break
-        r_index = add_table_row(brothers_table, ['', '', 'P'], r_index, center_cols=[2])
+    add_table_rows(brothers_table, *roster_content.tables['Others'])
 
-    doc.save(os.path.join(docx_output_dir, 'IOC Minutes Outline.docx'))
+def create_IOC_minutes(docx_output_dir, active):
+    doc = Document()
+    build_IOC_minutes(doc, active)
+    path = os.path.join(docx_output_dir, 'IOC Minutes Outline.docx')
+    save_document(doc, path)
+    return path
+
+def create_combined_minutes(docx_output_dir, builders, filename='Meeting Minutes Outlines.docx'):
+    """
+    Puts several outlines into one document. `builders` lists (build function,
+    its arguments after the document). Every outline gets its own section,
+    starting on a new page with its own headers, while the styles, numbering
+    and images they share are stored in the package once.
+    """
+    doc = Document()
+    for i, (build, args) in enumerate(builders):
+        if i:
+            section = doc.add_section(WD_SECTION.NEW_PAGE)
+            # Start from a blank header rather than inheriting the previous outline's
+            section.different_first_page_header_footer = False
+            section.header.is_linked_to_previous = False
+        build(doc, *args)
+    path = os.path.join(docx_output_dir, filename)
+    save_document(doc, path)
+    return path
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from members import name_key, name_similarity, soundex
+
+NAME_COLUMNS = ['Last Name', 'First Name']
+
+def clean_names(df):
+    """
+    Strips and collapses whitespace in the name columns, so 'Smith ' and
+    'Smith' print (and match) the same. Returns a new DataFrame.
+    """
+    cleaned = {
+        c: df[c].str.strip().str.replace(r'\s+', ' ', regex=True)
+        for c in NAME_COLUMNS if c in df.columns
+    }
+    return df.assign(**cleaned)
+
+def diff_rosters(old_df, new_df):
+    """
+    Merges two roster exports on name and returns one row per member who
+    joined, left or changed office. An empty result means nothing to patch.
+    """
+    merged = old_df.merge(new_df, on=NAME_COLUMNS, how='outer', suffixes=(' Old', ' New'), indicator=True)
+    old_office = merged['Current Office Old'].fillna('')
+    new_office = merged['Current Office New'].fillna('')
+    merged['Change'] = merged['_merge'].astype(str).map({'left_only': 'left', 'right_only': 'joined', 'both': 'office'})
+    changed = (merged['_merge'] != 'both') | (old_office != new_office)
+    return merged.loc[changed, NAME_COLUMNS + ['Current Office Old', 'Current Office New', 'Change']].reset_index(drop=True)
+
+def _per_unique(series, function):
+    # Names repeat heavily across chapters; compute each distinct value once
+    uniques = series.unique()
+    return series.map(dict(zip(uniques, map(function, uniques))))
+
+def blocking_keys(df):
+    """
+    Adds the normalized name keys and the two blocking keys used to find
+    candidate duplicates: last-name Soundex + first initial, and last-name
+    prefix + first-name Soundex. Names that could be the same person almost
+    always share at least one of them. Rows missing either name get no
+    blocking keys, since blank names would otherwise all match each other.
+    """
+    last = _per_unique(df['Last Name'], name_key)
+    first = _per_unique(df['First Name'], name_key)
+    named = (last != '') & (first != '')
+    return pd.DataFrame({
+        'last_key': last,
+        'first_key': first,
+        'block_sound': (_per_unique(last, soundex) + '|' + first.str[:1]).where(named),
+        'block_prefix': (last.str[:4] + '|' + _per_unique(first, soundex)).where(named),
+    }, index=df.index)
+
+def _pair_similarity(a, b, floor=0.0):
+    # Blocks pair the same spellings over and over; score each distinct pair once
+    pairs = pd.DataFrame({'a': a, 'b': b})
+    unique = pairs.drop_duplicates()
+    scores = [name_similarity(x, y, floor) for x, y in zip(unique['a'], unique['b'])]
+    return pairs.merge(unique.assign(score=scores), on=['a', 'b'], how='left')['score'].to_numpy()
+
+def find_duplicates(df, threshold=0.85, max_block_size=500):
+    """
+    Finds likely duplicate people in a roster (or several rosters combined)
+    without comparing every pair: only rows sharing a blocking key are
+    compared. Returns one row per candidate pair with both index labels,
+    both names and a 0-1 score, best matches first.
+    """
+    # Work on positions so duplicate index labels in combined rosters are harmless
+    keys = blocking_keys(df).reset_index(drop=True)
+    keys['row'] = keys.index
+
+    pairs = []
+    for block in ('block_sound', 'block_prefix'):
+        sizes = keys[block].map(keys[block].value_counts())
+        blocked = keys.loc[keys[block].notna() & (sizes <= max_block_size), ['row', block]]
+        merged = blocked.merge(blocked, on=block, suffixes=('_a', '_b'))
+        pairs.append(merged.loc[merged['row_a'] < merged['row_b'], ['row_a', 'row_b']])
+    pairs = pd.concat(pairs).drop_duplicates()
+
+    if pairs.empty:
+        return pd.DataFrame(columns=['row_a', 'row_b', 'name_a', 'name_b', 'score'])
+
+    row_a, row_b = pairs['row_a'].to_numpy(), pairs['row_b'].to_numpy()
+    last, first = keys['last_key'].to_numpy(), keys['first_key'].to_numpy()
+    # The score never exceeds the surname similarity, so drop weak surnames
+    # before comparing first names at all
+    last_score = _pair_similarity(last[row_a], last[row_b], threshold)
+    keep = last_score >= threshold
+    row_a, row_b, last_score = row_a[keep], row_b[keep], last_score[keep]
+    # score >= threshold needs 0.4 * l + 0.6 * f >= threshold, with l <= 1
+    first_score = _pair_similarity(first[row_a], first[row_b], (threshold - 0.4) / 0.6)
+
+    full = (df['First Name'].astype(str) + ' ' + df['Last Name'].astype(str)).to_numpy()
+    result = pd.DataFrame({
+        'row_a': df.index[row_a],
+        'row_b': df.index[row_b],
+        'name_a': full[row_a],
+        'name_b': full[row_b],
+        # Surnames must agree closely; first names may be nicknames
+        'score': np.minimum(last_score, 0.4 * last_score + 0.6 * first_score),
+    })
+    return result[result['score'] >= threshold].sort_values('score', ascending=False, kind='stable').reset_index(drop=True)
@@ -0,0 +1,299 @@
+import os
+import re
+import json
+import time
+import zlib
+import struct
+import zipfile
+import hashlib
+
+from docx.opc.pkgwriter import PackageWriter
+
+# Timestamps written into every deterministic package, both as zip entry
+# dates and as the created/modified core properties.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+CORE_TIMESTAMP = b'2000-01-01T00:00:00Z'
+
+CORE_DATES = re.compile(
+    rb'(<(dcterms:created|dcterms:modified|cp:lastPrinted)\b[^>]*>)[^<]*(</\2>)'
+)
+
+MANIFEST_NAME = 'manifest.json'
+
+def _entry_order(name):
+    # [Content_Types].xml conventionally leads the package; everything else is sorted
+    return (name != '[Content_Types].xml', name)
+
+def normalize_package(path):
+    """
+    Rewrites a saved .docx/.xlsx so identical content gives identical bytes:
+    fixed entry timestamps, permissions and ordering, and fixed core-property
+    dates. Entries are copied still compressed (see iter_compressed_entries),
+    so parts written as raw copies are not deflated a second time.
+    """
+    entries = sorted(iter_compressed_entries(path), key=lambda entry: _entry_order(entry[0]))
+
+    tmp_path = path + '.tmp'
+    with RawZipWriter(tmp_path, date_time=ZIP_DATE_TIME) as writer:
+        for name, crc, size, compressed in entries:
+            if name == 'docProps/core.xml':
+                core = zlib.decompress(compressed, -15)
+                writer.write(name, CORE_DATES.sub(rb'\g<1>' + CORE_TIMESTAMP + rb'\g<3>', core))
+            else:
+                writer.write_compressed(name, crc, size, compressed)
+    os.replace(tmp_path, path)
+
+def file_digest(path):
+    """
+    Returns the SHA-256 hex digest of a file's bytes.
+    """
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def read_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.isfile(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def write_manifest(output_dir, names):
+    """
+    Records the SHA-256 of the generated files `names` in `output_dir`'s
+    manifest.json, keeping the entries of earlier runs whose files still
+    exist, and returns the names whose content changed since then.
+    """
+    previous = read_manifest(output_dir)
+    manifest = {name: digest for name, digest in previous.items() if os.path.isfile(os.path.join(output_dir, name))}
+    for name in names:
+        manifest[name] = file_digest(os.path.join(output_dir, name))
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return [name for name in sorted(names) if previous.get(name) != manifest[name]]
+
+def make_deterministic(paths):
+    """
+    Normalizes the generated packages at `paths` and records them in the
+    manifest of the folder each is in. Other files in those folders are
+    left alone. Returns the paths whose content changed since the last run.
+    """
+    by_dir = {}
+    for path in paths:
+        normalize_package(path)
+        by_dir.setdefault(os.path.dirname(path), []).append(os.path.basename(path))
+    return [os.path.join(output_dir, name) for output_dir, names in by_dir.items() for name in write_manifest(output_dir, names)]
+
+# Compressed copies of package parts that repeat byte for byte across outputs
+# (styles, numbering, theme, font table, images), keyed by the SHA-256 of the
+# part, so a changed template simply gets new entries. The folder can be moved
+# with the MINUTES_PART_CACHE environment variable (set it empty to keep the
+# cache in memory only), and is trimmed back to PART_CACHE_MAX_BYTES, least
+# recently used parts first, whenever a part is added.
+PART_CACHE_ENV = 'MINUTES_PART_CACHE'
+PART_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'minute-roster-generator', 'parts')
+PART_CACHE_MAX_BYTES = 64 << 20
+CACHE_MIN_SIZE = 4096
+
+# Parts rewritten for every output; caching them would only fill the cache
+VARYING_PARTS = re.compile(r'(word/document|word/header\d*|word/footer\d*|docProps/core)\.xml')
+
+_part_cache = {}
+_DEFAULT_CACHE = object()
+
+def part_cache_dir():
+    """
+    Returns the folder parts are cached in, or None for memory only.
+    """
+    return os.environ.get(PART_CACHE_ENV, PART_CACHE_DIR) or None
+
+def _deflate(data):
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+def _load_cached_part(path, data):
+    """
+    Returns the (crc32, size, raw deflate stream) cached at `path` for
+    `data`, or None if there is none or it doesn't inflate back to `data`
+    (a damaged or half-copied cache).
+    """
+    try:
+        with open(path, 'rb') as f:
+            crc, size = struct.unpack('<LL', f.read(8))
+            compressed = f.read()
+        if (crc, size) != (zlib.crc32(data), len(data)) or zlib.decompress(compressed, -15) != data:
+            return None
+        os.utime(path)  # Most recently used, for trim_part_cache
+    except (OSError, struct.error, zlib.error):
+        return None
+    return crc, size, compressed
+
+def trim_part_cache(cache_dir, max_bytes=None):
+    """
+    Removes the least recently used parts from `cache_dir` until the rest
+    fit in `max_bytes` (PART_CACHE_MAX_BYTES by default).
+    """
+    max_bytes = PART_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.deflate'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # Trimmed by another process
+        total -= size
+
+def compressed_part(data, cache_dir=_DEFAULT_CACHE):
+    """
+    Returns (crc32, size, raw deflate stream) for `data`, deflating it only
+    the first time it is seen by this process or, with `cache_dir` (by
+    default part_cache_dir()), by any.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    entry = _part_cache.get(digest)
+    if entry is not None:
+        return entry
+
+    if cache_dir is _DEFAULT_CACHE:
+        cache_dir = part_cache_dir()
+    path = cache_dir and os.path.join(cache_dir, digest + '.deflate')
+    entry = path and _load_cached_part(path, data)
+    if not entry:
+        entry = (zlib.crc32(data), len(data), _deflate(data))
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(struct.pack('<LL', entry[0], entry[1]) + entry[2])
+            os.replace(tmp_path, path)
+            trim_part_cache(cache_dir)
+
+    if len(_part_cache) >= 64:
+        _part_cache.clear()
+    _part_cache[digest] = entry
+    return entry
+
+def iter_compressed_entries(path):
+    """
+    Yields (name, crc32, size, raw deflate stream) for every entry of a zip,
+    in archive order, read straight from the file without inflating it, so
+    RawZipWriter.write_compressed can copy entries into a new archive as they
+    are. Entries that were stored rather than deflated are deflated here.
+    """
+    with zipfile.ZipFile(path) as zf, open(path, 'rb') as f:
+        for info in zf.infolist():
+            if info.compress_type != zipfile.ZIP_DEFLATED:
+                data = zf.read(info)
+                yield info.filename, zlib.crc32(data), len(data), _deflate(data)
+                continue
+            # The local header's name and extra field lengths can differ from the central directory's
+            f.seek(info.header_offset)
+            header = f.read(30)
+            if header[:4] != b'PK\x03\x04':
+                raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+            name_length, extra_length = struct.unpack('<2H', header[26:30])
+            f.seek(name_length + extra_length, os.SEEK_CUR)
+            yield info.filename, info.CRC, info.file_size, f.read(info.compress_size)
+
+class RawZipWriter:
+    """
+    Minimal zip writer that takes entries either as plain bytes (deflated here)
+    or as an already deflated stream, which is copied into the archive as is.
+    Its write(name, blob) matches the writer python-docx's PackageWriter uses.
+    """
+    def __init__(self, path, date_time=None):
+        self.file = open(path, 'wb')
+        self.entries = []
+        date_time = date_time or time.localtime()[:6]
+        self.dos_time = date_time[3] << 11 | date_time[4] << 5 | date_time[5] // 2
+        self.dos_date = (date_time[0] - 1980) << 9 | date_time[1] << 5 | date_time[2]
+
+    def write(self, name, data, cache=False):
+        name = getattr(name, 'membername', name)  # python-docx passes PackURIs
+        if cache:
+            crc, size, compressed = compressed_part(data)
+        else:
+            crc, size, compressed = zlib.crc32(data), len(data), _deflate(data)
+        self.write_compressed(name, crc, size, compressed)
+
+    def write_compressed(self, name, crc, size, compressed):
+        if max(size, len(compressed), self.file.tell()) >= 0xFFFFFFFF:
+            raise ValueError(f"{name} is too large for a zip without Zip64")
+        encoded = name.encode('utf-8')
+        flags = 0 if encoded.isascii() else 0x800
+        fields = (20, flags, zipfile.ZIP_DEFLATED, self.dos_time, self.dos_date, crc, len(compressed), size, len(encoded))
+        self.entries.append((encoded, fields, self.file.tell()))
+        self.file.write(struct.pack('<4s5H3L2H', b'PK\x03\x04', *fields, 0))
+        self.file.write(encoded)
+        self.file.write(compressed)
+
+    def close(self):
+        start = self.file.tell()
+        for encoded, fields, offset in self.entries:
+            # Made by Unix (3) so the 0o644 permission bits are honoured
+            self.file.write(struct.pack('<4s6H3L5H2L', b'PK\x01\x02', 3 << 8 | 20, *fields, 0, 0, 0, 0, 0o644 << 16, offset))
+            self.file.write(encoded)
+        size = self.file.tell() - start
+        self.file.write(struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, len(self.entries), len(self.entries), size, start, 0))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def replace_parts(path, parts):
+    """
+    Rewrites the package at `path` with `parts` ({name: bytes}) in place of
+    the entries of the same name, adding those it lacks at the end. Every
+    other entry is copied over as it is, still compressed. The new package
+    is written beside the old one and swapped in, so a failure leaves it
+    as it was.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with RawZipWriter(tmp_path) as writer:
+            for entry in iter_compressed_entries(path):
+                if entry[0] in parts:
+                    writer.write(entry[0], parts[entry[0]])
+                else:
+                    writer.write_compressed(*entry)
+            written = {name for name, _, _ in writer.entries}
+            for name, data in parts.items():
+                if name.encode('utf-8') not in written:
+                    writer.write(name, data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class _CachingPartWriter(RawZipWriter):
+    def write(self, name, data):
+        name = getattr(name, 'membername', name)
+        super().write(name, data, cache=len(data) >= CACHE_MIN_SIZE and not VARYING_PARTS.fullmatch(name))
+
+def save_document(doc, path):
+    """
+    Same as doc.save(path), except that parts carried over unchanged from the
+    template are copied from the part cache instead of being deflated again.
+    """
+    package = doc.part.package
+    parts = list(package.iter_parts())
+    for part in parts:
+        part.before_marshal()
+    with _CachingPartWriter(path) as writer:
+        PackageWriter._write_content_types_stream(writer, parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, parts)
@@ -0,0 +1,250 @@
+import os
+import zipfile
+
+from docx.opc.oxml import serialize_part_xml
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from lxml import etree
+
+import constants
+from generator import OUTLINES, write
+from names import diff_rosters, NAME_COLUMNS
+from ooxml import replace_parts
+from readers import _xlsx_parts, _xlsx_rows, _shared_strings
+from roster import plan_roster, create_roster, _roster_styles, _xml_bytes, ROSTER_FILENAME, STYLES_PART
+from utils import add_table_row
+
+# Outline name (see generator.OUTLINES) -> the file it is generated as
+OUTLINE_FILES = {
+    'bylaws': 'Bylaws Committe Minutes Outline.docx',
+    'chapter': 'Chapter Minutes Outline.docx',
+    'events': 'Events Committe Minutes Outline.docx',
+    'exec': 'Exec Minutes Outline.docx',
+    'finance': 'Finance Committee Outline.docx',
+    'house': 'House Minutes Outline.docx',
+    'ioc': 'IOC Minutes Outline.docx',
+}
+
+DOCUMENT_PART = 'word/document.xml'
+
+def _set_row_color(tr, color):
+    """
+    Rewrites the banding fill of an existing row, returning True if any cell changed.
+    """
+    changed = False
+    for shd in tr.iter(qn('w:shd')):
+        if shd.get(qn('w:fill')) != color:
+            shd.set(qn('w:fill'), color)
+            changed = True
+    return changed
+
+def _texts(tr):
+    # Read straight off the XML; python-docx's row.cells lays out the whole grid per call
+    texts = []
+    for tc in tr.tc_lst:
+        texts += [''.join(tc.itertext(qn('w:t')))] * tc.grid_span
+    return texts
+
+def patch_table(table, rows, center_cols=None):
+    """
+    Brings the data rows of a generated table in line with `rows`, the cell
+    texts it would be built with now (see minutes.RosterContent). Rows whose
+    non-roll cells still match are kept as-is, so roll marks and other edits
+    survive; only joined, departed and reordered rows are touched. Rows of a
+    blank form (the new members table, say) are kept by position, whatever
+    has been written in them. Returns the number of rows added, removed or
+    restyled.
+    """
+    tbl = table._tbl
+    header, *existing_rows = tbl.tr_lst
+    roll_cols = [i for i, text in enumerate(_texts(header)) if 'Roll' in text]
+    blank = not any(t for texts in rows for i, t in enumerate(texts) if i not in roll_cols)
+
+    def key(texts):
+        return () if blank else tuple(t for i, t in enumerate(texts) if i not in roll_cols)
+
+    existing = {}
+    for tr in existing_rows:
+        existing.setdefault(key(_texts(tr)), []).append(tr)
+
+    touched = 0
+    ordered = []
+    for texts in rows:
+        matches = existing.get(key(texts))
+        if matches:
+            ordered.append(matches.pop(0))
+        else:
+            # Built by the same helper as a fresh outline; the banding is set below
+            add_table_row(table, texts, 0, center_cols)
+            ordered.append(tbl.tr_lst[-1])
+            touched += 1
+
+    for leftovers in existing.values():
+        for tr in leftovers:
+            tbl.remove(tr)
+            touched += 1
+
+    for r_index, tr in enumerate(ordered):
+        tbl.append(tr)
+        if _set_row_color(tr, 'cccccc' if r_index % 2 == 0 else 'FFFFFF'):
+            touched += 1
+
+    return touched
+
+def _patch_paragraph(paragraph, lines):
+    """
+    Rewrites the trailing runs of a roster paragraph to `lines`. Any runs
+    ahead of them are headings, which never hold a colon; finding one
+    means the paragraph is laid out differently, and None is returned.
+    """
+    runs = paragraph.runs
+    lead = len(runs) - len(lines)
+    if lead < 0 or any(':' in run.text for run in runs[:lead]):
+        return None
+    touched = 0
+    for run, line in zip(runs[lead:], lines):
+        if run.text != line:
+            run.text = line
+            touched += 1
+    return touched
+
+def _patch_body(body, roster_content):
+    """
+    Patches the roster tables and paragraphs of an outline's body element
+    to match `roster_content`. Returns the number of rows and runs changed,
+    or None if the outline is laid out differently.
+    """
+    touched = 0
+    tables = {}
+    for tbl in body.iterchildren(qn('w:tbl')):
+        tables.setdefault(_texts(tbl.tr_lst[0])[0], tbl)
+    for title, (rows, center_cols) in roster_content.tables.items():
+        if title not in tables:
+            return None
+        touched += patch_table(Table(tables[title], None), rows, center_cols)
+
+    paragraphs = [Paragraph(p, None) for p in body.iterchildren(qn('w:p'))]
+    for start, lines in roster_content.paragraphs.items():
+        paragraph = next((p for p in paragraphs if p.runs and p.runs[0].text.startswith(start)), None)
+        changed = paragraph and _patch_paragraph(paragraph, lines)
+        if changed is None:
+            return None
+        touched += changed
+    return touched
+
+def patch_outline(docx_output_dir, name, active, staff, derived=None):
+    """
+    Patches one existing outline in place to match the roster. Only the
+    roster tables, officer lists and member counts in the document part are
+    edited, from the outline's roster content, without building the outline;
+    every other part (styles, headers, images) is copied over as it is, and
+    nothing is written if nothing changed. Typed notes are left alone. If
+    the existing file is laid out differently (hand-edited tables, an older
+    version) it is regenerated. Returns the number of rows and runs changed.
+    """
+    create, _, roster_content, uses_advisors = OUTLINES[name]
+    args = (active, staff, derived) if uses_advisors else (active,)
+
+    path = os.path.join(docx_output_dir, OUTLINE_FILES[name])
+    with zipfile.ZipFile(path) as zf:
+        document = parse_xml(zf.read(DOCUMENT_PART))
+    touched = _patch_body(document.find(qn('w:body')), roster_content(*args))
+    if touched is None:
+        create(docx_output_dir, *args)
+    elif touched:
+        replace_parts(path, {DOCUMENT_PART: serialize_part_xml(document)})
+    return touched
+
+def _roll_rows(grid):
+    """
+    Yields (block column, key, roll cell positions) for every data row of a
+    roster sheet given as {(row, column): value}, both 1-based. Roll columns
+    are learned from the nearest header row above in each block.
+    """
+    blocks = sorted(set(constants.table_positions.values()))
+    roll_cols = {block: [] for block in blocks}
+    for row in sorted({r for r, _ in grid}):
+        for block in blocks:
+            values = [grid.get((row, block + 1 + i)) for i in range(4)]
+            if all(v is None for v in values):
+                continue
+            if 'Opening Roll' in values or 'Roll' in values:
+                roll_cols[block] = [i for i, v in enumerate(values) if v in ('Opening Roll', 'Closing Roll', 'Roll')]
+                continue
+            key = tuple(v for i, v in enumerate(values) if i not in roll_cols[block])
+            yield block, key, [(row, block + 1 + i) for i in roll_cols[block]]
+
+def _sheet_grid(zf, sheet, strings_path):
+    """
+    Reads a sheet into {(row, column): value}, 1-based, leaving out blanks.
+    """
+    cells = {(row, col + 1): value for row, values in _xlsx_rows(zf, sheet) for col, value in values.items()}
+    strings = _shared_strings(zf, strings_path, {v[1] for v in cells.values() if isinstance(v, tuple)})
+    grid = {}
+    for position, value in cells.items():
+        if isinstance(value, tuple):
+            value = strings[value[1]]
+        if value is not None and value != '':
+            grid[position] = value
+    return grid
+
+def patch_roster(xlsx_output_dir, active, staff, derived=None):
+    """
+    Patches the newest sheet of the roster workbook (the last one, which
+    is the only one unless sheets were appended) to match the roster,
+    carrying over any roll marks already entered for members whose rows
+    still exist. Only that sheet, and the stylesheet if it lacks the roster
+    formats, is rewritten; every other sheet and part is copied over as it
+    is, and nothing is written if the sheet already matches. Returns the
+    number of cells changed.
+    """
+    output_path = os.path.join(xlsx_output_dir, ROSTER_FILENAME)
+    if not os.path.isfile(output_path):
+        create_roster(xlsx_output_dir, active, staff, derived)
+        return None
+
+    with zipfile.ZipFile(output_path) as zf:
+        sheets, strings_path = _xlsx_parts(zf)
+        sheet = sheets[-1]
+        old = _sheet_grid(zf, sheet, strings_path)
+        stylesheet = etree.fromstring(zf.read(STYLES_PART))
+
+    layout = plan_roster(active, staff, derived)
+    marks = {}
+    for block, key, cells in _roll_rows(old):
+        marks.setdefault((block, key), [old.get(c) for c in cells])
+    planned = {position: value for position, (value, _, _) in layout.cells.items() if value is not None and value != ''}
+    for block, key, cells in _roll_rows(planned):
+        for position, value in zip(cells, marks.get((block, key), ())):
+            _, bold, center = layout.cells.get(position, (None, False, True))
+            layout.cells[position] = (value, bold, center)
+
+    new = {position: value for position, (value, _, _) in layout.cells.items() if value is not None and value != ''}
+    touched = sum(old.get(position) != new.get(position) for position in old.keys() | new.keys())
+    if touched:
+        styles, styles_changed = _roster_styles(stylesheet)
+        parts = {sheet: layout.sheet_xml(styles)}
+        if styles_changed:
+            parts[STYLES_PART] = _xml_bytes(stylesheet)
+        replace_parts(output_path, parts)
+    return touched
+
+def patch_outputs(old_active_df, old_advisor_df, active_df, advisor_df, docx_output_dir='Minutes', xlsx_output_dir='Rosters'):
+    """
+    Updates previously generated outlines and the roster workbook to match a
+    new roster export without regenerating them. Returns the roster diff;
+    nothing is written when it is empty.
+    """
+    import pandas as pd
+
+    old_df = pd.concat([old_active_df, old_advisor_df]).drop_duplicates(NAME_COLUMNS)
+    new_df = pd.concat([active_df, advisor_df]).drop_duplicates(NAME_COLUMNS)
+    changes = diff_rosters(old_df, new_df)
+    if changes.empty:
+        return changes
+
+    outlines = [name for name, filename in OUTLINE_FILES.items() if os.path.isfile(os.path.join(docx_output_dir, filename))]
+    write(active_df, advisor_df, docx_output_dir, xlsx_output_dir, outputs=['roster'] + outlines, patch=True)
+    return changes
@@ -0,0 +1,89 @@
+from PyQt6.QtWidgets import QTabWidget, QTableView, QHeaderView
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from members import Table
+from export import EXPORT_TABLES
+
+class TableModel(QAbstractTableModel):
+    """
+    Read-only Qt model over a roster Table. Cells are formatted only when a
+    view asks for them, and rows are exposed in batches through fetchMore,
+    so only what is scrolled into view is ever materialized, however many
+    rows the table has.
+    """
+    BATCH_SIZE = 500
+
+    def __init__(self, table=None, parent=None):
+        super().__init__(parent)
+        self.set_table(table if table is not None else Table())
+
+    def set_table(self, table):
+        self.beginResetModel()
+        self._headers = [str(c) for c in table.columns]
+        self._rows = table.rows
+        self._total = len(table)
+        self._loaded = min(self._total, self.BATCH_SIZE)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.BATCH_SIZE, self._total - self._loaded)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return '' if value is None else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole and value in ('P', 'E'):
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+class RosterPreview(QTabWidget):
+    """
+    One tab per roster table, showing exactly what the roster workbook will list.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.models = {}
+        for name in EXPORT_TABLES:
+            model = TableModel(parent=self)
+            view = QTableView()
+            view.setModel(model)
+            view.setAlternatingRowColors(True)
+            # Fixed row heights let the view skip measuring rows it doesn't draw
+            view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            view.horizontalHeader().setStretchLastSection(True)
+            self.models[name] = model
+            self.addTab(view, name.title())
+
+    def show_tables(self, tables):
+        """
+        Loads the output of build_roster_tables into the tabs.
+        """
+        for i, (name, model) in enumerate(self.models.items()):
+            table = tables.get(name, Table())
+            model.set_table(table)
+            self.setTabText(i, f'{name.title()} ({len(table)})')
+
+    def clear_tables(self):
+        self.show_tables({})
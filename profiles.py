@@ -0,0 +1,37 @@
+import json
+from functools import lru_cache
+
+import constants
+
+# Module globals in constants.py that a chapter profile may override
+PROFILE_KEYS = ['officers', 'events', 'exec', 'advisors', 'table_positions', 'required_offices']
+
+DEFAULT_PROFILE = {key: getattr(constants, key) for key in PROFILE_KEYS}
+
+@lru_cache(maxsize=None)
+def _load_profile(path):
+    with open(path, encoding='utf-8') as f:
+        overrides = json.load(f)
+    unknown = set(overrides) - set(PROFILE_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown profile keys in {path}: {', '.join(sorted(unknown))}")
+    return json.dumps({**DEFAULT_PROFILE, **overrides})
+
+def load_profile(path=None):
+    """
+    Loads a chapter profile: a JSON object overriding any of PROFILE_KEYS.
+    Each file is parsed once per process; missing keys keep their defaults.
+    """
+    if path is None:
+        return dict(DEFAULT_PROFILE)
+    # Cached as JSON text so callers can't mutate the shared copy
+    return json.loads(_load_profile(path))
+
+def apply_profile(profile):
+    """
+    Makes `profile` the active chapter configuration for this process.
+    Everything reads these settings as constants.<name> when it runs, so
+    outputs generated after this call use the new values.
+    """
+    for key in PROFILE_KEYS:
+        setattr(constants, key, profile.get(key, DEFAULT_PROFILE[key]))
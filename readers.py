@@ -0,0 +1,317 @@
+import csv
+import zipfile
+import posixpath
+import itertools
+
+from lxml import etree
+
+# The only roster columns the generators use, and how to type them
+ROSTER_COLUMNS = ['Last Name', 'First Name', 'Current Office', 'Status']
+ROSTER_DTYPES = {'Last Name': str, 'First Name': str, 'Current Office': str, 'Status': 'category'}
+
+ROSTER_EXTENSIONS = ('.xlsx', '.csv', '.parquet')
+
+def _wanted(column):
+    return column in ROSTER_COLUMNS
+
+# Text columns are typed by the parsers themselves, which keep blanks as NaN
+TEXT_DTYPES = {c: t for c, t in ROSTER_DTYPES.items() if t is str}
+
+def _typed(df):
+    """
+    Orders the roster columns and makes the low-cardinality ones categorical.
+    Missing columns are left out rather than raising so validation can report them.
+    """
+    columns = [c for c in ROSTER_COLUMNS if c in df.columns]
+    return df[columns].astype({c: t for c, t in ROSTER_DTYPES.items() if c in columns and t == 'category'})
+
+# Exports often carry formatted but empty rows down to the end of the sheet;
+# this many blank rows in a row ends the roster. None reads every row.
+BLANK_ROWS_TO_STOP = 100
+
+XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+def _xlsx_parts(zf):
+    """
+    Returns the workbook's sheet paths, in tab order, and its shared strings path.
+    """
+    def resolve(target):
+        return target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+
+    rels = etree.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {r.get('Id'): r.get('Target') for r in rels.iter(PKG_REL)}
+    strings = [resolve(r.get('Target')) for r in rels.iter(PKG_REL) if r.get('Type', '').endswith('/sharedStrings')]
+    workbook = etree.fromstring(zf.read('xl/workbook.xml'))
+    sheets = [resolve(targets[sheet.get(REL_ID)]) for sheet in workbook.iter(XLSX_NS + 'sheet')]
+    return sheets, strings[0] if strings else None
+
+def _column_index(ref):
+    index = 0
+    for ch in ref:
+        if ch.isdigit():
+            break
+        index = index * 26 + ord(ch) - 64
+    return index - 1
+
+def _free(element):
+    # Drop parsed siblings so the tree never holds more than the current element
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+def _cell_value(c):
+    # Shared strings are returned as ('s', index) and resolved later
+    kind = c.get('t')
+    if kind == 'inlineStr':
+        return ''.join(t.text or '' for t in c.iter(XLSX_NS + 't'))
+    v = c.findtext(XLSX_NS + 'v')
+    if v is None:
+        return None
+    if kind == 's':
+        return ('s', int(v))
+    if kind == 'b':
+        return v == '1'
+    if kind in ('str', 'e'):
+        return v
+    return float(v)
+
+def _xlsx_rows(zf, sheet, columns=None):
+    """
+    Streams (row number, {column index: value}) from a sheet, decoding only
+    the cells in `columns` (every cell if None).
+    """
+    number = 0
+    with zf.open(sheet) as f:
+        for _, row in etree.iterparse(f, tag=XLSX_NS + 'row'):
+            number = int(row.get('r') or number + 1)
+            cells, col = {}, -1
+            for c in row.iterchildren(XLSX_NS + 'c'):
+                ref = c.get('r')
+                col = _column_index(ref) if ref else col + 1
+                if columns is None or col in columns:
+                    cells[col] = _cell_value(c)
+            _free(row)
+            yield number, cells
+
+def _shared_strings(zf, path, wanted):
+    """
+    Returns {index: text} for just the shared strings in `wanted`, reading
+    no further into the table than the last one needed.
+    """
+    strings = {}
+    if not wanted or path is None:
+        return strings
+    last = max(wanted)
+    with zf.open(path) as f:
+        for i, (_, si) in enumerate(etree.iterparse(f, tag=XLSX_NS + 'si')):
+            if i in wanted:
+                t = si.find(XLSX_NS + 't')
+                # Rich text is split into runs; phonetic hints (rPh) are not part of the text
+                strings[i] = (t.text or '') if t is not None else ''.join(
+                    r.text or '' for r in si.iterfind(f'{XLSX_NS}r/{XLSX_NS}t'))
+            _free(si)
+            if i >= last:
+                break
+    return strings
+
+def _text(value, strings):
+    # Same text pandas gives for a str-typed Excel column, with None for blanks
+    if isinstance(value, tuple):
+        value = strings[value[1]]
+    if value is None or value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _string_refs(values):
+    return {v[1] for v in values if isinstance(v, tuple)}
+
+def _find_header(zf, sheets, strings_path, max_rows=10):
+    """
+    Returns (sheet, header row number, {column name: index}) for the first
+    sheet with a 'Last Name' header in its first rows. Membership exports
+    usually, but not always, put a banner row above the header.
+    """
+    for sheet in sheets:
+        rows = _xlsx_rows(zf, sheet)
+        head = list(itertools.islice(rows, max_rows))
+        rows.close()
+        strings = _shared_strings(zf, strings_path, _string_refs(v for _, cells in head for v in cells.values()))
+        for number, cells in head:
+            header = {col: str(_text(v, strings)).strip() for col, v in cells.items()}
+            if 'Last Name' in header.values():
+                positions = {}
+                for col, name in sorted(header.items()):
+                    if _wanted(name) and name not in positions:
+                        positions[name] = col
+                return sheet, number, positions
+    return None, None, {}
+
+def read_xlsx_columns(path, blank_rows_to_stop=BLANK_ROWS_TO_STOP):
+    """
+    Streams the roster sheet straight from the package, decoding only the
+    cells of the ROSTER_COLUMNS (found by name in the header row), so time
+    and memory follow the columns used rather than the size of the export.
+    Reading stops at the first long run of empty rows. Returns
+    {column: list of text or None}.
+    """
+    with zipfile.ZipFile(path) as zf:
+        sheets, strings_path = _xlsx_parts(zf)
+        sheet, header_row, positions = _find_header(zf, sheets, strings_path)
+        if not positions:
+            return {}
+
+        columns = {name: [] for name in positions}
+        blank, previous = 0, header_row
+        for number, cells in _xlsx_rows(zf, sheet, set(positions.values())):
+            if number <= header_row:
+                continue
+            # Empty rows are usually left out of the sheet altogether
+            blank += number - previous - 1
+            previous = number
+            if blank_rows_to_stop is not None and blank >= blank_rows_to_stop:
+                break
+            if all(cells.get(col) in (None, '') for col in positions.values()):
+                blank += 1
+                if blank_rows_to_stop is not None and blank >= blank_rows_to_stop:
+                    break
+                continue
+            # Blank rows inside the roster are kept, as pd.read_excel would
+            for name, col in positions.items():
+                columns[name].extend([None] * blank)
+                columns[name].append(cells.get(col))
+            blank = 0
+
+        strings = _shared_strings(zf, strings_path, _string_refs(v for values in columns.values() for v in values))
+
+    return {name: [_text(v, strings) for v in columns[name]] for name in ROSTER_COLUMNS if name in columns}
+
+def read_xlsx_roster(path, blank_rows_to_stop=BLANK_ROWS_TO_STOP):
+    import pandas as pd
+
+    # Built per column with the parser dtypes, so blanks become NaN
+    return _typed(pd.DataFrame({
+        name: pd.Series(values, dtype=TEXT_DTYPES.get(name, object))
+        for name, values in read_xlsx_columns(path, blank_rows_to_stop).items()
+    }))
+
+def _csv_header_row(path, max_rows=10):
+    """
+    Finds the header line of a CSV export, which may or may not have a banner row above it.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for i, row in enumerate(csv.reader(f)):
+            if i >= max_rows:
+                break
+            if 'Last Name' in (cell.strip() for cell in row):
+                return i
+    return 0
+
+# Cells pandas reads as missing by default
+CSV_NA_VALUES = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+}
+
+def read_csv_columns(path):
+    """
+    Reads the ROSTER_COLUMNS of a CSV export with the csv module, treating
+    blanks the way pd.read_csv does. Returns {column: list of text or None}.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = csv.reader(f)
+        header = next(itertools.islice(rows, _csv_header_row(path), None), [])
+        positions = {}
+        for i, name in enumerate(header):
+            if _wanted(name) and name not in positions:
+                positions[name] = i
+        columns = {name: [] for name in positions}
+        for row in rows:
+            if not row:
+                continue  # pd.read_csv skips blank lines
+            for name, i in positions.items():
+                value = row[i] if i < len(row) else None
+                columns[name].append(None if value in CSV_NA_VALUES else value)
+    return {name: columns[name] for name in ROSTER_COLUMNS if name in columns}
+
+def read_csv_roster(path):
+    import pandas as pd
+
+    return _typed(pd.read_csv(
+        path, header=_csv_header_row(path), usecols=_wanted, dtype=TEXT_DTYPES, encoding='utf-8-sig'
+    ))
+
+def read_parquet_columns(path):
+    import pyarrow.parquet as pq
+
+    names = pq.ParquetFile(path).schema_arrow.names
+    return pq.read_table(path, columns=[c for c in ROSTER_COLUMNS if c in names]).to_pydict()
+
+def read_parquet_roster(path):
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    names = pq.ParquetFile(path).schema_arrow.names
+    return _typed(pd.read_parquet(path, columns=[c for c in ROSTER_COLUMNS if c in names]))
+
+# (format, test on the first bytes of the file); the first match wins, CSV is the fallback
+SNIFFERS = [
+    ('xlsx', lambda head: head.startswith(b'PK\x03\x04')),
+    ('parquet', lambda head: head.startswith(b'PAR1')),
+]
+
+READERS = {
+    'xlsx': read_xlsx_roster,
+    'parquet': read_parquet_roster,
+    'csv': read_csv_roster,
+}
+
+# The same formats read without pandas, as {column: values}
+COLUMN_READERS = {
+    'xlsx': read_xlsx_columns,
+    'parquet': read_parquet_columns,
+    'csv': read_csv_columns,
+}
+
+def register_reader(fmt, reader, sniff=None):
+    """
+    Adds a roster format. `reader(path)` must return a DataFrame with the
+    ROSTER_COLUMNS it found; `sniff(head)` recognizes the format from its first bytes.
+    """
+    READERS[fmt] = reader
+    COLUMN_READERS.pop(fmt, None)
+    if sniff is not None:
+        SNIFFERS.insert(0, (fmt, sniff))
+
+def sniff_format(path):
+    """
+    Detects a roster file's format from its content rather than its extension.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(8)
+    for fmt, sniff in SNIFFERS:
+        if sniff(head):
+            return fmt
+    return 'csv'
+
+def read_roster(path):
+    """
+    Reads a roster export in any registered format into a DataFrame holding
+    just the ROSTER_COLUMNS present, typed per ROSTER_DTYPES.
+    """
+    return READERS[sniff_format(path)](path)
+
+def read_roster_columns(path):
+    """
+    Reads a roster export into {column: list of values} for just the
+    ROSTER_COLUMNS present, with None for blanks. The built-in formats are
+    read without pandas; other registered formats go through their reader.
+    """
+    fmt = sniff_format(path)
+    if fmt in COLUMN_READERS:
+        return COLUMN_READERS[fmt](path)
+    df = READERS[fmt](path)
+    return {c: [None if blank else v for v, blank in zip(df[c].tolist(), df[c].isna().tolist())] for c in df.columns}
@@ -0,0 +1,200 @@
+import io
+import os
+import re
+import argparse
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from docx import Document
+
+from utils import *
+import constants
+from constants import *
+from ooxml import ZIP_DATE_TIME, RawZipWriter, compressed_part, _entry_order
+
+FIELD = re.compile(rb'\{\{(\w+)\}\}')
+
+# Paragraphs marking the part of the template repeated once per office held
+BLOCK_START, BLOCK_END = '{{#OFFICE}}', '{{/OFFICE}}'
+BLOCK = re.compile(
+    rb'(<w:p\b(?:(?!<w:p\b).)*?' + re.escape(BLOCK_START.encode()) + rb'.*?</w:p>)'
+    rb'(.*?)'
+    rb'(<w:p\b(?:(?!<w:p\b).)*?' + re.escape(BLOCK_END.encode()) + rb'.*?</w:p>)',
+    re.DOTALL
+)
+
+REPORT_SECTIONS = ['Activities Since Last Meeting', 'Upcoming', 'Motions and Requests for the Chapter']
+BATCH_SIZE = 200
+
+def build_report_template():
+    """
+    Builds the officer report stub once, in the outlines' styling, with
+    {{NAME}}, {{OFFICES}} and {{OFFICE}} fields for the mail merge.
+    """
+    doc = Document()
+    add_header(doc, 'Officer Report\nDate', False)
+
+    title = doc.add_paragraph()
+    for text, size, bold in [('Phi Kappa Sigma\n', 26, True), ('Alpha Epsilon\n', 20, True), ('Officer Report', 14, False)]:
+        set_font(title.add_run(text), 'Times New Roman', size, bold)
+    insertHR(title)
+
+    officer = doc.add_paragraph()
+    set_font(officer.add_run('{{NAME}}\n'), 'Times New Roman', 12)
+    insertHR(officer, 'top')
+    set_font(officer.add_run('{{OFFICES}}'), 'Times New Roman', 11)
+    insertHR(officer)
+
+    doc.add_paragraph(BLOCK_START)
+    heading = doc.add_paragraph()
+    set_font(heading.add_run(f'{{{{OFFICE}}}} Report {emDash}'), 'Times New Roman', 14, True)
+    for section in REPORT_SECTIONS:
+        add_bullet_section(doc, section, [''])
+    doc.add_paragraph(BLOCK_END)
+
+    set_document_font(doc, font_name='Calibri')
+    return doc
+
+def _compile_fields(xml):
+    # b'a{{X}}b' -> ([b'a', b'b'], ['X']), so filling is a single join
+    pieces = FIELD.split(xml)
+    return pieces[0::2], [f.decode() for f in pieces[1::2]]
+
+def _fill(compiled, values):
+    literals, fields = compiled
+    out = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        out.append(values[field])
+        out.append(literal)
+    return b''.join(out)
+
+def compile_template(doc=None):
+    """
+    Saves the template once and splits its document.xml into literal byte
+    chunks and fields, around the per-office block. Every other part of the
+    package is kept compressed and copied verbatim into each stub.
+    """
+    doc = doc or build_report_template()
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as zf:
+        parts = {name: zf.read(name) for name in sorted(zf.namelist(), key=_entry_order)}
+
+    match = BLOCK.search(parts['word/document.xml'])
+    if match is None:
+        raise ValueError("Report template has no per-office block")
+    xml = parts.pop('word/document.xml')
+    return {
+        # Deflated once here; every stub copies these entries as they are
+        'parts': {name: compressed_part(data, cache_dir=None) for name, data in parts.items()},
+        'head': _compile_fields(xml[:match.start()]),
+        'block': _compile_fields(match.group(2)),
+        'tail': _compile_fields(xml[match.end():]),
+    }
+
+def render_stub(template, name, offices):
+    """
+    Returns the document.xml of one officer's stub: the head once and the
+    per-office block once for each office held.
+    """
+    fields = {'NAME': escape(name).encode(), 'OFFICES': escape(' / '.join(offices)).encode()}
+    body = [_fill(template['head'], fields)]
+    for office in offices:
+        body.append(_fill(template['block'], {**fields, 'OFFICE': escape(office).encode()}))
+    body.append(_fill(template['tail'], fields))
+    return b''.join(body)
+
+def write_stub(template, path, name, offices):
+    with RawZipWriter(path, ZIP_DATE_TIME) as writer:
+        for part_name in sorted([*template['parts'], 'word/document.xml'], key=_entry_order):
+            if part_name == 'word/document.xml':
+                writer.write(part_name, render_stub(template, name, offices))
+            else:
+                writer.write_compressed(part_name, *template['parts'][part_name])
+
+def office_holders(active_df):
+    """
+    One row per active member holding at least one office, with the offices
+    they hold in the order of `officers`.
+    """
+    offices = active_df['Current Office'].dropna().str.split('/').explode().str.strip()
+    offices = offices[offices.isin(constants.officers)]
+    rank = {o: i for i, o in enumerate(constants.officers)}
+    held = (offices.to_frame('Office')
+                   .assign(rank=offices.map(rank))
+                   .sort_values('rank', kind='stable')
+                   .groupby(level=0)['Office'].agg(list))
+    holders = active_df.loc[held.index, ['Last Name', 'First Name']].assign(Offices=held)
+    return holders.sort_values(['Last Name', 'First Name'], kind='stable').reset_index(drop=True)
+
+def _file_name(name, offices, number=1):
+    # Keep only characters every filesystem accepts
+    suffix = f' ({number})' if number > 1 else ''
+    return re.sub(r'[\\/:*?"<>|]', '', f"{'-'.join(offices)} Report - {name}{suffix}.docx")
+
+def stub_jobs(active_df, output_dir):
+    """
+    Lists (path, name, offices) for every office holder in a roster.
+    Holders with the same name and offices get numbered file names,
+    'Alpha Report - Ann Smith (2).docx', instead of sharing one.
+    """
+    holders = office_holders(active_df)
+    names = holders['First Name'].astype(str) + ' ' + holders['Last Name'].astype(str)
+    jobs, taken = [], set()
+    for name, offices in zip(names, holders['Offices']):
+        number = 1
+        # Compared case-insensitively, as Windows and macOS file names are
+        while _file_name(name, offices, number).lower() in taken:
+            number += 1
+        file_name = _file_name(name, offices, number)
+        taken.add(file_name.lower())
+        jobs.append((os.path.join(output_dir, file_name), name, offices))
+    return jobs
+
+_worker_template = None
+
+def _init_worker(template):
+    global _worker_template
+    _worker_template = template
+
+def _write_batch(jobs):
+    for path, name, offices in jobs:
+        write_stub(_worker_template, path, name, offices)
+    return len(jobs)
+
+def generate_report_stubs(jobs, workers=None, batch_size=BATCH_SIZE):
+    """
+    Writes every stub in `jobs` (see stub_jobs). The template is compiled once
+    and handed to each worker process, which then fills batches of stubs.
+    Returns the number of stubs written.
+    """
+    template = compile_template()
+    for directory in {os.path.dirname(path) for path, _, _ in jobs}:
+        os.makedirs(directory or '.', exist_ok=True)
+
+    batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+    if workers == 1 or len(batches) <= 1:
+        _init_worker(template)
+        return sum(map(_write_batch, batches))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(template,)) as pool:
+        return sum(pool.map(_write_batch, batches))
+
+if __name__ == "__main__":
+    from generator import read, print_warnings
+
+    parser = argparse.ArgumentParser(description="Generate a report stub for every officer in one or more rosters.")
+    parser.add_argument('rosters', nargs='+', help="Roster files")
+    parser.add_argument('--output', default='Reports', help="Output folder (one subfolder per roster when several are given)")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes")
+    args = parser.parse_args()
+
+    jobs = []
+    for roster_file in args.rosters:
+        output_dir = args.output
+        if len(args.rosters) > 1:
+            output_dir = os.path.join(output_dir, os.path.splitext(os.path.basename(roster_file))[0])
+        active_df, _ = print_warnings(read(roster_file))
+        jobs += stub_jobs(active_df, output_dir)
+
+    print(f"Wrote {generate_report_stubs(jobs, args.workers)} report stub(s).")
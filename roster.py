@@ -1,261 +1,566 @@
+import io
 import os
-
-from openpyxl import load_workbook
+import zlib
+import zipfile
+from datetime import date
+from functools import cached_property, lru_cache
+from xml.sax.saxutils import escape, quoteattr
+
+from lxml import etree
+from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.packaging.core import DocumentProperties
+from openpyxl.xml.functions import tostring
 from openpyxl.styles import Font, Alignment
 
-from constants import *
-from utils import * 
+import constants
+from utils import *
+from members import *
+from ooxml import RawZipWriter, compressed_part, replace_parts
+
+ROLL_VALUES = ("P", "E")
+
+BOLD = Font(bold=True)
+CENTER = Alignment(horizontal="center")
+
+ROSTER_FILENAME = 'Officer Roster and Minutes Rosters.xlsx'
+
+SHEET_PART = 'xl/worksheets/sheet1.xml'
+CORE_PART = 'docProps/core.xml'
+WORKBOOK_PART = 'xl/workbook.xml'
+WORKBOOK_RELS_PART = 'xl/_rels/workbook.xml.rels'
+STYLES_PART = 'xl/styles.xml'
+CONTENT_TYPES_PART = '[Content_Types].xml'
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+CONTENT_TYPES_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+WORKSHEET_REL_TYPE = REL_NS + '/worksheet'
+WORKSHEET_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'
 
-def create_table(writer, df, start_row, start_column, title, sheet_name="Sheet1"):
+
+@lru_cache(maxsize=1)
+def _workbook_template():
     """
-    Inserts a DataFrame into an Excel worksheet at a specified location.
-    Optionally adds a title row and a formatted header row for roll tracking.
+    Saves an empty roster workbook through openpyxl once per process, with
+    one cell in each (bold, centered) combination so the stylesheet defines
+    every format the roster uses. Returns the compressed parts in archive
+    order and the format index of each combination.
     """
-    # Write the DataFrame into the sheet starting from the specified row/column, skipping index and header
-    df.to_excel(writer, sheet_name=sheet_name, startrow=start_row + 2, startcol=start_column, index=False, header=False)
-    ws = writer.sheets[sheet_name]
-
-    if title:
-        # Format and center the title across the top of the table
-        col_letter_start = get_column_letter(start_column + 1)
-        col_letter_end = get_column_letter(start_column + len(df.columns))
-        title_cell = ws.cell(row=start_row + 1, column=start_column + 1)
-        title_cell.value = title
-        title_cell.font = Font(bold=True)
-        title_cell.alignment = Alignment(horizontal="center")
-        ws.merge_cells(f"{col_letter_start}{start_row + 1}:{col_letter_end}{start_row + 1}")
-
-    # Create and format the header row
-    header_row = start_row + 2
-    ws.cell(row=header_row, column=start_column + 1).value = "Officers"
-    ws.merge_cells(start_row=header_row, start_column=start_column + 1, end_row=header_row, end_column=start_column + 2)
-    ws.cell(row=header_row, column=start_column + 3).value = "Opening Roll"
-    ws.cell(row=header_row, column=start_column + 4).value = "Closing Roll"
-
-    for col_offset in range(4):
-        cell = ws.cell(row=header_row, column=start_column + 1 + col_offset)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="center")
-
-    # Center align values such as "P" or "E" (for Present/Excused)
-    for row in ws.iter_rows(
-        min_row=header_row + 1,
-        max_row=header_row + 1 + len(df),
-        min_col=start_column + 1,
-        max_col=start_column + 4,
-    ):
-        for cell in row:
-            if cell.value in ("P", "E"):
-                cell.alignment = Alignment(horizontal="center")
-
-    # Auto-fit the column widths for readability
-    auto_adjust_column_widths(ws, df, start_row, start_column)
-
-
-def create_segmented_table(writer, segments, start_row, start_col, title=None, sheet_name="Sheet1"):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Sheet1'
+    styles = {(False, False): 0}
+    for row, (bold, centered) in enumerate([(True, True), (False, True), (True, False)], 1):
+        cell = ws.cell(row=row, column=1)
+        if bold:
+            cell.font = BOLD
+        if centered:
+            cell.alignment = CENTER
+        styles[(bold, centered)] = cell.style_id
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    with zipfile.ZipFile(buffer) as zf:
+        parts = [(name, compressed_part(zf.read(name), cache_dir=None)) for name in zf.namelist()]
+    return parts, styles
+
+
+def _cell_xml(ref, value, style):
+    s = f' s="{style}"' if style else ''
+    if value is None:
+        return f'<c r="{ref}"{s}/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{s} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{s} t="n"><v>{value!r}</v></c>'
+    value = str(value)
+    if ILLEGAL_CHARACTERS_RE.search(value):
+        raise IllegalCharacterError(f"{value!r} cannot be used in worksheets.")
+    space = ' xml:space="preserve"' if value != value.strip() else ''
+    return f'<c r="{ref}"{s} t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>'
+
+
+class RosterLayout:
     """
-    Writes multiple dataframes into a single worksheet, one after another, 
-    each optionally with a title and merged headers based on column names.
+    Plans a roster sheet up front: every cell value and style, merged range and
+    final column width is computed from the tables before anything is written,
+    so the sheet can be emitted in a single pass without reading cells back.
     """
-    # Ensure the sheet exists
-    ws = writer.sheets.get(sheet_name)
-    if not ws:
-        pd.DataFrame().to_excel(writer, sheet_name=sheet_name, index=False)
-        ws = writer.sheets[sheet_name]
-
-    current_row = start_row + 1
-
-    for segment_title, df, headers in segments:
-        if df.empty:
-            continue  # Skip empty tables
-
-        if segment_title:
-            # Merge cells and insert the segment title
-            col_start = get_column_letter(start_col + 1)
-            col_end = get_column_letter(start_col + len(headers))
-            ws.merge_cells(f"{col_start}{current_row}:{col_end}{current_row}")
-            cell = ws.cell(row=current_row, column=start_col + 1)
-            cell.value = segment_title
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
-            current_row += 1
-
-        # Normalize headers for comparison
-        normalized_headers = [h.strip().lower() for h in headers]
-
-        # Handle common header patterns with merged cells
-        if normalized_headers == ["officers", "full name", "opening roll", "closing roll"]:
-            ws.merge_cells(start_row=current_row, start_column=start_col + 1, end_row=current_row, end_column=start_col + 2)
-            ws.merge_cells(start_row=current_row, start_column=start_col + 3, end_row=current_row, end_column=start_col + 4)
-            ws.cell(row=current_row, column=start_col + 1, value="Officers").font = Font(bold=True)
-            ws.cell(row=current_row, column=start_col + 1).alignment = Alignment(horizontal="center")
-            ws.cell(row=current_row, column=start_col + 3, value="Roll").font = Font(bold=True)
-            ws.cell(row=current_row, column=start_col + 3).alignment = Alignment(horizontal="center")
-            current_row += 1
-
-        elif normalized_headers == ["officers", "full name", "roll"] or normalized_headers == ["others", "roll"]:
-            ws.merge_cells(start_row=current_row, start_column=start_col + 1, end_row=current_row, end_column=start_col + 2)
-            ws.cell(row=current_row, column=start_col + 1, value=headers[0]).font = Font(bold=True)
-            ws.cell(row=current_row, column=start_col + 1).alignment = Alignment(horizontal="center")
-            ws.cell(row=current_row, column=start_col + 3, value="Roll").font = Font(bold=True)
-            ws.cell(row=current_row, column=start_col + 3).alignment = Alignment(horizontal="center")
-            current_row += 1
-
-        # Write the actual column headers 
-        # TODO: Enable some check so Events, Finance, IOC, and Bylaws don't get double headers
-        for i, label in enumerate(headers):
-            cell = ws.cell(row=current_row, column=start_col + 1 + i)
-            cell.value = label
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
-        current_row += 1
-
-        # Write the data rows, aligning "P"/"E" to center
-        for row_values in df.values:
-            for i, value in enumerate(row_values):
-                cell = ws.cell(row=current_row, column=start_col + 1 + i)
-                cell.value = value
-                if value in ("P", "E"):
-                    cell.alignment = Alignment(horizontal="center")
+    def __init__(self):
+        self.cells = {}     # (row, column) -> (value, bold, center), 1-based
+        self.merges = []    # (start_row, start_column, end_row, end_column)
+        self.widths = {}    # column -> width
+
+    def put(self, row, column, value=None, bold=False, center=False):
+        self.cells[(row, column)] = (value, bold, center)
+
+    def merge(self, start_row, start_column, end_row, end_column):
+        self.merges.append((start_row, start_column, end_row, end_column))
+
+    def autofit(self, table, start_row, start_column):
+        """
+        Sizes the table's columns to the longest value planned so far in rows
+        start_row + 1 through start_row + len(table.rows) + 2, plus 7. Each
+        call overwrites the widths of its columns, so the last table planned
+        in a column sets it, as the sheet has always been sized.
+        """
+        covered = set()
+        for start_r, start_c, end_r, end_c in self.merges:
+            covered.update((r, c) for r in range(start_r, end_r + 1) for c in range(start_c, end_c + 1))
+            covered.discard((start_r, start_c))
+
+        rows = range(start_row + 1, start_row + len(table.rows) + 3)
+        for column in range(start_column + 1, start_column + len(table.columns) + 1):
+            values = [self.cells.get((row, column), (None,))[0] for row in rows if (row, column) not in covered]
+            self.widths[column] = max((len(str(v)) for v in values if v), default=0) + 7
+
+    def put_rows(self, table, row, column):
+        """
+        Places the table's rows with its first row at `row`, centering
+        roll marks, and returns the row after the last one.
+        """
+        for values in table.rows:
+            for i, value in enumerate(values):
+                self.put(row, column + i, value, center=value in ROLL_VALUES)
+            row += 1
+        return row
+
+    def add_table(self, table, start_row, start_column, title):
+        """
+        Plans a roll table: optional merged title, an 'Officers' header merged
+        over the first two columns, then the rows. Columns are 0-based.
+        """
+        first = start_column + 1
+        if title:
+            self.merge(start_row + 1, first, start_row + 1, start_column + len(table.columns))
+            self.put(start_row + 1, first, title, bold=True, center=True)
+
+        header_row = start_row + 2
+        self.merge(header_row, first, header_row, first + 1)
+        self.put(header_row, first, "Officers", bold=True, center=True)
+        self.put(header_row, first + 1, bold=True, center=True)
+        self.put(header_row, first + 2, "Opening Roll", bold=True, center=True)
+        self.put(header_row, first + 3, "Closing Roll", bold=True, center=True)
+
+        self.put_rows(table, header_row + 1, first)
+        self.autofit(table, start_row, start_column)
+
+    def add_segmented_table(self, segments, start_row, start_col):
+        """
+        Plans several (title, table, headers) segments stacked one after
+        another, skipping empty ones. Returns the row after the last segment.
+        """
+        current_row = start_row + 1
+        first = start_col + 1
+
+        for segment_title, table, headers in segments:
+            if table.empty:
+                continue  # Skip empty tables
+
+            if segment_title:
+                self.merge(current_row, first, current_row, start_col + len(headers))
+                self.put(current_row, first, segment_title, bold=True, center=True)
+                current_row += 1
+
+            # Handle common header patterns with merged cells
+            normalized_headers = [h.strip().lower() for h in headers]
+            if normalized_headers == ["officers", "full name", "opening roll", "closing roll"]:
+                self.merge(current_row, first, current_row, first + 1)
+                self.merge(current_row, first + 2, current_row, first + 3)
+                self.put(current_row, first, "Officers", bold=True, center=True)
+                self.put(current_row, first + 2, "Roll", bold=True, center=True)
+                current_row += 1
+
+            elif normalized_headers == ["officers", "full name", "roll"] or normalized_headers == ["others", "roll"]:
+                self.merge(current_row, first, current_row, first + 1)
+                self.put(current_row, first, headers[0], bold=True, center=True)
+                self.put(current_row, first + 2, "Roll", bold=True, center=True)
+                current_row += 1
+
+            # TODO: Enable some check so Events, Finance, IOC, and Bylaws don't get double headers
+            for i, label in enumerate(headers):
+                self.put(current_row, first + i, label, bold=True, center=True)
             current_row += 1
 
-        auto_adjust_column_widths(ws, df, start_row, start_col)
-
-    return current_row
+            current_row = self.put_rows(table, current_row, first)
+            self.autofit(table, start_row, start_col)
+
+        return current_row
+
+    def sheet_xml(self, styles):
+        """
+        Renders the planned layout as the worksheet XML openpyxl would write
+        for it, each cell naming one of the stylesheet's formats by index
+        (`styles` maps (bold, centered) to the index).
+        """
+        covered = set()
+        rows = [r for r, _ in self.cells] + [m[2] for m in self.merges]
+        columns = [c for _, c in self.cells] + [m[3] for m in self.merges]
+        for start_row, start_column, end_row, end_column in self.merges:
+            covered.update((r, c) for r in range(start_row, end_row + 1) for c in range(start_column, end_column + 1))
+            covered.discard((start_row, start_column))
+
+        letters = {c: get_column_letter(c) for c in set(columns)}
+        out = ['<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+               '<sheetPr><outlinePr summaryBelow="1" summaryRight="1"/><pageSetUpPr/></sheetPr>']
+        if rows:
+            out.append(f'<dimension ref="A1:{letters[max(columns)]}{max(rows)}"/>')
+        out.append('<sheetViews><sheetView workbookViewId="0"><selection activeCell="A1" sqref="A1"/></sheetView></sheetViews>'
+                   '<sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>')
+        if self.widths:
+            out.append('<cols>')
+            out.extend(f'<col width="{width}" customWidth="1" min="{column}" max="{column}"/>'
+                       for column, width in sorted(self.widths.items()))
+            out.append('</cols>')
+
+        out.append('<sheetData>')
+        current = None
+        for (row, column), (value, bold, centered) in sorted(self.cells.items()):
+            style = styles[(bool(bold), bool(centered))]
+            if (row, column) in covered or value == '':
+                value = None  # Merged placeholders keep only their style
+            if value is None and not style:
+                continue
+            if row != current:
+                out.append(f'</row><row r="{row}">' if current else f'<row r="{row}">')
+                current = row
+            out.append(_cell_xml(f'{letters[column]}{row}', value, style))
+        if current:
+            out.append('</row>')
+        out.append('</sheetData>')
+
+        if self.merges:
+            out.append(f'<mergeCells count="{len(self.merges)}">')
+            out.extend(f'<mergeCell ref="{letters.setdefault(sc, get_column_letter(sc))}{sr}:{letters[ec]}{er}"/>'
+                       for sr, sc, er, ec in self.merges)
+            out.append('</mergeCells>')
+        out.append('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/></worksheet>')
+        return ''.join(out).encode('utf-8')
+
+    def save(self, path, title='Sheet1'):
+        """
+        Writes the planned sheet as a complete workbook. The stylesheet and
+        the other fixed parts come from _workbook_template, already
+        compressed; only the sheet is rendered, straight from the plan,
+        without building a worksheet cell by cell.
+        """
+        parts, styles = _workbook_template()
+        with RawZipWriter(path) as writer:
+            for name, part in parts:
+                if name == SHEET_PART:
+                    writer.write(name, self.sheet_xml(styles))
+                elif name == CORE_PART:
+                    writer.write(name, tostring(DocumentProperties().to_tree()))
+                elif name == WORKBOOK_PART and title != 'Sheet1':
+                    xml = zlib.decompress(part[2], -15)
+                    writer.write(name, xml.replace(b'name="Sheet1"', f'name={quoteattr(title)}'.encode('utf-8'), 1))
+                else:
+                    writer.write_compressed(name, *part)
 
 
 def create_segment(*args, titles=None):
     """
-    Creates a standardized list of (title, dataframe, headers) segments for table generation.
+    Creates a standardized list of (title, table, headers) segments for table generation.
     """
     segments = []
     titles = titles or [""] * len(args)
 
-    for i, df in enumerate(args):
-        if not isinstance(df, pd.DataFrame):
-            raise ValueError(f"Expected DataFrame, got {type(df)}")
+    for i, table in enumerate(args):
+        if not isinstance(table, Table):
+            raise ValueError(f"Expected Table, got {type(table)}")
         title = titles[i] if i < len(titles) else ""
-        headers = list(df.columns)
-        segments.append((title, df, headers))
+        headers = list(table.columns)
+        segments.append((title, table, headers))
 
     return segments
 
 
-def create_new_members_df(count=6):
+def create_new_members_table(count=6):
     """
-    Returns a new DataFrame template for new members with default roll values.
+    Returns a blank table for new members with default roll values.
     """
-    return pd.DataFrame([{
-        "Last Name": "",
-        "First Name": "",
-        "Opening Roll": "P",
-        "Closing Roll": "P"
-    } for _ in range(count)])
+    return Table(["Last Name", "First Name", "Opening Roll", "Closing Roll"], [("", "", "P", "P")] * count)
 
 
-def create_others_df(count=4):
+def create_others_table(count=4):
     """
-    Returns a DataFrame for non-members with a combined 'Others' name field and roll status.
+    Returns a blank table for non-members with a combined 'Others' name field and roll status.
     """
-    df = pd.DataFrame([{
-        "Last Name": "",
-        "First Name": "",
-        "Roll": "P"
-    } for _ in range(count)])
-    
-    return df.assign(Others=df["Last Name"] + " " + df["First Name"])[["Others", "Roll"]]
+    return Table(["Others", "Roll"], [(" ", "P")] * count)
 
 
-def process_advisors(df):
+def create_role_table(active, roles):
     """
-    Processes an advisor DataFrame and returns a formatted version
-    with roll assignments and staff roles sorted by defined rank.
+    Lists every office in `roles` held by an active member, with roll values,
+    ordered by the first matching entry in `roles` and then by roster order.
     """
-    return (
-        df.assign(
-            Chapter_Staff=df["First Name"] + " " + df["Last Name"],
-            Opening_Roll=df["Current Office"].apply(
-                lambda x: "E" if x in ["Chapter Advisor", "Asst. Chapter Advisor"] else "P"
-            ),
-            Closing_Roll=lambda d: d["Opening_Roll"],
-            Role=df["Current Office"],
-            Rank=df["Current Office"].apply(
-                lambda role: next((i for i, r in enumerate(advisors) if r.lower() == role.lower()), len(advisors))
-            )
-        )
-        .sort_values("Rank")
-        .loc[:, ["Chapter_Staff", "Opening_Roll", "Closing_Roll", "Role"]]
-        .rename(columns={
-            "Chapter_Staff": "Chapter Staff",
-            "Opening_Roll": "Opening Roll",
-            "Closing_Roll": "Closing Roll"
-        })
+    rank = {}
+    for i, role in enumerate(roles):
+        rank.setdefault(role.lower(), i)
+
+    # One entry per office held, in roster order ('Alpha/Beta' -> 'Alpha', 'Beta')
+    held = [(position, member) for member in active for position in member.positions if position.lower() in rank]
+    if not held:
+        return Table()
+    held.sort(key=lambda item: rank[item[0].lower()])
+    return Table(
+        ["Officers", "Full Name", "Opening Roll", "Closing Roll"],
+        [(position, member.name, "P", "P") for position, member in held]
     )
 
 
-def create_brothers_df(active_df):
+def process_advisors(staff):
     """
-    Filters out officer rows and prepares a table for non-officer brothers with roll statuses.
+    Lists the chapter staff with roll assignments, sorted by their role's
+    rank in `advisors` (unknown roles last).
     """
-    df = active_df[~active_df['Current Office'].str.contains('|'.join(officers), na=False)].copy()
-    return df.assign(
-        Brothers=df["Last Name"],
-        **{"Opening Roll": "P", "Closing Roll": "P"}
-    )[["Brothers", "First Name", "Opening Roll", "Closing Roll"]]
+    rank = {}
+    for i, role in enumerate(constants.advisors):
+        rank.setdefault(role.lower(), i)
+
+    rows = []
+    for member in sorted(staff, key=lambda m: rank.get(m.office.lower(), len(constants.advisors))):
+        roll = "E" if member.office in ["Chapter Advisor", "Asst. Chapter Advisor"] else "P"
+        name = None if member.first_name is None or member.last_name is None else member.name
+        rows.append((name, roll, roll, member.office))
+    return Table(["Chapter Staff", "Opening Roll", "Closing Roll", "Role"], rows)
 
 
-def create_roster(writer, xlsx_output_dir, active_df, advisor_df):
+def create_brothers_table(active):
     """
-    Orchestrates the creation and formatting of an Excel workbook roster.
-    It includes executive officers, advisors, members, and committee tables.
+    Lists the non-officer brothers in roster order with roll statuses.
+    """
+    return Table(
+        ["Brothers", "First Name", "Opening Roll", "Closing Roll"],
+        [(m.last_name, m.first_name, "P", "P") for m in without_offices(active, constants.officers)]
+    )
+
+
+class DerivedTables:
+    """
+    Tables derived from the roster, each computed on first use and then shared
+    between outputs, so a run only builds the tables its outputs actually need.
+    Takes Member lists or DataFrames (converted once here).
+    """
+    def __init__(self, active, staff):
+        self.active = as_members(active)
+        self.staff = as_members(staff)
+        self._role_tables = {}
+
+    def roles(self, roles):
+        key = tuple(roles)
+        if key not in self._role_tables:
+            self._role_tables[key] = create_role_table(self.active, roles)
+        return self._role_tables[key]
+
+    @cached_property
+    def brothers(self):
+        return create_brothers_table(self.active)
+
+    @cached_property
+    def sorted_brothers(self):
+        return sorted_by_name(without_offices(self.active, constants.officers))
+
+    @cached_property
+    def chapter_staff(self):
+        return process_advisors(self.staff)
+
+
+def build_roster_tables(active, staff, derived=None):
+    """
+    Builds every Table shown in the roster workbook, keyed by table title,
+    so other outputs can render the same tables without going through Excel.
     """
-    pd.DataFrame().to_excel(writer, sheet_name='Sheet1', index=False)
-    output_path = os.path.join(xlsx_output_dir, 'Officer Roster and Minutes Rosters.xlsx')
-
-    # Generate committee DataFrames
-    executive_df = create_df(active_df, exec)
-    events_df = create_df(active_df, events)
-    finance_df = create_df(active_df, ['Asst. Tau', 'Sigma'])
-    ioc_df = create_df(active_df, ['Beta', 'Theta One', 'Theta Two', 'Theta Three', 'Sigma'])
-    bylaws_df = create_df(active_df, ['Sigma', 'Sigma'])
-    officers_df = create_df(active_df, officers)
-
-    # Generate additional tables
-    brothers_df = create_brothers_df(active_df)
-    new_members_df = create_new_members_df()
-    others_df = create_others_df()
-    advisor_df = process_advisors(advisor_df)
+    derived = derived or DerivedTables(active, staff)
+    return {
+        'EXECUTIVE COUNCIL COMMITTEE': derived.roles(constants.exec),
+        'EVENTS COMMITTEE': derived.roles(constants.events),
+        'FINANCE COMMITTEE': derived.roles(['Asst. Tau', 'Sigma']),
+        'INTERNAL OPERATIONS COMMITTEE': derived.roles(['Beta', 'Theta One', 'Theta Two', 'Theta Three', 'Sigma']),
+        'BYLAWS COMMITTEE': derived.roles(['Sigma', 'Sigma']),
+        'OFFICERS': derived.roles(constants.officers),
+        'BROTHERS': derived.brothers,
+        'ADVISORS': derived.chapter_staff,
+        'NEW MEMBERS': create_new_members_table(),
+        'OTHERS': create_others_table(),
+    }
+
+
+def plan_roster(active, staff, derived=None):
+    """
+    Lays out the roster sheet: executive officers, advisors, members, and
+    committee tables.
+    """
+    tables = build_roster_tables(active, staff, derived)
+    executive_table = tables['EXECUTIVE COUNCIL COMMITTEE']
+    officers_table = tables['OFFICERS']
+    brothers_table = tables['BROTHERS']
+    staff_table = tables['ADVISORS']
+    new_members_table = tables['NEW MEMBERS']
+    others_table = tables['OTHERS']
 
     # Grouped table segments
     segments = [
-        ("Officers", officers_df, ["Officers", "Full Name", "Opening Roll", "Closing Roll"]),
-        (" ", advisor_df, ["Chapter Staff", "Opening Roll", "Closing Roll", "Role"]),
-        ("NEW MEMBERS", new_members_df, ["Last Name", "First Name", "Opening Roll", "Closing Roll"])
+        ("Officers", officers_table, ["Officers", "Full Name", "Opening Roll", "Closing Roll"]),
+        (" ", staff_table, ["Chapter Staff", "Opening Roll", "Closing Roll", "Role"]),
+        ("NEW MEMBERS", new_members_table, ["Last Name", "First Name", "Opening Roll", "Closing Roll"])
     ]
     chapter_segments = [
-        ("", officers_df, ["Officers", "Full Name", "Opening Roll", "Closing Roll"]),
-        ("", brothers_df, ["Brothers", "First Name", "Opening Roll", "Closing Roll"]),
-        ("", advisor_df, ["Chapter Staff", "Opening Roll", "Closing Roll", "Role"]),
+        ("", officers_table, ["Officers", "Full Name", "Opening Roll", "Closing Roll"]),
+        ("", brothers_table, ["Brothers", "First Name", "Opening Roll", "Closing Roll"]),
+        ("", staff_table, ["Chapter Staff", "Opening Roll", "Closing Roll", "Role"]),
     ]
 
-    # Main tables
-    create_table(writer, executive_df, 0, table_positions['EXECUTIVE COUNCIL COMMITTEE'], 'EXECUTIVE COUNCIL COMMITTEE')
-    create_segmented_table(writer, chapter_segments, len(executive_df) + 3, table_positions['EXECUTIVE COUNCIL COMMITTEE'])
-    create_segmented_table(writer, segments, 0, table_positions['HOUSE'])
-
-    # Write all other committee segments dynamically
-    committees = [
-        ("EVENTS COMMITTEE", events_df),
-        ("FINANCE COMMITTEE", finance_df),
-        ("INTERNAL OPERATIONS COMMITTEE", ioc_df),
-        ("BYLAWS COMMITTEE", bylaws_df)
-    ]
+    # Plan every table before writing anything
+    layout = RosterLayout()
+    layout.add_table(executive_table, 0, constants.table_positions['EXECUTIVE COUNCIL COMMITTEE'], 'EXECUTIVE COUNCIL COMMITTEE')
+    layout.add_segmented_table(chapter_segments, len(executive_table) + 3, constants.table_positions['EXECUTIVE COUNCIL COMMITTEE'])
+    layout.add_segmented_table(segments, 0, constants.table_positions['HOUSE'])
+
+    # Stack all other committee segments dynamically
+    committees = ["EVENTS COMMITTEE", "FINANCE COMMITTEE", "INTERNAL OPERATIONS COMMITTEE", "BYLAWS COMMITTEE"]
 
     row_offset = 0
-    for name, df in committees:
-        segment = create_segment(df, others_df, titles=[name])
-        row_offset = create_segmented_table(writer, segment, row_offset, table_positions[name])
+    for name in committees:
+        segment = create_segment(tables[name], others_table, titles=[name])
+        row_offset = layout.add_segmented_table(segment, row_offset, constants.table_positions[name])
+
+    return layout
+
 
-    # Save final workbook
-    writer.book.save(output_path)
\ No newline at end of file
+def create_roster(xlsx_output_dir, active, staff, derived=None):
+    """
+    Orchestrates the creation and formatting of an Excel workbook roster.
+    It includes executive officers, advisors, members, and committee tables.
+    """
+    path = os.path.join(xlsx_output_dir, ROSTER_FILENAME)
+    plan_roster(active, staff, derived).save(path)
+    return path
+
+
+def _qn(namespace, tag):
+    return f'{{{namespace}}}{tag}'
+
+
+def _roster_styles(stylesheet):
+    """
+    Finds the format index of each (bold, centered) combination the roster
+    uses in an existing stylesheet, adding the bold font and any formats it
+    lacks. Returns the index map and whether the stylesheet changed.
+    """
+    fonts = stylesheet.find(_qn(MAIN_NS, 'fonts'))
+    xfs = stylesheet.find(_qn(MAIN_NS, 'cellXfs'))
+    changed = False
+
+    def is_bold(font):
+        children = list(font)
+        return (len(children) == 1 and children[0].tag == _qn(MAIN_NS, 'b')
+                and children[0].get('val', '1') in ('1', 'true'))
+
+    bold_font = next((i for i, font in enumerate(fonts) if is_bold(font)), None)
+    if bold_font is None:
+        etree.SubElement(etree.SubElement(fonts, _qn(MAIN_NS, 'font')), _qn(MAIN_NS, 'b'), val='1')
+        bold_font = len(fonts) - 1
+        fonts.set('count', str(len(fonts)))
+        changed = True
+
+    def combination(xf):
+        # Only plain formats qualify: default number format, fill and border
+        if any(xf.get(a, '0') != '0' for a in ('numFmtId', 'fillId', 'borderId', 'quotePrefix')):
+            return None
+        children = list(xf)
+        if not children:
+            centered = False
+        elif len(children) == 1 and children[0].tag == _qn(MAIN_NS, 'alignment') and dict(children[0].attrib) == {'horizontal': 'center'}:
+            centered = True
+        else:
+            return None
+        font = int(xf.get('fontId', '0'))
+        return (font == bold_font, centered) if font in (0, bold_font) else None
+
+    styles = {(False, False): 0}
+    for i, xf in enumerate(xfs):
+        styles.setdefault(combination(xf), i)
+
+    for bold, centered in [(True, True), (False, True), (True, False)]:
+        if (bold, centered) not in styles:
+            xf = etree.SubElement(xfs, _qn(MAIN_NS, 'xf'), numFmtId='0', fontId=str(bold_font if bold else 0), fillId='0', borderId='0', xfId='0')
+            if centered:
+                xf.set('applyAlignment', '1')
+                etree.SubElement(xf, _qn(MAIN_NS, 'alignment'), horizontal='center')
+            styles[(bold, centered)] = len(xfs) - 1
+            changed = True
+    xfs.set('count', str(len(xfs)))
+    return styles, changed
+
+
+def _unique_sheet_name(title, names):
+    # Excel compares sheet names case-insensitively: '2026-01-05', '2026-01-05 (2)', ...
+    taken = {name.lower() for name in names}
+    name, n = title, 2
+    while name.lower() in taken:
+        name = f'{title} ({n})'
+        n += 1
+    return name
+
+
+def _xml_bytes(root):
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def append_roster(xlsx_output_dir, active, staff, derived=None, meeting_date=None):
+    """
+    Adds the roster as a new sheet named for the meeting date (today by
+    default) to the roster workbook, which is created if it doesn't exist
+    yet. Existing sheets are copied over byte for byte, still compressed;
+    only the workbook's small index parts, and the stylesheet if it lacks
+    the roster formats, are rewritten, so each append costs about the same
+    however many meetings the workbook already holds. Returns the sheet name.
+    """
+    output_path = os.path.join(xlsx_output_dir, ROSTER_FILENAME)
+    layout = plan_roster(active, staff, derived)
+    title = f'{meeting_date or date.today():%Y-%m-%d}'
+    if not os.path.isfile(output_path):
+        layout.save(output_path, title)
+        return title
+
+    with zipfile.ZipFile(output_path) as zf:
+        part_names = set(zf.namelist())
+        workbook = etree.fromstring(zf.read(WORKBOOK_PART))
+        rels = etree.fromstring(zf.read(WORKBOOK_RELS_PART))
+        content_types = etree.fromstring(zf.read(CONTENT_TYPES_PART))
+        stylesheet = etree.fromstring(zf.read(STYLES_PART))
+
+    styles, styles_changed = _roster_styles(stylesheet)
+
+    # A free part name, relationship id and sheet id for the new sheet
+    number = 1
+    while f'xl/worksheets/sheet{number}.xml' in part_names:
+        number += 1
+    part_name = f'xl/worksheets/sheet{number}.xml'
+    rel_ids = {rel.get('Id') for rel in rels}
+    rel_number = len(rel_ids) + 1
+    while f'rId{rel_number}' in rel_ids:
+        rel_number += 1
+
+    sheets = workbook.find(_qn(MAIN_NS, 'sheets'))
+    name = _unique_sheet_name(title, [sheet.get('name') for sheet in sheets])
+    sheet_id = max((int(sheet.get('sheetId')) for sheet in sheets), default=0) + 1
+    etree.SubElement(sheets, _qn(MAIN_NS, 'sheet'), {'name': name, 'sheetId': str(sheet_id), _qn(REL_NS, 'id'): f'rId{rel_number}'})
+    etree.SubElement(rels, _qn(PACKAGE_REL_NS, 'Relationship'), Type=WORKSHEET_REL_TYPE, Target=f'/{part_name}', Id=f'rId{rel_number}')
+    etree.SubElement(content_types, _qn(CONTENT_TYPES_NS, 'Override'), PartName=f'/{part_name}', ContentType=WORKSHEET_CONTENT_TYPE)
+
+    rewritten = {
+        WORKBOOK_PART: _xml_bytes(workbook),
+        WORKBOOK_RELS_PART: _xml_bytes(rels),
+        CONTENT_TYPES_PART: _xml_bytes(content_types),
+        part_name: layout.sheet_xml(styles),
+    }
+    if styles_changed:
+        rewritten[STYLES_PART] = _xml_bytes(stylesheet)
+    replace_parts(output_path, rewritten)
+    return name
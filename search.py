@@ -0,0 +1,353 @@
+import os
+import re
+import sqlite3
+import zipfile
+import argparse
+import unicodedata
+from datetime import date
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+# An inverted index over an archive of completed minutes. Every paragraph
+# (and every table row) is a passage, tagged with the section heading above
+# it (headings belong to their own section) and its meeting's type and
+# date; postings map each term to the passages containing it. The index
+# lives in one SQLite file and is updated incrementally: only minutes added
+# or changed since the last run are read.
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Phrase on an outline's title lines -> meeting type (the generator's output names)
+MEETING_TYPES = [
+    ('Formal Meeting', 'chapter'),
+    ('House Meeting', 'house'),
+    ('Executive Council', 'exec'),
+    ('Events Committee', 'events'),
+    ('Finance Committee', 'finance'),
+    ('Internal Operation', 'ioc'),
+    ('Bylaws Committee', 'bylaws'),
+]
+
+MONTHS = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+          'august', 'september', 'october', 'november', 'december']
+DATE_PATTERNS = [
+    # 2025-03-02
+    (re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b'), lambda m: (m[1], m[2], m[3])),
+    # 3/2/2025, 03-02-25 (the outlines' XX-XX-XX)
+    (re.compile(r'\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4}|\d{2})\b'), lambda m: (m[3], m[1], m[2])),
+    # March 2, 2025
+    (re.compile(r'\b(' + '|'.join(MONTHS) + r')\s+(\d{1,2}),?\s+(\d{4})\b', re.IGNORECASE),
+     lambda m: (m[3], MONTHS.index(m[1].lower()) + 1, m[2])),
+]
+
+# '<heading> - <typed text>' with any of the dashes the outlines use
+HEADING_SEPARATOR = re.compile(r'\s+[-–—]\s*|\s*[-–—:]$')
+
+BATCH_SIZE = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime_ns INTEGER, size INTEGER,
+    meeting TEXT, date TEXT
+);
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY, document INTEGER NOT NULL, position INTEGER, section TEXT, text TEXT
+);
+CREATE INDEX IF NOT EXISTS passages_document ON passages (document);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL, passage INTEGER NOT NULL, PRIMARY KEY (term, passage)
+) WITHOUT ROWID;
+"""
+
+Hit = namedtuple('Hit', ['path', 'meeting', 'date', 'section', 'text'])
+
+def terms(text):
+    """
+    Splits text into index terms: accents and case removed, punctuation dropped.
+    """
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode()
+    return re.findall(r'[a-z0-9]+', text.casefold())
+
+def parse_date(text):
+    """
+    Returns the first date written in `text` as YYYY-MM-DD, or None.
+    """
+    for pattern, parts in DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            year, month, day = map(int, parts(match))
+            if year < 100:
+                year += 2000
+            try:
+                return date(year, month, day).isoformat()
+            except ValueError:
+                continue
+    return None
+
+def _text(element):
+    # Run text with breaks and tabs as spaces
+    pieces = []
+    for node in element.iter(W + 't', W + 'br', W + 'cr', W + 'tab'):
+        pieces.append(node.text or '' if node.tag == W + 't' else ' ')
+    return ' '.join(''.join(pieces).split())
+
+def _bold(rpr):
+    # None when the properties leave bold alone, else whether they turn it on
+    b = None if rpr is None else rpr.find(W + 'b')
+    return None if b is None else b.get(W + 'val', 'true') not in ('0', 'false')
+
+def _bold_styles(styles):
+    """
+    Returns the ids of the styles that make text bold, following basedOn.
+    The outlines set their headings through character styles (set_font).
+    """
+    own, parents = {}, {}
+    for style in styles.iter(W + 'style'):
+        style_id = style.get(W + 'styleId')
+        own[style_id] = _bold(style.find(W + 'rPr'))
+        based_on = style.find(W + 'basedOn')
+        parents[style_id] = None if based_on is None else based_on.get(W + 'val')
+
+    def bold(style_id, seen=()):
+        if style_id not in own or style_id in seen:
+            return False
+        if own[style_id] is not None:
+            return own[style_id]
+        return bold(parents[style_id], (*seen, style_id))
+    return {style_id for style_id in own if bold(style_id)}
+
+def _is_heading(p, bold_styles):
+    """
+    The outlines set headings as a paragraph opening with a bold run on one
+    line ('New Business', 'Call to Order - Time'); titles span several lines.
+    """
+    for br in p.iter(W + 'br'):
+        if br.get(W + 'type', 'textWrapping') == 'textWrapping':
+            return False
+    p_style = p.find(f'{W}pPr/{W}pStyle')
+    paragraph_bold = p_style is not None and p_style.get(W + 'val') in bold_styles
+    for run in p.iter(W + 'r'):
+        if not ''.join(t.text or '' for t in run.iter(W + 't')).strip():
+            continue
+        rpr = run.find(W + 'rPr')
+        direct = _bold(rpr)
+        if direct is not None:
+            return direct
+        r_style = None if rpr is None else rpr.find(W + 'rStyle')
+        return paragraph_bold or (r_style is not None and r_style.get(W + 'val') in bold_styles)
+    return False
+
+def extract_minutes(path):
+    """
+    Reads one set of minutes into (meeting type, date, [(section, text)]).
+    The meeting type and date come from the header and the title lines
+    before the first heading, falling back to the file name for the date.
+    """
+    with zipfile.ZipFile(path) as zf:
+        root = etree.fromstring(zf.read('word/document.xml'))
+        names = zf.namelist()
+        bold_styles = _bold_styles(etree.fromstring(zf.read('word/styles.xml'))) if 'word/styles.xml' in names else set()
+        front = [_text(etree.fromstring(zf.read(name))) for name in names
+                 if name.startswith('word/header') and name.endswith('.xml')]
+
+    passages = []
+    section = None
+    for element in root.find(W + 'body'):
+        if element.tag == W + 'tbl':
+            # Tables are indexed a row at a time, nested tables as part of their outer row
+            for row in element.iterchildren(W + 'tr'):
+                text = ' | '.join(filter(None, (_text(tc) for tc in row.iterchildren(W + 'tc'))))
+                if text:
+                    passages.append((section, text))
+            continue
+        if element.tag != W + 'p':
+            continue
+        text = _text(element)
+        if not text:
+            continue
+        if _is_heading(element, bold_styles):
+            heading, *rest = HEADING_SEPARATOR.split(text, 1)
+            section = heading.strip()
+            # A heading with nothing typed after it is indexed as itself, so empty sections are still recorded
+            text = ' '.join(rest).strip() or section
+        elif section is None:
+            front.append(text)
+        passages.append((section, text))
+
+    front_text = ' '.join(front)
+    meeting = next((kind for phrase, kind in MEETING_TYPES if phrase.lower() in front_text.lower()), None)
+    when = parse_date(front_text) or parse_date(os.path.basename(path))
+    return meeting, when, passages
+
+def _extract_batch(paths):
+    results = []
+    for path in paths:
+        try:
+            results.append((path, extract_minutes(path)))
+        except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError):
+            results.append((path, None))  # Not a readable .docx; skipped until it changes
+    return results
+
+def find_minutes(archive_dir):
+    """
+    Lists every .docx under `archive_dir`, skipping Word's ~$ lock files.
+    """
+    found = []
+    for folder, _, files in os.walk(archive_dir):
+        for name in files:
+            if name.endswith('.docx') and not name.startswith('~$'):
+                found.append(os.path.abspath(os.path.join(folder, name)))
+    return sorted(found)
+
+class MinutesIndex:
+    """
+    Persistent full-text index of an archive of minutes, stored in one
+    SQLite file. Use update() to bring it in line with the archive and
+    search() to query it.
+    """
+    def __init__(self, index_path):
+        self.db = sqlite3.connect(index_path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _remove(self, document):
+        # Postings are keyed by term first, so they are found again from the stored text
+        passages = self.db.execute('SELECT id, text FROM passages WHERE document = ?', (document,)).fetchall()
+        self.db.executemany('DELETE FROM postings WHERE term = ? AND passage = ?',
+                            [(term, passage) for passage, text in passages for term in set(terms(text))])
+        self.db.execute('DELETE FROM passages WHERE document = ?', (document,))
+        self.db.execute('DELETE FROM documents WHERE id = ?', (document,))
+
+    def _add(self, path, stat, extracted):
+        meeting, when, passages = extracted or (None, None, [])
+        document = self.db.execute(
+            'INSERT INTO documents (path, mtime_ns, size, meeting, date) VALUES (?, ?, ?, ?, ?)',
+            (path, stat.st_mtime_ns, stat.st_size, meeting, when)
+        ).lastrowid
+        for position, (section, text) in enumerate(passages):
+            passage = self.db.execute(
+                'INSERT INTO passages (document, position, section, text) VALUES (?, ?, ?, ?)',
+                (document, position, section, text)
+            ).lastrowid
+            self.db.executemany('INSERT INTO postings (term, passage) VALUES (?, ?)',
+                                [(term, passage) for term in set(terms(text))])
+
+    def _store(self, removed, results, stats):
+        # One transaction, so an interrupted update leaves the previous index
+        with self.db:
+            for document in removed:
+                self._remove(document)
+            for batch in results:
+                for path, extracted in batch:
+                    row = self.db.execute('SELECT id FROM documents WHERE path = ?', (path,)).fetchone()
+                    if row:
+                        self._remove(row[0])
+                    self._add(path, stats[path], extracted)
+
+    def update(self, archive_dir, workers=None, batch_size=BATCH_SIZE):
+        """
+        Indexes the minutes under `archive_dir` that are new or changed since
+        the last update (by modification time and size) and drops the ones
+        that are gone. Changed files are read in parallel across worker
+        processes. Returns (number indexed, number removed).
+        """
+        prefix = os.path.join(os.path.abspath(archive_dir), '')
+        indexed = {path: (document, mtime_ns, size) for document, path, mtime_ns, size in
+                   self.db.execute('SELECT id, path, mtime_ns, size FROM documents') if path.startswith(prefix)}
+        stats, changed = {}, []
+        for path in find_minutes(archive_dir):
+            stat = stats[path] = os.stat(path)
+            known = indexed.pop(path, None)
+            if known is None or known[1:] != (stat.st_mtime_ns, stat.st_size):
+                changed.append(path)
+
+        batches = [changed[i:i + batch_size] for i in range(0, len(changed), batch_size)]
+        removed = [document for document, _, _ in indexed.values()]
+        if workers == 1 or len(batches) <= 1:
+            self._store(removed, map(_extract_batch, batches), stats)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                self._store(removed, pool.map(_extract_batch, batches), stats)
+        return len(changed), len(indexed)
+
+    def search(self, query, section=None, meeting=None, year=None, since=None, until=None, limit=50):
+        """
+        Returns the passages containing every word of `query` (a trailing *
+        matches any ending: 'motion*'), newest meeting first. `section`
+        matches the heading ignoring case, `meeting` is a type from
+        MEETING_TYPES, and `year`, `since` and `until` (YYYY-MM-DD, inclusive)
+        filter on the meeting date.
+        """
+        clauses, params = [], []
+        for word in query.split():
+            words = terms(word)
+            for i, term in enumerate(words):
+                if word.endswith('*') and i == len(words) - 1:
+                    # Every term starting with `term`, as a range over the postings key
+                    clauses.append('SELECT passage FROM postings WHERE term >= ? AND term < ?')
+                    params += [term, term[:-1] + chr(ord(term[-1]) + 1)]
+                else:
+                    clauses.append('SELECT passage FROM postings WHERE term = ?')
+                    params.append(term)
+        if not clauses:
+            return []
+
+        sql = ['SELECT d.path, d.meeting, d.date, p.section, p.text FROM passages p JOIN documents d ON d.id = p.document',
+               f'WHERE p.id IN ({" INTERSECT ".join(clauses)})']
+        if section is not None:
+            sql.append('AND p.section = ? COLLATE NOCASE')
+            params.append(section)
+        if meeting is not None:
+            sql.append('AND d.meeting = ?')
+            params.append(meeting)
+        if year is not None:
+            since, until = max(since or '', f'{year}-01-01'), min(until or '9999', f'{year}-12-31')
+        if since is not None:
+            sql.append('AND d.date >= ?')
+            params.append(since)
+        if until is not None:
+            sql.append('AND d.date <= ?')
+            params.append(until)
+        sql.append('ORDER BY d.date DESC, d.path, p.position LIMIT ?')
+        params.append(limit)
+        return [Hit(*row) for row in self.db.execute(' '.join(sql), params)]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index and search an archive of completed minutes.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    index_cmd = commands.add_parser('index', help="Index new and changed minutes")
+    index_cmd.add_argument('archive', help="Folder of minutes (.docx), searched recursively")
+    index_cmd.add_argument('--index', default=None, help="Index file (default: <archive>/minutes-index.sqlite)")
+    index_cmd.add_argument('--workers', type=int, default=None, help="Number of worker processes")
+
+    search_cmd = commands.add_parser('search', help="Search indexed minutes")
+    search_cmd.add_argument('archive')
+    search_cmd.add_argument('query', help="Words that must all appear; end one with * to match any ending")
+    search_cmd.add_argument('--index', default=None)
+    search_cmd.add_argument('--section', default=None, help="Only under this heading, e.g. 'New Business'")
+    search_cmd.add_argument('--meeting', default=None, choices=[kind for _, kind in MEETING_TYPES])
+    search_cmd.add_argument('--year', type=int, default=None)
+    search_cmd.add_argument('--since', default=None, help="YYYY-MM-DD")
+    search_cmd.add_argument('--until', default=None, help="YYYY-MM-DD")
+    search_cmd.add_argument('--limit', type=int, default=50)
+
+    args = parser.parse_args()
+    index_path = args.index or os.path.join(args.archive, 'minutes-index.sqlite')
+    with MinutesIndex(index_path) as index:
+        if args.command == 'index':
+            indexed, removed = index.update(args.archive, args.workers)
+            print(f"Indexed {indexed} file(s), removed {removed}.")
+        else:
+            for hit in index.search(args.query, args.section, args.meeting, args.year, args.since, args.until, args.limit):
+                print(f"{hit.date or '????-??-??'}  {hit.meeting or '?'}  {hit.section or '-'}  {os.path.basename(hit.path)}")
+                print(f"    {hit.text}")
@@ -0,0 +1,276 @@
+import os
+import json
+import time
+import uuid
+import shutil
+import socket
+import tempfile
+import argparse
+import threading
+import multiprocessing
+
+from profiles import load_profile, apply_profile
+
+# A spool is a directory on shared storage with one sub-directory per job state.
+# Jobs move between them with os.rename, which is atomic within one filesystem,
+# so whichever worker's rename succeeds owns the job; no broker is needed.
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+LEASE_SECONDS = 120
+MAX_ATTEMPTS = 3
+
+# Lease ages are measured on one clock, the file server's: leases are dated by
+# touching them, and "now" is read back from a file touched the same way, so
+# clock skew between worker hosts can't expire a live lease early.
+CLOCK_NAME = '.clock'
+
+def init_spool(spool_dir):
+    for state in (PENDING, LEASED, DONE, FAILED):
+        os.makedirs(os.path.join(spool_dir, state), exist_ok=True)
+
+def _write_json(path, data):
+    # Write beside the target and rename so readers never see a partial file
+    tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def submit_job(spool_dir, roster, output_dir, profile=None, deterministic=False):
+    """
+    Queues a read/write job for any worker and returns its id.
+    Paths must be valid on every worker host (e.g. on the shared storage).
+    """
+    init_spool(spool_dir)
+    # Time-prefixed ids make the pending directory listing roughly FIFO
+    job_id = f'{time.time_ns():020d}-{uuid.uuid4().hex[:8]}'
+    _write_json(os.path.join(spool_dir, PENDING, f'{job_id}.json'), {
+        'id': job_id,
+        'roster': roster,
+        'docx_output_dir': os.path.join(output_dir, 'Minutes'),
+        'xlsx_output_dir': os.path.join(output_dir, 'Rosters'),
+        'profile': profile,
+        'deterministic': deterministic,
+        'attempts': 0,
+    })
+    return job_id
+
+def job_status(spool_dir, job_id):
+    """
+    Returns (state, record) for a job; record is the result for done/failed jobs.
+    """
+    for state in (DONE, FAILED, PENDING):
+        path = os.path.join(spool_dir, state, f'{job_id}.json')
+        if os.path.isfile(path):
+            return state, _read_json(path)
+    for name in os.listdir(os.path.join(spool_dir, LEASED)):
+        if name.startswith(f'{job_id}.'):
+            return LEASED, None
+    return None, None
+
+def claim_job(spool_dir, worker_id):
+    """
+    Leases the oldest pending job by renaming it into leased/ under this worker's
+    name. Returns (lease path, job) or (None, None) when nothing is pending.
+    """
+    pending_dir = os.path.join(spool_dir, PENDING)
+    for name in sorted(os.listdir(pending_dir)):
+        if not name.endswith('.json'):
+            continue
+        job_id = name[:-len('.json')]
+        lease_path = os.path.join(spool_dir, LEASED, f'{job_id}.{worker_id}.json')
+        try:
+            os.rename(os.path.join(pending_dir, name), lease_path)
+        except FileNotFoundError:
+            continue  # Another worker won the race
+        os.utime(lease_path)  # The lease clock starts now, not at submission
+        return lease_path, _read_json(lease_path)
+    return None, None
+
+def _spool_clock(spool_dir):
+    """
+    Returns the spool filesystem's current time, as it dates touched files.
+    """
+    path = os.path.join(spool_dir, CLOCK_NAME)
+    with open(path, 'a'):
+        pass
+    os.utime(path)
+    return os.path.getmtime(path)
+
+def _requeued(spool_dir, job_id):
+    # Whether a reaper that died after requeueing a job already got it back on a queue
+    if any(os.path.isfile(os.path.join(spool_dir, state, f'{job_id}.json')) for state in (PENDING, DONE, FAILED)):
+        return True
+    return any(name.startswith(f'{job_id}.') and name.endswith('.json') for name in os.listdir(os.path.join(spool_dir, LEASED)))
+
+def expire_leases(spool_dir, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+    """
+    Returns jobs whose lease has not been renewed within `lease_seconds` to the
+    pending queue, or fails them once they have used up `max_attempts`. Jobs
+    left behind by a reaper that died halfway (the *.reaped files) are
+    recovered the same way once they are as old. Returns the number of leases
+    expired.
+    """
+    leased_dir = os.path.join(spool_dir, LEASED)
+    now = _spool_clock(spool_dir)
+    expired = 0
+    for name in sorted(os.listdir(leased_dir)):
+        abandoned = name.endswith('.reaped')
+        if not (abandoned or name.endswith('.json')):
+            continue
+        path = os.path.join(leased_dir, name)
+        lease_path = os.path.join(leased_dir, name[:name.index('.json') + len('.json')])
+        try:
+            if now - os.path.getmtime(path) < lease_seconds:
+                continue
+            # Take the stale lease atomically so only one reaper handles it,
+            # and date the take in case this reaper dies before finishing
+            reaped_path = f'{lease_path}.{uuid.uuid4().hex}.reaped'
+            os.rename(path, reaped_path)
+            os.utime(reaped_path)
+            job = _read_json(reaped_path)
+        except FileNotFoundError:
+            continue
+
+        if not (abandoned and _requeued(spool_dir, job['id'])):
+            job['attempts'] = job.get('attempts', 0) + 1
+            if job['attempts'] >= max_attempts:
+                _write_json(os.path.join(spool_dir, FAILED, f"{job['id']}.json"),
+                            {'job': job, 'error': 'lease expired too many times'})
+            else:
+                _write_json(os.path.join(spool_dir, PENDING, f"{job['id']}.json"), job)
+            expired += 1
+        os.remove(reaped_path)
+    return expired
+
+class _Heartbeat(threading.Thread):
+    """
+    Keeps a lease alive by touching it while the job runs.
+    """
+    def __init__(self, lease_path, interval):
+        super().__init__(daemon=True)
+        self.lease_path = lease_path
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                os.utime(self.lease_path)
+            except FileNotFoundError:
+                return  # Lease was expired and reclaimed
+
+def run_job(job):
+    """
+    Runs one spooled job with the chapter profile it names. The outputs are
+    written into a scratch folder inside each output folder and renamed into
+    place once all of them are done, so a rerun of the same job racing
+    this one (after its lease expired) never leaves a torn file behind.
+    """
+    from generator import read, write
+    from ooxml import normalize_package, write_manifest
+
+    apply_profile(load_profile(job.get('profile')))
+    active_df, advisor_df = read(job['roster'])
+
+    staging = {}
+    try:
+        for key in ('docx_output_dir', 'xlsx_output_dir'):
+            os.makedirs(job[key], exist_ok=True)
+            staging[key] = tempfile.mkdtemp(prefix=f".{job['id']}.", dir=job[key])
+        write(active_df, advisor_df,
+              docx_output_dir=staging['docx_output_dir'],
+              xlsx_output_dir=staging['xlsx_output_dir'])
+        for key, scratch in staging.items():
+            names = sorted(os.listdir(scratch))
+            for name in names:
+                if job.get('deterministic', False):
+                    normalize_package(os.path.join(scratch, name))
+                os.replace(os.path.join(scratch, name), os.path.join(job[key], name))
+            if job.get('deterministic', False):
+                write_manifest(job[key], names)
+    finally:
+        for scratch in staging.values():
+            shutil.rmtree(scratch, ignore_errors=True)
+
+def run_worker(spool_dir, worker_id=None, poll_interval=1.0, lease_seconds=LEASE_SECONDS, max_jobs=None, exit_when_idle=False):
+    """
+    Claims and runs jobs until stopped. Every poll also expires stale leases, so
+    jobs held by crashed workers on any host are eventually picked up again.
+    Returns the number of jobs run.
+    """
+    init_spool(spool_dir)
+    worker_id = worker_id or f'{socket.gethostname()}-{os.getpid()}'
+    jobs_run = 0
+
+    while max_jobs is None or jobs_run < max_jobs:
+        expire_leases(spool_dir, lease_seconds)
+        lease_path, job = claim_job(spool_dir, worker_id)
+        if job is None:
+            if exit_when_idle:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        heartbeat = _Heartbeat(lease_path, lease_seconds / 4)
+        heartbeat.start()
+        started = time.time()
+        try:
+            run_job(job)
+        except Exception as e:
+            state, result = FAILED, {'job': job, 'worker': worker_id, 'error': str(e)}
+        else:
+            state, result = DONE, {'job': job, 'worker': worker_id, 'seconds': time.time() - started}
+        finally:
+            heartbeat.stopped.set()
+            heartbeat.join()
+
+        _write_json(os.path.join(spool_dir, state, f"{job['id']}.json"), result)
+        try:
+            os.remove(lease_path)
+        except FileNotFoundError:
+            pass  # Lease expired mid-run and the job was requeued
+        jobs_run += 1
+
+    return jobs_run
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared-directory job spool for roster generation.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    submit = commands.add_parser('submit', help="Queue a roster for generation")
+    submit.add_argument('spool')
+    submit.add_argument('roster')
+    submit.add_argument('output')
+    submit.add_argument('--profile', default=None)
+    submit.add_argument('--deterministic', action='store_true')
+
+    worker = commands.add_parser('worker', help="Process queued jobs")
+    worker.add_argument('spool')
+    worker.add_argument('--processes', type=int, default=1, help="Local worker processes to start")
+    worker.add_argument('--exit-when-idle', action='store_true')
+
+    status = commands.add_parser('status', help="Show a job's state")
+    status.add_argument('spool')
+    status.add_argument('job_id')
+
+    args = parser.parse_args()
+    if args.command == 'submit':
+        print(submit_job(args.spool, args.roster, args.output, args.profile, args.deterministic))
+    elif args.command == 'worker':
+        workers = [
+            multiprocessing.Process(target=run_worker, args=(args.spool,), kwargs={'exit_when_idle': args.exit_when_idle})
+            for _ in range(args.processes)
+        ]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+    else:
+        state, record = job_status(args.spool, args.job_id)
+        print(state or 'unknown')
+        if record and record.get('error'):
+            print(record['error'])
@@ -0,0 +1,20 @@
+import os
+import sys
+import shutil
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+TEST_DATA = os.path.join(ROOT, 'tests', 'data')
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # The outlines load their crests from data/ relative to the working directory
+    shutil.copytree(TEST_DATA, tmp_path / 'data')
+    monkeypatch.chdir(tmp_path)
+    # Keep the part cache out of ~/.cache
+    monkeypatch.setenv('MINUTES_PART_CACHE', str(tmp_path / '.part-cache'))
+    return tmp_path
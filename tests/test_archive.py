@@ -0,0 +1,67 @@
+import subprocess
+import sys
+from datetime import date, datetime
+
+import pandas as pd
+
+import archive
+from conftest import ROOT
+from archive import archive_roster, as_of, term_diff
+from generator import archive as archive_file
+
+def _roster(*rows):
+    return pd.DataFrame(rows, columns=['Last Name', 'First Name', 'Current Office', 'Status'])
+
+def test_as_of_reads_only_the_snapshot_term(workdir, monkeypatch):
+    archive_roster(_roster(('Smith', 'Ann', 'Alpha', 'Active')), 'history', snapshot=datetime(2024, 9, 1))
+    archive_roster(_roster(('Jones', 'Bo', 'Alpha/Beta', 'Active'), ('Lee', 'Cy', None, 'Alumni')),
+                   'history', snapshot=datetime(2025, 2, 1, 18))
+
+    scanned = []
+    query = archive.query
+    def spy(archive_dir, terms=None, **filters):
+        scanned.append(terms)
+        return query(archive_dir, terms=terms, **filters)
+    monkeypatch.setattr(archive, 'query', spy)
+
+    # A plain date covers snapshots taken later that day
+    members = as_of('history', date(2025, 2, 1))
+    assert members.values.tolist() == [['Jones', 'Bo', 'Alpha/Beta', 'Active']]
+    assert scanned == [['2024-2', '2025-1'], ['2025-1']]
+
+    scanned.clear()
+    assert as_of('history', date(2025, 1, 31)).values.tolist() == [['Smith', 'Ann', 'Alpha', 'Active']]
+    assert scanned[-1] == ['2024-2']
+    assert as_of('history', date(2024, 1, 1)).empty
+
+def test_term_diff(workdir):
+    archive_roster(_roster(('Smith', 'Ann', 'Alpha', 'Active')), 'history', snapshot=datetime(2024, 9, 1))
+    archive_roster(_roster(('Smith', 'Ann', 'Beta', 'Active'), ('Jones', 'Bo', None, 'Active')),
+                   'history', snapshot=datetime(2025, 2, 1))
+    diff = term_diff('history', '2024-2', '2025-1')
+    assert diff[['Last Name', 'Current Office Old', 'Current Office New', 'Change']].fillna('').values.tolist() == [
+        ['Jones', '', '', 'joined'], ['Smith', 'Alpha', 'Beta', 'office'],
+    ]
+
+def test_archive_from_roster_file(workdir):
+    _roster(('Smith ', 'Ann', 'Alpha', 'Active'), ('Lee', 'Cy', None, 'Alumni')).to_csv('roster.csv', index=False)
+    snapshot = archive_file('roster.csv', 'history')
+    rows = archive.query('history', snapshot=snapshot)
+    assert sorted(rows['Last Name']) == ['Lee', 'Smith']
+    assert set(rows['Source']) == {'roster.csv'}
+
+def test_office_tenure_prunes_terms(workdir):
+    archive_roster(_roster(('Smith', 'Ann', 'Alpha', 'Active')), 'history', snapshot=datetime(2024, 9, 1))
+    archive_roster(_roster(('Jones', 'Bo', 'Alpha', 'Active')), 'history', snapshot=datetime(2025, 2, 1))
+
+    assert archive.office_tenure('history', 'Alpha')['Last Name'].tolist() == ['Smith', 'Jones']
+    tenure = archive.office_tenure('history', 'Alpha', terms=['2025-1'])
+    assert tenure[['Last Name', 'Terms']].values.tolist() == [['Jones', ['2025-1']]]
+
+def test_archive_does_not_load_the_generators():
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1])\n"
+        "import archive\n"
+        "assert not {'docx', 'openpyxl', 'generator'} & set(sys.modules), sorted(sys.modules)\n"
+    )
+    subprocess.run([sys.executable, '-c', script, ROOT], check=True)
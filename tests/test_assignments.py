@@ -0,0 +1,89 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from assignments import FORMER_STATUS, Assignment, OfficeIndex, read_assignments, roster_as_of
+from generator import read_members
+from members import Member, split_members
+from minutes import chapter_roster_content, exec_roster_content
+
+def _csv(path, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('Last Name,First Name,Office,Start,End\n')
+        f.writelines(','.join(row) + '\n' for row in rows)
+
+def test_read_assignments(workdir):
+    _csv('terms.csv', [('Smith', ' Ann ', 'Alpha', '2025-01-01', ''), ('', '', '', '', ''), ('Lee', 'Bo', 'Beta', '', '2025-06-30')])
+    assert read_assignments('terms.csv') == [
+        Assignment('Smith', 'Ann', 'Alpha', date(2025, 1, 1), None),
+        Assignment('Lee', 'Bo', 'Beta', None, date(2025, 6, 30)),
+    ]
+    _csv('terms.csv', [('Smith', 'Ann', 'Alpha', '2025-02-01', '2025-01-01')])
+    with pytest.raises(ValueError, match='Line 2: Alpha ends before it starts'):
+        read_assignments('terms.csv')
+    _csv('terms.csv', [('Smith', 'Ann', 'Alpha', '1/2/2025', '')])
+    with pytest.raises(ValueError, match='Start must be a date'):
+        read_assignments('terms.csv')
+
+def test_index_matches_a_linear_scan():
+    rng = random.Random(0)
+    first = date(2024, 1, 1)
+    assignments = []
+    for i in range(300):
+        start = first + timedelta(days=rng.randrange(700))
+        end = start + timedelta(days=rng.randrange(200))
+        assignments.append(Assignment(f'Last{i}', 'First', rng.choice(['Alpha', 'Beta', 'Pi']),
+                                      rng.choice([start, None]), rng.choice([end, end, None, date.max])))
+    index = OfficeIndex(assignments)
+
+    def held(a, on):
+        return (a.start is None or a.start <= on) and (a.end is None or on <= a.end)
+
+    for on in [date.min, date.max] + [first + timedelta(days=d) for d in range(-5, 950, 3)]:
+        for office in ('Alpha', 'Beta', 'Pi', 'Chi'):
+            expected = sorted(a.last_name for a in assignments if a.office == office and held(a, on))
+            assert sorted(a.last_name for a in index.holders(office, on)) == expected
+
+def test_open_ended_terms():
+    index = OfficeIndex([Assignment('Smith', 'Ann', 'Alpha', date(2025, 1, 1), date.max)])
+    assert index.holders('Alpha', date(2024, 12, 31)) == ()
+    assert [a.last_name for a in index.holders('Alpha', date.max)] == ['Smith']
+
+def test_roster_as_of():
+    members = [Member('Smith', 'Ann', 'alpha/Chapter Advisor', 'Active', 0), Member('Lee', 'Bo', None, 'Active', 1)]
+    index = OfficeIndex([
+        Assignment('Smith', 'Ann', 'Alpha', None, date(2025, 1, 31)),
+        Assignment('LEE', 'Bo', 'Alpha', date(2025, 2, 1), None),
+        Assignment('Ng', 'Cy', 'Beta', None, date(2025, 3, 1)),
+    ])
+    roster = roster_as_of(members, index, date(2025, 2, 15))
+    assert [(m.last_name, m.office, m.status) for m in roster] == [
+        ('Smith', 'Chapter Advisor', 'Active'), ('Lee', 'Alpha', 'Active'), ('Ng', 'Beta', FORMER_STATUS),
+    ]
+    assert [m.former for m in roster] == [False, False, True]
+    # Ng is listed with the officers, but left out of the member counts
+    active, _ = split_members(roster)
+    assert [m.last_name for m in active] == ['Smith', 'Lee', 'Ng']
+    content = chapter_roster_content(active, [])
+    assert ['Beta', 'Cy Ng', 'P', 'P'] in content.tables['Officers'][0]
+    assert content.paragraphs['Total active members'][0] == 'Total active members: 2\n'
+
+def test_read_members_as_of_keeps_former_officers(workdir):
+    with open('roster.csv', 'w') as f:
+        f.write('Last Name,First Name,Current Office,Status\nSmith,Ann,Alpha,Active\nLee,Bo,Sigma,Active\nKim,Jo,,Active\n')
+    _csv('terms.csv', [('Lee', 'Bo', 'Sigma', '2025-02-01', ''), ('Grad', 'Old', 'Sigma', '2024-08-01', '2025-01-31')])
+    active, staff = read_members('roster.csv', assignments='terms.csv', as_of=date(2025, 1, 15))
+    assert [m.last_name for m in active if m.office == 'Sigma'] == ['Grad']
+    content = exec_roster_content(active)
+    assert ['Sigma', 'Old Grad', 'P', 'P'] in content.tables['Officers'][0]
+    assert 'Old Grad' in content.paragraphs['Parliamentary Officers'][1]
+
+def test_read_members_as_of(workdir):
+    with open('roster.csv', 'w') as f:
+        f.write('Last Name,First Name,Current Office,Status\nSmith,Ann,Alpha,Active\nLee,Bo,,Active\n')
+    _csv('terms.csv', [('Smith', 'Ann', 'Alpha', '', '2025-01-31'), ('Lee', 'Bo', 'Alpha', '2025-02-01', '9999-12-31')])
+    active, _ = read_members('roster.csv', validate=False, assignments='terms.csv', as_of=date(2025, 1, 31))
+    assert [(m.last_name, m.office) for m in active] == [('Smith', 'Alpha'), ('Lee', None)]
+    active, _ = read_members('roster.csv', validate=False, assignments='terms.csv', as_of=date(2025, 2, 1))
+    assert [(m.last_name, m.office) for m in active] == [('Smith', None), ('Lee', 'Alpha')]
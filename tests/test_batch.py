@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from docx import Document
+
+import constants
+from batch import run_batch
+from equivalence import synthetic_roster
+from generator import read_members, write
+from profiles import DEFAULT_PROFILE, apply_profile, load_profile
+
+SMALL_EXEC = {'exec': ['Alpha', 'Sigma']}
+
+@pytest.fixture
+def default_profile():
+    yield
+    apply_profile(DEFAULT_PROFILE)
+
+def _exec_rows(path):
+    return len(Document(path).tables[1].rows) - 1
+
+def _manifest(workdir):
+    synthetic_roster(seed=1, brothers=3).to_csv('roster.csv', index=False)
+    (workdir / 'small_exec.json').write_text(json.dumps(SMALL_EXEC))
+    manifest = {'chapters': [
+        {'id': 'alpha', 'roster': 'roster.csv'},
+        {'id': 'beta', 'roster': 'roster.csv', 'profile': 'small_exec.json'},
+    ]}
+    (workdir / 'manifest.json').write_text(json.dumps(manifest))
+    return str(workdir / 'manifest.json')
+
+def test_profile_applies_to_later_outputs(workdir, default_profile):
+    synthetic_roster(seed=1, brothers=3).to_csv('roster.csv', index=False)
+    (workdir / 'small_exec.json').write_text(json.dumps(SMALL_EXEC))
+    rosters = read_members('roster.csv')
+
+    write(*rosters, outputs=['exec'], docx_output_dir='default')
+    apply_profile(load_profile('small_exec.json'))
+    assert constants.exec == ['Alpha', 'Sigma']
+    write(*rosters, outputs=['exec'], docx_output_dir='profiled')
+    # Patching reads the profile at use time too
+    write(*rosters, outputs=['exec'], docx_output_dir='default', patch=True)
+
+    assert _exec_rows('default/Exec Minutes Outline.docx') == 2
+    assert _exec_rows('profiled/Exec Minutes Outline.docx') == 2
+    apply_profile(load_profile())
+    assert constants.exec == DEFAULT_PROFILE['exec']
+
+def test_unknown_profile_keys_are_rejected(workdir):
+    (workdir / 'bad.json').write_text(json.dumps({'officer': ['Alpha']}))
+    with pytest.raises(ValueError, match='officer'):
+        load_profile('bad.json')
+
+def test_batch_uses_each_chapters_profile(workdir):
+    completed, failed = run_batch(_manifest(workdir), workers=2)
+    assert sorted(completed) == ['alpha', 'beta'] and failed == {}
+    assert _exec_rows('alpha/Minutes/Exec Minutes Outline.docx') == len(DEFAULT_PROFILE['exec'])
+    assert _exec_rows('beta/Minutes/Exec Minutes Outline.docx') == 2
+
+def test_batch_resumes_from_checkpoint(workdir):
+    manifest = _manifest(workdir)
+    with open(manifest + '.checkpoint', 'w') as log:
+        log.write(json.dumps({'id': 'alpha', 'status': 'done'}) + '\n{"id": "be')  # torn last line
+
+    completed, failed = run_batch(manifest, workers=1)
+    assert completed == ['beta']
+    assert not (workdir / 'alpha').exists()
+    assert run_batch(manifest) == ([], {})
@@ -0,0 +1,67 @@
+import os
+import sys
+import stat
+import threading
+
+import pytest
+
+import daemon
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'runtime'
+    path.mkdir(mode=0o700)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(path))
+    return path
+
+def test_state_is_user_only(runtime_dir):
+    daemon._write_state(('127.0.0.1', 5000), b'key')
+    path = runtime_dir / 'minute-roster-generator' / daemon.STATE_NAME
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+    assert daemon._read_state() == (('127.0.0.1', 5000), b'key')
+    assert os.listdir(path.parent) == [daemon.STATE_NAME]
+
+def test_untrusted_state_is_ignored(runtime_dir, tmp_path):
+    daemon._write_state(('127.0.0.1', 5000), b'key')
+    path = runtime_dir / 'minute-roster-generator' / daemon.STATE_NAME
+    path.chmod(0o644)
+    assert daemon._read_state() is None
+
+    planted = tmp_path / 'planted.json'
+    planted.write_text('{"address": ["127.0.0.1", 6000], "authkey": "00"}')
+    planted.chmod(0o600)
+    path.unlink()
+    path.symlink_to(planted)
+    assert daemon._read_state() is None
+
+def test_state_dir_falls_back_to_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    monkeypatch.setenv('HOME', str(tmp_path))
+    (tmp_path / '.cache' / 'minute-roster-generator').mkdir(parents=True, mode=0o755)
+    assert daemon.state_dir() == str(tmp_path / '.cache' / 'minute-roster-generator')
+    assert stat.S_IMODE(os.stat(daemon.state_dir()).st_mode) == 0o700
+
+def test_frozen_executable_serves_through_itself(monkeypatch):
+    commands = []
+    monkeypatch.setattr(daemon.subprocess, 'Popen', lambda command, **options: commands.append(command))
+    monkeypatch.setattr(daemon, '_connect', lambda: 'connection')
+    monkeypatch.setattr(sys, 'frozen', True, raising=False)
+    assert daemon.start_daemon(idle_timeout=5) == 'connection'
+    assert commands == [[sys.executable, 'serve', '--idle-timeout', '5']]
+
+def test_serve_and_stop(runtime_dir):
+    thread = threading.Thread(target=daemon.serve, args=(60,))
+    thread.start()
+    for _ in range(100):
+        conn = daemon._connect()
+        if conn is not None:
+            break
+        thread.join(0.1)
+    with conn:
+        conn.send({'kind': 'ping'})
+        assert conn.recv() == ('ok', os.getpid())
+    assert daemon.stop()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert daemon._read_state() is None
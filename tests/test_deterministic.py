@@ -0,0 +1,44 @@
+import os
+import time
+import shutil
+
+from equivalence import synthetic_roster
+from generator import split_roster, write
+from ooxml import iter_compressed_entries, normalize_package, read_manifest
+
+def _files(folder):
+    return {name: open(os.path.join(folder, name), 'rb').read() for name in sorted(os.listdir(folder))}
+
+def test_identical_rosters_give_identical_bytes(workdir):
+    rosters = split_roster(synthetic_roster(seed=2, brothers=20))
+    write(*rosters, docx_output_dir='a/Minutes', xlsx_output_dir='a/Rosters', deterministic=True)
+    time.sleep(2)  # zip timestamps have two-second resolution
+    write(*rosters, docx_output_dir='b/Minutes', xlsx_output_dir='b/Rosters', deterministic=True)
+
+    for folder in ('Minutes', 'Rosters'):
+        assert _files(f'a/{folder}') == _files(f'b/{folder}')
+    assert sorted(read_manifest('a/Minutes')) == sorted(n for n in os.listdir('a/Minutes') if n.endswith('.docx'))
+
+def test_only_written_files_are_normalized(workdir):
+    rosters = split_roster(synthetic_roster(seed=1, brothers=3))
+    write(*rosters, outputs=['chapter'])
+    shutil.copy('Minutes/Chapter Minutes Outline.docx', 'Minutes/My Notes.docx')
+    before = open('Minutes/My Notes.docx', 'rb').read()
+
+    write(*rosters, outputs=['house'], deterministic=True)
+    assert open('Minutes/My Notes.docx', 'rb').read() == before
+    assert list(read_manifest('Minutes')) == ['House Minutes Outline.docx']
+
+    # Earlier entries are kept while their files exist
+    write(*rosters, outputs=['exec'], deterministic=True)
+    assert sorted(read_manifest('Minutes')) == ['Exec Minutes Outline.docx', 'House Minutes Outline.docx']
+
+def test_normalizing_keeps_compressed_entries(workdir):
+    write(*split_roster(synthetic_roster(seed=1, brothers=3)), outputs=['chapter'])
+    path = 'Minutes/Chapter Minutes Outline.docx'
+    before = {name: compressed for name, _, _, compressed in iter_compressed_entries(path)}
+    normalize_package(path)
+    after = {name: compressed for name, _, _, compressed in iter_compressed_entries(path)}
+
+    assert after.keys() == before.keys()
+    assert [n for n in before if before[n] != after[n]] == ['docProps/core.xml']
@@ -0,0 +1,39 @@
+import os
+import shutil
+
+import pytest
+
+from equivalence import GOLDEN_DIR, GOLDEN_ROSTERS, check_golden, compare_dirs, compare_files
+
+def test_outputs_match_the_checked_in_baseline(workdir):
+    assert check_golden('work') == {}
+
+def test_changes_a_reader_would_see_are_reported(workdir):
+    from docx import Document
+
+    shutil.copytree(f'{GOLDEN_DIR}/small', 'small')
+    path = 'small/Minutes/Exec Minutes Outline.docx'
+    doc = Document(path)
+    doc.tables[1].rows[1].cells[1].text = 'Someone Else'
+    doc.paragraphs[0].runs[0].bold = not doc.paragraphs[0].runs[0].bold
+    doc.save(path)
+
+    differences = compare_files(f'{GOLDEN_DIR}/small/Minutes/Exec Minutes Outline.docx', path)
+    assert any('Someone Else' in d for d in differences)
+    assert len(differences) >= 2
+    assert list(compare_dirs(f'{GOLDEN_DIR}/small', 'small')) == ['Minutes/Exec Minutes Outline.docx']
+
+def test_widths_can_be_ignored(workdir):
+    from openpyxl import load_workbook
+
+    golden = f'{GOLDEN_DIR}/typical/Rosters/Officer Roster and Minutes Rosters.xlsx'
+    wb = load_workbook(golden)
+    wb.active.column_dimensions['A'].width = 99
+    wb.save('roster.xlsx')
+    assert compare_files(golden, 'roster.xlsx')
+    assert compare_files(golden, 'roster.xlsx', widths=False) == []
+
+@pytest.mark.parametrize('case', sorted(GOLDEN_ROSTERS))
+def test_golden_outputs_are_checked_in(case):
+    assert sorted(os.listdir(f'{GOLDEN_DIR}/{case}/Rosters')) == ['Officer Roster and Minutes Rosters.xlsx']
+    assert len([n for n in os.listdir(f'{GOLDEN_DIR}/{case}/Minutes') if n.endswith('.docx')]) == 7
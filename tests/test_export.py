@@ -0,0 +1,19 @@
+import csv
+import subprocess
+import sys
+
+from equivalence import synthetic_roster
+from conftest import ROOT
+
+def test_export_cli_writes_csv_and_html(workdir):
+    synthetic_roster(seed=2, brothers=5).to_csv('roster.csv', index=False)
+    subprocess.run([sys.executable, f'{ROOT}/export.py', 'roster.csv', '--output', 'out'], check=True)
+
+    with open('out/brothers.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 1 + 5
+    assert rows[0] == ['Brothers', 'First Name', 'Opening Roll', 'Closing Roll']
+    assert all(r[0].startswith('Brother') and r[2:] == ['P', 'P'] for r in rows[1:])
+    page = (workdir / 'out' / 'rosters.html').read_text(encoding='utf-8')
+    assert page.count('<section>') == 8
+    assert not (workdir / 'Rosters').exists() and not (workdir / 'Minutes').exists()
@@ -0,0 +1,66 @@
+import os
+import threading
+
+import pytest
+
+import loader
+from equivalence import synthetic_roster
+from generator import read_members
+from loader import LoadCancelled, RosterLoader
+from roster import build_roster_tables
+
+@pytest.fixture
+def roster_loader():
+    roster_loader = RosterLoader()
+    yield roster_loader
+    roster_loader.close()
+
+def test_load_is_reused_while_the_file_is_unchanged(workdir, roster_loader):
+    synthetic_roster(seed=4, brothers=10).to_csv('roster.csv', index=False)
+    future = roster_loader.request('roster.csv')
+    assert roster_loader.request('roster.csv') is future
+    loaded = roster_loader.result('roster.csv')
+
+    active, staff = read_members('roster.csv')
+    assert [m.name for m in loaded.active] == [m.name for m in active]
+    expected = build_roster_tables(active, staff)
+    assert {k: t.rows for k, t in loaded.tables.items()} == {k: t.rows for k, t in expected.items()}
+    assert 'sorted_brothers' in vars(loaded.derived)
+
+    synthetic_roster(seed=4, brothers=11).to_csv('roster.csv', index=False)
+    os.utime('roster.csv', ns=(0, os.stat('roster.csv').st_mtime_ns + 1))
+    assert roster_loader.request('roster.csv') is not future
+    assert len(roster_loader.result('roster.csv').active) == len(loaded.active) + 1
+
+def test_picking_another_file_cancels_the_load(workdir, roster_loader, monkeypatch):
+    synthetic_roster(seed=4, brothers=10).to_csv('a.csv', index=False)
+    synthetic_roster(seed=5, brothers=10).to_csv('b.csv', index=False)
+    started, release = threading.Event(), threading.Event()
+    def slow_read(path):
+        if path.endswith('a.csv'):
+            started.set()
+            release.wait(5)
+        return read_members(path)
+    monkeypatch.setattr(loader, 'read_members', slow_read)
+
+    first = roster_loader.request('a.csv')
+    assert started.wait(5)
+    second = roster_loader.request('b.csv')
+    release.set()
+    with pytest.raises(LoadCancelled):
+        first.result(5)
+    assert len(second.result(5).active) > 0
+
+def test_failed_load_is_retried(workdir, roster_loader, monkeypatch):
+    # A file that was briefly unreadable is loaded again though it is unchanged
+    synthetic_roster(seed=4, brothers=10).to_csv('roster.csv', index=False)
+    failures = [OSError('locked by another program')]
+    def flaky_read(path):
+        if failures:
+            raise failures.pop()
+        return read_members(path)
+    monkeypatch.setattr(loader, 'read_members', flaky_read)
+
+    with pytest.raises(OSError):
+        roster_loader.result('roster.csv')
+    assert roster_loader.result('roster.csv').active
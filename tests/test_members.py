@@ -0,0 +1,35 @@
+import os
+import sys
+import subprocess
+
+from conftest import ROOT
+from equivalence import synthetic_roster
+from generator import read, read_members
+from members import Member, as_members, officers_of, sorted_by_name, without_offices
+
+def _members():
+    return [Member('Smith', 'Ann', 'Alpha/ Beta', 'Active', 0), Member('lee', 'Bo', None, 'Active', 1),
+            Member(None, 'Cy', 'alpha', 'Active', 2), Member('Lee', 'al', 'Chapter Advisor', 'Alumni', 3)]
+
+def test_member_queries():
+    members = _members()
+    assert members[0].positions == ['Alpha', 'Beta'] and members[1].positions == []
+    assert [(role, m.first_name) for role, m in officers_of(members, ['Beta', 'Alpha'])] == [('Beta', 'Ann'), ('Alpha', 'Ann'), ('Alpha', 'Cy')]
+    assert [m.first_name for m in without_offices(members, ['Alpha', 'Beta'])] == ['Bo', 'Cy', 'al']
+    assert [m.first_name for m in sorted_by_name(members)] == ['al', 'Bo', 'Ann', 'Cy']
+
+def test_records_match_the_dataframe_path(workdir):
+    synthetic_roster(seed=3, brothers=15).to_csv('roster.csv', index=False)
+    for records, frame in zip(read_members('roster.csv'), read('roster.csv')):
+        assert [(m.last_name, m.first_name, m.office, m.row) for m in records] == \
+               [(m.last_name, m.first_name, m.office, m.row) for m in as_members(frame)]
+
+def test_generates_without_pandas(workdir):
+    synthetic_roster(seed=3, brothers=15).to_csv('roster.csv', index=False)
+    script = (
+        "import sys; sys.modules['pandas'] = None; sys.path.insert(0, sys.argv[1])\n"
+        "from generator import read_members, write\n"
+        "write(*read_members('roster.csv'))\n"
+    )
+    subprocess.run([sys.executable, '-c', script, ROOT], check=True)
+    assert len(os.listdir('Minutes')) == 7 and os.listdir('Rosters')
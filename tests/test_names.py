@@ -0,0 +1,23 @@
+import pandas as pd
+
+from names import clean_names, find_duplicates, soundex
+
+def _roster(*names):
+    return pd.DataFrame(names, columns=['Last Name', 'First Name'])
+
+def test_soundex():
+    assert [soundex(n) for n in ('robert', 'rupert', 'ashcraft', 'tymczak', '')] == ['R163', 'R163', 'A261', 'T522', '']
+
+def test_near_duplicates_are_found():
+    df = _roster(('Smith', 'Jonathan'), ('Anderson', 'Amy'), ('Andersen', 'Amy'), ('smith', 'Jon'), ('Smith 2', 'Jon'), ('Smyth', 'Jane'))
+    pairs = find_duplicates(df)
+    assert set(zip(pairs['row_a'], pairs['row_b'])) == {(0, 3), (1, 2)}
+    assert pairs['score'].is_monotonic_decreasing
+
+def test_blank_names_are_not_duplicates():
+    df = clean_names(_roster(('', 'Amy'), (' ', 'Amy'), (None, 'Bo'), ('Lee', ''), ('Lee', None), ('Lee', 'Cy')))
+    assert find_duplicates(df).empty
+
+def test_duplicate_index_labels():
+    df = pd.concat([_roster(('Smith', 'Ann')), _roster(('Smith', 'Ann'))])
+    assert find_duplicates(df)[['row_a', 'row_b', 'score']].values.tolist() == [[0, 0, 1.0]]
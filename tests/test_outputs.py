@@ -0,0 +1,58 @@
+import os
+import hashlib
+import zipfile
+
+import pytest
+from docx import Document
+
+from equivalence import synthetic_roster
+from generator import OUTPUTS, read_members, write
+from patch import OUTLINE_FILES
+from roster import DerivedTables
+
+@pytest.fixture
+def rosters(workdir):
+    synthetic_roster(seed=2, brothers=12).to_csv('roster.csv', index=False)
+    return read_members('roster.csv')
+
+def test_only_requested_outputs_are_written(rosters):
+    write(*rosters, outputs=['exec', 'finance'])
+    assert sorted(os.listdir('Minutes')) == ['Exec Minutes Outline.docx', 'Finance Committee Outline.docx']
+    assert not os.path.exists('Rosters')
+
+def test_unknown_outputs_are_rejected(rosters):
+    with pytest.raises(ValueError, match='minutes'):
+        write(*rosters, outputs=['exec', 'minutes'])
+    assert not os.path.exists('Minutes')
+
+def test_derived_tables_are_built_once_and_only_when_needed(rosters):
+    derived = DerivedTables(*rosters)
+    write(*rosters, outputs=['chapter', 'house'], derived=derived)
+    assert 'sorted_brothers' in vars(derived)
+    assert 'brothers' not in vars(derived) and not derived._role_tables
+
+    sorted_brothers = derived.sorted_brothers
+    write(*rosters, outputs=OUTPUTS, derived=derived)
+    assert derived.sorted_brothers is sorted_brothers
+    assert 'brothers' in vars(derived) and derived._role_tables
+
+def _body(doc):
+    return [p.text for p in doc.paragraphs if p.text], [[c.text for c in t._cells] for t in doc.tables]
+
+def test_combined_outline_has_one_section_per_outline(rosters):
+    outlines = ['house', 'exec', 'chapter']
+    write(*rosters, outputs=outlines, combined=True, docx_output_dir='combined')
+    write(*rosters, outputs=outlines, docx_output_dir='separate')
+    assert os.listdir('combined') == ['Meeting Minutes Outlines.docx']
+
+    combined = Document('combined/Meeting Minutes Outlines.docx')
+    # In COMBINED_ORDER, each starting a new page with a header of its own
+    assert len(combined.sections) == 3
+    assert all(not s.header.is_linked_to_previous for s in combined.sections[1:])
+    separate = [Document(os.path.join('separate', OUTLINE_FILES[name])) for name in ('chapter', 'house', 'exec')]
+    assert _body(combined) == tuple(sum(parts, []) for parts in zip(*map(_body, separate)))
+
+    # Crests shared by the outlines are stored once
+    with zipfile.ZipFile('combined/Meeting Minutes Outlines.docx') as zf:
+        media = [hashlib.sha256(zf.read(n)).hexdigest() for n in zf.namelist() if n.startswith('word/media/')]
+    assert media and len(media) == len(set(media))
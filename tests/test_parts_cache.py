@@ -0,0 +1,79 @@
+import os
+import zlib
+import hashlib
+import zipfile
+
+import pytest
+from docx import Document
+
+import ooxml
+from ooxml import compressed_part, iter_compressed_entries, save_document
+
+def _parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+def test_save_document_matches_save(workdir):
+    doc = Document()
+    doc.add_paragraph('Roll call')
+    doc.save('plain.docx')
+    save_document(doc, 'cached.docx')
+
+    assert _parts('cached.docx') == _parts('plain.docx')
+    assert zipfile.ZipFile('cached.docx').testzip() is None
+    assert [p.text for p in Document('cached.docx').paragraphs] == ['Roll call']
+
+def test_unchanged_parts_are_copied_not_recompressed(workdir):
+    for name in ('a', 'b'):
+        doc = Document()
+        doc.add_paragraph(name)
+        save_document(doc, f'{name}.docx')
+    a = {name: compressed for name, _, _, compressed in iter_compressed_entries('a.docx')}
+    b = {name: compressed for name, _, _, compressed in iter_compressed_entries('b.docx')}
+    assert a['word/styles.xml'] == b['word/styles.xml']
+    assert a['word/document.xml'] != b['word/document.xml']
+
+def test_part_cache_on_disk(workdir, monkeypatch):
+    data = b'<w:styles>' + b'<w:style/>' * 1000 + b'</w:styles>'
+    crc, size, compressed = compressed_part(data, cache_dir='parts')
+    assert (crc, size, zlib.decompress(compressed, -15)) == (zlib.crc32(data), len(data), data)
+    assert len(os.listdir('parts')) == 1
+
+    # A new process starts with an empty memory cache and reads the file instead of deflating
+    monkeypatch.setattr(ooxml, '_part_cache', {})
+    monkeypatch.setattr(ooxml, '_deflate', lambda data: pytest.fail("part was deflated again"))
+    assert compressed_part(data, cache_dir='parts') == (crc, size, compressed)
+
+def test_damaged_cache_files_are_replaced(workdir, monkeypatch):
+    data = b'<w:numbering>' + b'<w:num/>' * 1000 + b'</w:numbering>'
+    expected = compressed_part(data, cache_dir='parts')
+    path = os.path.join('parts', os.listdir('parts')[0])
+    with open(path, 'r+b') as f:
+        f.truncate(40)
+
+    monkeypatch.setattr(ooxml, '_part_cache', {})
+    assert compressed_part(data, cache_dir='parts') == expected
+    with open(path, 'rb') as f:
+        assert f.read()[8:] == expected[2]
+
+def test_part_cache_location(workdir, monkeypatch):
+    assert ooxml.part_cache_dir() == str(workdir / '.part-cache')
+    monkeypatch.setenv('MINUTES_PART_CACHE', 'elsewhere')
+    compressed_part(b'<w:font/>' * 1000)
+    assert len(os.listdir('elsewhere')) == 1
+    monkeypatch.setenv('MINUTES_PART_CACHE', '')
+    assert ooxml.part_cache_dir() is None
+
+def test_part_cache_drops_the_least_recently_used(workdir, monkeypatch):
+    parts = [b'<w:style/>' * 1000 + bytes([i]) for i in range(3)]
+    files = [os.path.join('parts', hashlib.sha256(data).hexdigest() + '.deflate') for data in parts]
+    for i, (data, path) in enumerate(zip(parts, files)):
+        compressed_part(data, cache_dir='parts')
+        os.utime(path, (i, i))
+
+    # Using the oldest makes the second one the least recently used
+    monkeypatch.setattr(ooxml, '_part_cache', {})
+    compressed_part(parts[0], cache_dir='parts')
+    monkeypatch.setattr(ooxml, 'PART_CACHE_MAX_BYTES', sum(map(os.path.getsize, files)) - 1)
+    ooxml.trim_part_cache('parts')
+    assert [os.path.isfile(path) for path in files] == [True, False, True]
@@ -0,0 +1,103 @@
+import pandas as pd
+from docx import Document
+
+from equivalence import compare_dirs, synthetic_roster
+from generator import split_roster, write
+
+def _rosters(df):
+    return split_roster(df)
+
+def _changed(df):
+    # A new Alpha, one brother gone and two joined: touches the officer
+    # tables, the parliamentary officers, the member counts and the
+    # number of blank new member rows
+    df = df.copy()
+    alpha = df.index[df['Current Office'] == 'Alpha'][0]
+    df.loc[alpha, 'First Name'] = 'Replaced'
+    brother = df.index[df['Current Office'].isna()][0]
+    df = df.drop(brother)
+    joined = pd.DataFrame([
+        {'Last Name': 'Aardvark', 'First Name': 'New', 'Current Office': None, 'Status': 'Active'},
+        {'Last Name': 'Zebra', 'First Name': 'New', 'Current Office': None, 'Status': 'Active'},
+    ])
+    return pd.concat([df, joined], ignore_index=True)
+
+def test_patch_matches_regenerate(workdir):
+    old = synthetic_roster(seed=2, brothers=12, double_offices=0)
+    write(*_rosters(old), docx_output_dir='patched/Minutes', xlsx_output_dir='patched/Rosters')
+
+    new = _changed(old)
+    write(*_rosters(new), docx_output_dir='patched/Minutes', xlsx_output_dir='patched/Rosters', patch=True)
+    write(*_rosters(new), docx_output_dir='fresh/Minutes', xlsx_output_dir='fresh/Rosters')
+
+    assert compare_dirs('fresh/Minutes', 'patched/Minutes') == {}
+    assert compare_dirs('fresh/Rosters', 'patched/Rosters') == {}
+
+def test_patch_keeps_notes_and_roll_marks(workdir):
+    old = synthetic_roster(seed=2, brothers=12, double_offices=0)
+    write(*_rosters(old), docx_output_dir='Minutes', xlsx_output_dir='Rosters')
+
+    path = 'Minutes/Chapter Minutes Outline.docx'
+    doc = Document(path)
+    doc.add_paragraph('Motion to buy a new grill passed')
+    brothers = next(t for t in doc.tables if t.rows[0].cells[0].text == 'Brothers')
+    kept = brothers.rows[-1]
+    kept.cells[2].text = 'A'
+    doc.save(path)
+
+    write(*_rosters(_changed(old)), docx_output_dir='Minutes', xlsx_output_dir='Rosters', patch=True)
+
+    doc = Document(path)
+    assert 'Motion to buy a new grill passed' in [p.text for p in doc.paragraphs]
+    brothers = next(t for t in doc.tables if t.rows[0].cells[0].text == 'Brothers')
+    marks = {(r.cells[0].text, r.cells[1].text): r.cells[2].text for r in brothers.rows[1:]}
+    assert marks[(kept.cells[0].text, kept.cells[1].text)] == 'A'
+    assert ('Aardvark', 'New') in marks
+    stats = next(p for p in doc.paragraphs if p.text.startswith('Total active members'))
+    assert stats.text.startswith(f'Total active members: {len(_rosters(_changed(old))[0])}')
+
+def test_patch_outputs_skips_unchanged_roster(workdir):
+    from patch import patch_outputs
+
+    old = synthetic_roster(seed=1, brothers=3, double_offices=0)
+    write(*_rosters(old), docx_output_dir='Minutes', xlsx_output_dir='Rosters')
+    assert patch_outputs(*_rosters(old), *_rosters(old)).empty
+
+    changes = patch_outputs(*_rosters(old), *_rosters(_changed(old)))
+    assert sorted(changes['Change']) == ['joined', 'joined', 'joined', 'left', 'left']
+
+def test_patch_keeps_appended_sheets(workdir):
+    import zipfile
+    from datetime import date
+    from openpyxl import load_workbook
+    from roster import append_roster, ROSTER_FILENAME
+
+    old = synthetic_roster(seed=3, brothers=6, double_offices=0)
+    write(*_rosters(old), outputs=['roster'])
+    active, staff = _rosters(old)
+    append_roster('Rosters', active, staff, meeting_date=date(2026, 1, 5))
+    path = f'Rosters/{ROSTER_FILENAME}'
+    with zipfile.ZipFile(path) as zf:
+        first_sheet = zf.read('xl/worksheets/sheet1.xml')
+
+    write(*_rosters(_changed(old)), outputs=['roster'], patch=True)
+
+    with zipfile.ZipFile(path) as zf:
+        assert zf.read('xl/worksheets/sheet1.xml') == first_sheet
+    wb = load_workbook(path)
+    assert wb.sheetnames == ['Sheet1', '2026-01-05']
+    values = {c.value for row in wb['2026-01-05'].iter_rows() for c in row}
+    assert 'Aardvark' in values and 'Replaced' in ' '.join(str(v) for v in values)
+
+def test_patch_writes_nothing_for_the_same_roster(workdir):
+    import os
+
+    old = synthetic_roster(seed=3, brothers=6, double_offices=0)
+    write(*_rosters(old))
+    paths = ['Rosters/Officer Roster and Minutes Rosters.xlsx'] + [os.path.join('Minutes', name) for name in os.listdir('Minutes')]
+    for path in paths:
+        os.utime(path, ns=(0, 0))
+
+    write(*_rosters(old), patch=True)
+
+    assert all(os.stat(path).st_mtime_ns == 0 for path in paths)
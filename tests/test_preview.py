@@ -0,0 +1,56 @@
+import pytest
+
+QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+from PyQt6.QtCore import Qt
+
+from equivalence import synthetic_roster
+from generator import split_roster
+from members import Table
+from preview import RosterPreview, TableModel
+from roster import build_roster_tables
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+def test_rows_are_exposed_in_batches(app):
+    model = TableModel(Table(['Name', 'Roll'], [[f'Member {i}', 'P'] for i in range(1200)]))
+    assert (model.rowCount(), model.columnCount()) == (500, 2)
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 1200
+
+    index = model.index(1199, 1)
+    assert model.data(index) == 'P'
+    assert model.data(index, Qt.ItemDataRole.TextAlignmentRole) == Qt.AlignmentFlag.AlignCenter
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.TextAlignmentRole) is None
+    assert model.headerData(1, Qt.Orientation.Horizontal) == 'Roll'
+
+def test_preview_shows_the_roster_tables(app):
+    tables = build_roster_tables(*split_roster(synthetic_roster(seed=2, brothers=12)))
+    preview = RosterPreview()
+    preview.show_tables(tables)
+
+    brothers = list(preview.models).index('BROTHERS')
+    assert preview.tabText(brothers) == f'Brothers ({len(tables["BROTHERS"])})'
+    assert preview.models['BROTHERS'].rowCount() == len(tables['BROTHERS'])
+
+    preview.clear_tables()
+    assert preview.tabText(brothers) == 'Brothers (0)'
+    assert preview.models['BROTHERS'].rowCount() == 0
+
+def test_typing_a_path_loads_once_it_pauses(app, workdir, monkeypatch):
+    from PyQt6.QtTest import QTest
+    import main
+
+    window = main.MinutesGeneratorApp()
+    requested = []
+    request = window.loader.request
+    monkeypatch.setattr(window.loader, 'request', lambda path: requested.append(path) or request(path))
+    try:
+        QTest.keyClicks(window.excel_input, 'missing.csv')
+        QTest.qWait(main.PREVIEW_DELAY_MS * 2)
+        assert requested == ['missing.csv']
+        assert window.status_label.text() == 'File not found.'
+    finally:
+        window.loader.close()
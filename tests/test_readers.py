@@ -0,0 +1,90 @@
+import zipfile
+
+import pandas as pd
+
+from equivalence import synthetic_roster
+from readers import read_roster, read_roster_columns, read_xlsx_columns, sniff_format
+
+def _roster():
+    return synthetic_roster(seed=5, brothers=6)
+
+def test_formats_read_the_same(workdir):
+    df = _roster()
+    df.to_csv('roster.csv', index=False)
+    df.to_parquet('roster.parquet', index=False)
+    with pd.ExcelWriter('roster.xlsx') as writer:
+        df.to_excel(writer, index=False)
+
+    frames = [read_roster(f'roster.{ext}') for ext in ('csv', 'parquet', 'xlsx')]
+    columns = [read_roster_columns(f'roster.{ext}') for ext in ('csv', 'parquet', 'xlsx')]
+    for frame in frames[1:]:
+        pd.testing.assert_frame_equal(frame, frames[0])
+    assert columns[0] == columns[1] == columns[2]
+    assert columns[0]['Current Office'][-1] == 'Asst. Chapter Advisor'
+    assert columns[0]['Current Office'][-4] is None
+
+def test_format_is_sniffed_from_content(workdir):
+    _roster().to_parquet('export.csv', index=False)
+    _roster().to_csv('export.xlsx', index=False)
+    assert sniff_format('export.csv') == 'parquet'
+    assert sniff_format('export.xlsx') == 'csv'
+    assert read_roster_columns('export.csv') == read_roster_columns('export.xlsx')
+
+def test_csv_banner_row_and_extra_columns(workdir):
+    with open('roster.csv', 'w', encoding='utf-8-sig') as f:
+        f.write('Chapter export,,,\nID,Last Name,First Name,Status,Current Office\n1,Smith,Ann,Active,Alpha\n\n2,Jones,Bo,Active,N/A\n')
+    assert read_roster_columns('roster.csv') == {
+        'Last Name': ['Smith', 'Jones'], 'First Name': ['Ann', 'Bo'],
+        'Current Office': ['Alpha', None], 'Status': ['Active', 'Active'],
+    }
+    assert list(read_roster('roster.csv').columns) == ['Last Name', 'First Name', 'Current Office', 'Status']
+
+def _xlsx(path, sheets):
+    # Minimal hand-written package, for cell encodings openpyxl doesn't produce
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('xl/workbook.xml', f'<workbook xmlns="{NS}" xmlns:r="{REL_NS}"><sheets>' + ''.join(
+            f'<sheet name="Sheet{i}" sheetId="{i}" r:id="rId{i}"/>' for i in range(1, len(sheets) + 1)) + '</sheets></workbook>')
+        zf.writestr('xl/_rels/workbook.xml.rels', '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">' + ''.join(
+            f'<Relationship Id="rId{i}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>' for i in range(1, len(sheets) + 1))
+            + f'<Relationship Id="rIdS" Type="{REL_NS}/sharedStrings" Target="/xl/sharedStrings.xml"/></Relationships>')
+        zf.writestr('xl/sharedStrings.xml', f'<sst xmlns="{NS}"><si><t>Last Name</t></si>'
+                    '<si><r><t>Sm</t></r><r><t>ith</t></r><rPh><t>SU</t></rPh></si><si><t>Unused</t></si></sst>')
+        for i, rows in enumerate(sheets, 1):
+            zf.writestr(f'xl/worksheets/sheet{i}.xml', f'<worksheet xmlns="{NS}"><sheetData>{rows}</sheetData></worksheet>')
+
+NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+def _inline(ref, text):
+    return f'<c r="{ref}" t="inlineStr"><is><t>{text}</t></is></c>'
+
+def test_xlsx_cell_encodings(workdir):
+    _xlsx('roster.xlsx', [
+        '<row r="1"><c r="A1"><v>1</v></c></row>',
+        # Header on the second sheet, below a banner; cells without refs follow on
+        '<row r="2">' + _inline('A2', 'Export') + '</row>'
+        '<row r="3"><c r="B3" t="s"><v>0</v></c>' + _inline('C3', 'First Name') + _inline('D3', 'Status') + _inline('E3', 'Current Office') + '</row>'
+        '<row r="4"><c r="B4" t="s"><v>1</v></c>' + _inline('C4', 'Ann') + _inline('D4', 'Active') + '<c><v>7</v></c></row>'
+        '<row r="6"><c r="B6" t="str"><v>Lee</v></c><c r="C6"><v>2.5</v></c>' + _inline('D6', 'Alumni') + '</row>',
+    ])
+    assert read_xlsx_columns('roster.xlsx') == {
+        'Last Name': ['Smith', None, 'Lee'], 'First Name': ['Ann', None, '2.5'],
+        'Current Office': ['7', None, None], 'Status': ['Active', None, 'Alumni'],
+    }
+
+def test_xlsx_matches_read_excel(workdir):
+    # With an empty row inside the roster, which the sheet leaves out
+    df = _roster()
+    df = pd.concat([df[:3], pd.DataFrame([[None] * 4], columns=df.columns), df[3:]], ignore_index=True)
+    with pd.ExcelWriter('roster.xlsx') as writer:
+        pd.DataFrame([['Chapter export']]).to_excel(writer, index=False, header=False)
+        df.assign(ID=range(len(df)), Notes='x').to_excel(writer, index=False, startrow=1)
+    expected = pd.read_excel('roster.xlsx', header=1, dtype={'Last Name': str, 'First Name': str, 'Current Office': str})
+    expected = expected[['Last Name', 'First Name', 'Current Office', 'Status']].astype({'Status': 'category'})
+    pd.testing.assert_frame_equal(read_roster('roster.xlsx'), expected)
+
+def test_xlsx_stops_at_a_run_of_blank_rows(workdir):
+    rows = ''.join(f'<row r="{r}">' + _inline(f'A{r}', name) + '</row>' for r, name in [(1, 'Last Name'), (2, 'Smith'), (4, 'Jones'), (20, 'Lee')])
+    _xlsx('roster.xlsx', [rows])
+    assert read_xlsx_columns('roster.xlsx')['Last Name'] == ['Smith', None, 'Jones', *[None] * 15, 'Lee']
+    assert read_xlsx_columns('roster.xlsx', blank_rows_to_stop=10)['Last Name'] == ['Smith', None, 'Jones']
@@ -0,0 +1,53 @@
+import os
+
+import pandas as pd
+from docx import Document
+
+from reports import generate_report_stubs, office_holders, stub_jobs
+
+def _active():
+    return pd.DataFrame([
+        ('Smith', 'Ann', 'Gamma/Alpha'),
+        ('Jones', 'Bo', None),
+        ("O'Neil", 'Cy & Co', 'Beta / Social'),
+        ('Lee', 'Di', 'Tau'),
+    ], columns=['Last Name', 'First Name', 'Current Office'])
+
+def test_office_holders():
+    holders = office_holders(_active())
+    assert holders.values.tolist() == [
+        ['Lee', 'Di', ['Tau']],
+        ["O'Neil", 'Cy & Co', ['Beta']],
+        ['Smith', 'Ann', ['Alpha', 'Gamma']],
+    ]
+
+def test_stubs_repeat_the_block_per_office(workdir):
+    jobs = stub_jobs(_active(), 'Reports')
+    assert generate_report_stubs(jobs, workers=1) == 3
+
+    path = os.path.join('Reports', 'Alpha-Gamma Report - Ann Smith.docx')
+    text = [p.text for p in Document(path).paragraphs]
+    assert 'Ann Smith\nAlpha / Gamma' in text
+    assert [t for t in text if t.endswith('Report —')] == ['Alpha Report —', 'Gamma Report —']
+    assert not any('{{' in t for t in text)
+    # Names are escaped into the XML, not injected
+    assert "Cy & Co O'Neil\nBeta" in [p.text for p in Document(os.path.join('Reports', "Beta Report - Cy & Co O'Neil.docx")).paragraphs]
+
+def test_parallel_batches_match_serial(workdir):
+    active = pd.concat([_active()] * 3, ignore_index=True)
+    active['Last Name'] += [str(i) for i in range(len(active))]
+    serial, parallel = stub_jobs(active, 'serial'), stub_jobs(active, 'parallel')
+    assert generate_report_stubs(serial, workers=1) == generate_report_stubs(parallel, workers=2, batch_size=2) == 9
+    for (a, _, _), (b, _, _) in zip(serial, parallel):
+        with open(a, 'rb') as f, open(b, 'rb') as g:
+            assert f.read() == g.read()
+
+def test_namesakes_get_their_own_stub(workdir):
+    active = pd.DataFrame([('Smith', 'Ann', 'Alpha'), ('Smith', 'Ann', 'Alpha'), ('SMITH', 'ANN', 'Alpha')],
+                          columns=['Last Name', 'First Name', 'Current Office'])
+    jobs = stub_jobs(active, 'Reports')
+    assert [os.path.basename(path) for path, _, _ in jobs] == [
+        'Alpha Report - ANN SMITH.docx', 'Alpha Report - Ann Smith (2).docx', 'Alpha Report - Ann Smith (3).docx',
+    ]
+    assert generate_report_stubs(jobs, workers=1) == 3
+    assert len(os.listdir('Reports')) == 3
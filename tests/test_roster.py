@@ -0,0 +1,124 @@
+import os
+import zipfile
+from datetime import date
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+from equivalence import synthetic_roster
+from generator import read_members
+from members import Table
+from ooxml import iter_compressed_entries
+from roster import BOLD, CENTER, ROSTER_FILENAME, RosterLayout, append_roster, create_roster, create_segment
+
+OFFICERS = Table(['Office', 'Name', 'Opening Roll', 'Closing Roll'], [['Alpha', 'Longname Person', 'P', 'P']])
+
+def test_table_columns_fit_their_values(workdir):
+    layout = RosterLayout()
+    layout.add_table(OFFICERS, 0, 0, 'EXEC')
+    # The merged 'Officers' header hides column B's placeholder; roll headers count
+    assert layout.widths == {1: len('Officers') + 7, 2: len('Longname Person') + 7,
+                             3: len('Opening Roll') + 7, 4: len('Closing Roll') + 7}
+
+def test_last_table_planned_in_a_column_sets_its_width(workdir):
+    layout = RosterLayout()
+    layout.add_table(OFFICERS, 0, 0, 'EXEC')
+    short = Table(['Brothers', 'First Name'], [['Ng', 'Al']])
+    end = layout.add_segmented_table(create_segment(short), 10, 0)
+    assert end == 13
+    assert layout.widths[1] == len('Brothers') + 7
+    assert layout.widths[2] == len('First Name') + 7
+    assert layout.widths[3] == len('Opening Roll') + 7
+
+def test_saved_sheet_matches_the_plan(workdir):
+    layout = RosterLayout()
+    layout.add_table(OFFICERS, 0, 0, 'EXEC')
+    layout.save('roster.xlsx')
+
+    ws = load_workbook('roster.xlsx').active
+    assert [[c.value for c in row] for row in ws.iter_rows()] == [
+        ['EXEC', None, None, None],
+        ['Officers', None, 'Opening Roll', 'Closing Roll'],
+        ['Alpha', 'Longname Person', 'P', 'P'],
+    ]
+    assert sorted(str(r) for r in ws.merged_cells.ranges) == ['A1:D1', 'A2:B2']
+    assert ws.column_dimensions['B'].width == len('Longname Person') + 7
+    assert ws['C3'].alignment.horizontal == 'center' and ws['A2'].font.b
+
+def _openpyxl_workbook(layout, path):
+    # The same plan written cell by cell through openpyxl
+    wb = Workbook()
+    ws = wb.active
+    for (row, column), (value, bold, centered) in layout.cells.items():
+        cell = ws.cell(row=row, column=column, value=value if value != '' else None)
+        if bold:
+            cell.font = BOLD
+        if centered:
+            cell.alignment = CENTER
+    for merge in layout.merges:
+        ws.merge_cells(start_row=merge[0], start_column=merge[1], end_row=merge[2], end_column=merge[3])
+    for column, width in layout.widths.items():
+        ws.column_dimensions[get_column_letter(column)].width = width
+    wb.save(path)
+
+def _sheet(path):
+    ws = load_workbook(path).active
+    cells = [(c.coordinate, c.value, bool(c.font.b), c.alignment.horizontal) for row in ws.iter_rows() for c in row]
+    widths = {k: d.width for k, d in ws.column_dimensions.items()}
+    return cells, sorted(map(str, ws.merged_cells.ranges)), widths
+
+def test_streamed_sheet_matches_openpyxl(workdir):
+    layout = RosterLayout()
+    layout.add_table(Table(['Office', 'Name', 'Opening Roll', 'Closing Roll'],
+                           [['Alpha', ' A & <B> ', 'P', 'P'], ['Beta', 'Ng', 'E', 'P']]), 0, 0, 'EXEC')
+    layout.add_segmented_table(create_segment(Table(['Others', 'Roll'], [(' ', 'P')] * 2), titles=['Guests']), 6, 0)
+    layout.put(20, 1, 3.5)
+    layout.save('streamed.xlsx', title='Roll & Call')
+    _openpyxl_workbook(layout, 'openpyxl.xlsx')
+
+    assert _sheet('streamed.xlsx') == _sheet('openpyxl.xlsx')
+    assert load_workbook('streamed.xlsx').sheetnames == ['Roll & Call']
+    # Every format is defined once in the stylesheet, not once per cell
+    with zipfile.ZipFile('streamed.xlsx') as zf:
+        assert zf.read('xl/styles.xml').count(b'<xf ') <= 5
+
+def _rosters():
+    synthetic_roster(seed=3, brothers=12).to_csv('roster.csv', index=False)
+    return read_members('roster.csv')
+
+def _values(ws):
+    return [[c.value for c in row] for row in ws.iter_rows()]
+
+def test_append_adds_dated_sheets(workdir):
+    rosters = _rosters()
+    os.makedirs('Rosters')
+    assert append_roster('Rosters', *rosters, meeting_date=date(2026, 1, 5)) == '2026-01-05'
+    assert append_roster('Rosters', *rosters, meeting_date=date(2026, 1, 5)) == '2026-01-05 (2)'
+    assert append_roster('Rosters', *rosters, meeting_date=date(2026, 1, 12)) == '2026-01-12'
+
+    create_roster('.', *rosters)
+    fresh = load_workbook(ROSTER_FILENAME).active
+    wb = load_workbook(os.path.join('Rosters', ROSTER_FILENAME))
+    assert wb.sheetnames == ['2026-01-05', '2026-01-05 (2)', '2026-01-12']
+    assert all(_values(ws) == _values(fresh) for ws in wb.worksheets)
+    assert wb['2026-01-12']['A1'].font.b and wb['2026-01-12']['A1'].alignment.horizontal == 'center'
+
+def test_append_keeps_existing_sheets_byte_for_byte(workdir):
+    # A workbook kept by hand, whose stylesheet lacks the roster formats
+    wb = Workbook()
+    wb.active.title = 'Notes'
+    wb.active['A1'] = 'Dues paid'
+    wb.active['A1'].font = Font(italic=True)
+    wb.save(ROSTER_FILENAME)
+    before = {name: entry for name, *entry in iter_compressed_entries(ROSTER_FILENAME)}
+
+    append_roster('.', *_rosters(), meeting_date=date(2026, 1, 5))
+    after = {name: entry for name, *entry in iter_compressed_entries(ROSTER_FILENAME)}
+    assert after['xl/worksheets/sheet1.xml'] == before['xl/worksheets/sheet1.xml']
+    assert set(before) < set(after)
+
+    wb = load_workbook(ROSTER_FILENAME)
+    assert wb.sheetnames == ['Notes', '2026-01-05']
+    assert wb['Notes']['A1'].value == 'Dues paid' and wb['Notes']['A1'].font.i
+    assert wb['2026-01-05']['A1'].font.b and not wb['2026-01-05']['A1'].font.i
@@ -0,0 +1,58 @@
+import os
+import shutil
+
+from docx import Document
+
+from equivalence import synthetic_roster
+from generator import split_roster, write
+from search import MinutesIndex, extract_minutes, parse_date
+
+def _fill_chapter_minutes(path):
+    # What a secretary types into the outline during the meeting
+    doc = Document(path)
+    paragraphs = doc.paragraphs
+    by_text = {p.text.strip(): i for i, p in enumerate(paragraphs)}
+    paragraphs[2].runs[-1].text = 'March 2, 2025'
+    paragraphs[by_text['Roll -']].runs[-1].text = 'Roll - 18 present'
+    paragraphs[by_text['New Business -'] + 1].insert_paragraph_before('Motion to buy a grill for the house passed')
+    doc.save(path)
+
+def _archive():
+    write(*split_roster(synthetic_roster(seed=1, brothers=5)), outputs=['chapter', 'exec'])
+    os.makedirs('archive/2025')
+    shutil.copy('Minutes/Chapter Minutes Outline.docx', 'archive/2025/chapter.docx')
+    _fill_chapter_minutes('archive/2025/chapter.docx')
+    shutil.copy('Minutes/Exec Minutes Outline.docx', 'archive/2025/2025-02-20 exec.docx')
+
+def test_parse_date():
+    assert [parse_date(t) for t in ('2025-3-2', 'held 03-02-25', 'March 2, 2025', '13/45/2025', 'Date')] == \
+           ['2025-03-02', '2025-03-02', '2025-03-02', None, None]
+
+def test_filled_outline_is_tagged(workdir):
+    _archive()
+    meeting, when, passages = extract_minutes('archive/2025/chapter.docx')
+    assert (meeting, when) == ('chapter', '2025-03-02')
+    assert ('Roll', '18 present') in passages
+    assert ('New Business', 'Motion to buy a grill for the house passed') in passages
+    # Sections left empty are still recorded, by their heading
+    assert ('Elections', 'Elections') in passages
+    assert extract_minutes('archive/2025/2025-02-20 exec.docx')[:2] == ('exec', '2025-02-20')
+
+def test_search(workdir):
+    _archive()
+    with MinutesIndex('index.sqlite') as index:
+        assert index.update('archive', workers=1) == (2, 0)
+        hit, = index.search('grill motion*')
+        assert (os.path.basename(hit.path), hit.meeting, hit.date, hit.section) == ('chapter.docx', 'chapter', '2025-03-02', 'New Business')
+        assert [h.section for h in index.search('present', section='roll')] == ['Roll']
+        assert [h.text for h in index.search('elections', section='Elections')] == ['Elections']
+        assert {h.meeting for h in index.search('alpha')} == {'chapter', 'exec'}
+        assert {h.meeting for h in index.search('alpha', meeting='exec')} == {'exec'}
+        assert {h.date for h in index.search('alpha', until='2025-02-28')} == {'2025-02-20'}
+        assert index.search('alpha', year=2024) == []
+
+        # Only changed and removed minutes are touched
+        assert index.update('archive', workers=1) == (0, 0)
+        os.remove('archive/2025/chapter.docx')
+        assert index.update('archive', workers=1) == (0, 1)
+        assert index.search('grill') == []
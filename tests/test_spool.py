@@ -0,0 +1,75 @@
+import os
+
+from equivalence import synthetic_roster
+from spool import (DONE, FAILED, LEASED, PENDING, claim_job, expire_leases,
+                   job_status, run_worker, submit_job)
+
+def test_worker_runs_queued_jobs(workdir):
+    synthetic_roster(seed=1, brothers=3).to_csv('roster.csv', index=False)
+    ok = submit_job('spool', 'roster.csv', 'out')
+    broken = submit_job('spool', 'missing.csv', 'out2')
+
+    assert run_worker('spool', worker_id='w1', exit_when_idle=True) == 2
+    state, record = job_status('spool', ok)
+    assert state == DONE and record['worker'] == 'w1'
+    assert os.path.isfile('out/Minutes/Chapter Minutes Outline.docx')
+    assert job_status('spool', broken)[0] == FAILED
+    assert os.listdir(os.path.join('spool', LEASED)) == []
+
+def test_a_job_is_claimed_once(workdir):
+    job_id = submit_job('spool', 'roster.csv', 'out')
+    lease_path, job = claim_job('spool', 'w1')
+    assert job['id'] == job_id and lease_path.endswith(f'{job_id}.w1.json')
+    assert claim_job('spool', 'w2') == (None, None)
+    assert job_status('spool', job_id) == (LEASED, None)
+
+def test_stale_leases_are_retried_then_failed(workdir):
+    job_id = submit_job('spool', 'roster.csv', 'out')
+    for attempt in (1, 2):
+        lease_path, _ = claim_job('spool', 'crashed')
+        os.utime(lease_path, (0, 0))
+        assert expire_leases('spool', max_attempts=3) == 1
+        state, job = job_status('spool', job_id)
+        assert state == PENDING and job['attempts'] == attempt
+
+    lease_path, _ = claim_job('spool', 'crashed')
+    assert expire_leases('spool', max_attempts=3) == 0  # still fresh
+    os.utime(lease_path, (0, 0))
+    expire_leases('spool', max_attempts=3)
+    state, record = job_status('spool', job_id)
+    assert state == FAILED and record['error'] == 'lease expired too many times'
+
+def test_outputs_are_renamed_into_place(workdir):
+    synthetic_roster(seed=1, brothers=3).to_csv('roster.csv', index=False)
+    submit_job('spool', 'roster.csv', 'out', deterministic=True)
+    run_worker('spool', worker_id='w1', exit_when_idle=True)
+
+    assert sorted(os.listdir('out/Rosters')) == ['Officer Roster and Minutes Rosters.xlsx', 'manifest.json']
+    assert not [name for name in os.listdir('out/Minutes') if name.startswith('.')]
+
+def test_an_abandoned_reap_is_recovered(workdir):
+    job_id = submit_job('spool', 'roster.csv', 'out')
+    lease_path, _ = claim_job('spool', 'crashed')
+    # A reaper took the lease, then died before requeueing it
+    reaped_path = f'{lease_path}.0123.reaped'
+    os.rename(lease_path, reaped_path)
+    assert expire_leases('spool') == 0  # a reap could still be under way
+    os.utime(reaped_path, (0, 0))
+
+    assert expire_leases('spool') == 1
+    state, job = job_status('spool', job_id)
+    assert state == PENDING and job['attempts'] == 1
+    assert os.listdir(os.path.join('spool', LEASED)) == []
+
+def test_an_abandoned_reap_already_requeued_is_dropped(workdir):
+    job_id = submit_job('spool', 'roster.csv', 'out')
+    lease_path, _ = claim_job('spool', 'crashed')
+    reaped_path = f'{lease_path}.0123.reaped'
+    os.rename(lease_path, reaped_path)
+    with open(os.path.join('spool', PENDING, f'{job_id}.json'), 'w') as f:
+        f.write('{"id": "%s", "attempts": 1}' % job_id)
+    os.utime(reaped_path, (0, 0))
+
+    assert expire_leases('spool') == 0
+    assert job_status('spool', job_id)[1]['attempts'] == 1
+    assert os.listdir(os.path.join('spool', LEASED)) == []
@@ -0,0 +1,26 @@
+from docx import Document
+
+from generator import read_members, write
+from equivalence import synthetic_roster
+from utils import get_stylesheet, set_font
+
+def test_styles_are_defined_once(workdir):
+    doc = Document()
+    first, second = doc.add_paragraph().add_run('a'), doc.add_paragraph().add_run('b')
+    set_font(first, size=14)
+    set_font(second, size=14)
+    assert first.style.name == second.style.name == 'Outline Subtitle'
+    assert [s.name for s in doc.styles].count('Outline Subtitle') == 1
+
+def test_reopened_document_reuses_its_styles(workdir):
+    synthetic_roster(seed=1, brothers=3).to_csv('roster.csv', index=False)
+    write(*read_members('roster.csv'), outputs=['chapter'])
+
+    doc = Document('Minutes/Chapter Minutes Outline.docx')
+    stylesheet = get_stylesheet(doc)
+    bullet = doc.add_paragraph('New item', style=stylesheet.bullet())
+    set_font(bullet.runs[0], font_name='Helvetica Neue')
+    assert bullet.style.name == 'Outline Bullet'
+    assert bullet.runs[0].style.name == 'Agenda Text'
+    names = [s.name for s in doc.styles]
+    assert names.count('Outline Bullet') == names.count('Agenda Text') == 1
@@ -0,0 +1,83 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from equivalence import synthetic_roster
+from generator import read, read_members
+from members import as_members
+from validation import RosterValidationError, validate_members, validate_roster
+
+def _roster(*rows):
+    return pd.DataFrame(rows, columns=['Last Name', 'First Name', 'Current Office', 'Status'])
+
+BAD = _roster(
+    ['Smith', 'Ann', 'Alpha', 'Active'],
+    ['Jones', None, 'Alpha/Treasurer', 'Active'],
+    ['Brown', 'Cy', None, 'Active'],
+    ['Green', 'Di', 'Chapter Advisor', 'Alumni'],
+)
+
+def _rules(report):
+    return {(i.severity, i.rule): i.rows for i in report.issues}
+
+def test_every_problem_is_reported_at_once(workdir):
+    rules = _rules(validate_roster(BAD))
+    assert rules == {
+        ('error', 'missing-name'): [1],
+        ('warning', 'missing-office'): [2],
+        ('error', 'unknown-office'): [1],
+        ('error', 'duplicate-office'): [0, 1],
+        ('error', 'vacant-office'): [],
+    }
+
+def test_members_path_matches_the_dataframe_path(workdir):
+    assert _rules(validate_members(as_members(BAD))) == _rules(validate_roster(BAD))
+
+def test_missing_columns_stop_the_checks(workdir):
+    report = validate_roster(BAD.drop(columns=['Status']))
+    assert [i.rule for i in report.issues] == ['missing-columns']
+    assert 'Status' in report.issues[0].message
+
+def test_reading_a_bad_roster_raises_with_the_report(workdir):
+    BAD.to_csv('roster.csv', index=False)
+    for reader in (read, read_members):
+        with pytest.raises(RosterValidationError) as error:
+            reader('roster.csv')
+        assert len(error.value.report.errors) == 4
+        assert 'No active member holds Sigma' in str(error.value)
+    assert read_members('roster.csv', validate=False)[0][0].last_name == 'Smith'
+
+def test_possible_duplicates_are_warnings(workdir):
+    roster = _roster(['Smith', 'Ann', 'Alpha', 'Active'], ['Smith', 'Anne', 'Sigma', 'Active'])
+    report = validate_roster(roster)
+    assert report.ok
+    assert [(i.rule, i.rows) for i in report.warnings] == [('possible-duplicate', [0, 1])]
+
+def test_warnings_reach_the_caller(workdir):
+    from loader import load_roster
+
+    synthetic_roster(seed=1, brothers=3).to_csv('roster.csv', index=False)
+    for reader in (read, read_members):
+        rosters = reader('roster.csv')
+        active, staff = rosters
+        assert [i.rule for i in rosters.report.warnings] == ['missing-office']
+        # The daemon sends what read returns back over its socket
+        assert pickle.loads(pickle.dumps(rosters)).report.warnings == rosters.report.warnings
+    assert [i.rule for i in load_roster('roster.csv').report.warnings] == ['missing-office']
+    assert read_members('roster.csv', validate=False).report is None
+
+def test_duplicate_warnings_reach_the_caller(workdir, capsys):
+    from generator import print_warnings
+
+    roster = synthetic_roster(seed=1, brothers=3)
+    first = roster.iloc[0]
+    twin = _roster([first['Last Name'], first['First Name'] + 'e', None, 'Active'])
+    roster = pd.concat([roster, twin], ignore_index=True)
+    assert _rules(validate_members(as_members(roster))) == _rules(validate_roster(roster))
+
+    roster.to_csv('roster.csv', index=False)
+    for reader in (read, read_members):
+        rosters = print_warnings(reader('roster.csv'))
+        assert 'possible-duplicate' in [i.rule for i in rosters.report.warnings]
+        assert 'may be the same person' in capsys.readouterr().err
@@ -1,13 +1,17 @@
-import pandas as pd
+import io
+import os
+import weakref
+from functools import lru_cache
 
 from docx.oxml import parse_xml, OxmlElement
 from docx.oxml.ns import nsdecls, qn
 from docx.oxml.shape import CT_Picture
 from docx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne
 from docx.shared import Inches, Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
-from openpyxl.utils import get_column_letter
+from members import name_key, as_members
 
 # The following code for handling floating images in a Word document was
 # initially reported by user Kill0geR over at the python-docx GitHub page:
@@ -72,20 +76,35 @@ class CT_Anchor(BaseOxmlElement):
             '</wp:anchor>' % ( nsdecls('wp', 'a', 'pic', 'r'), int(pos_x), int(pos_y) )
         )
 
-def new_pic_anchor(part, image_descriptor, width, height, pos_x, pos_y):
+def new_pic_anchor(part, image_descriptor, width, height, pos_x, pos_y, filename=None):
     """
     Helper that returns a Word-compatible floating anchor for an image.
     """
     rId, image = part.get_or_add_image(image_descriptor)
     cx, cy = image.scaled_dimensions(width, height)
-    shape_id, filename = part.next_id, image.filename
+    shape_id, filename = part.next_id, filename or image.filename
     return CT_Anchor.new_pic_anchor(shape_id, rId, filename, cx, cy, pos_x, pos_y)
 
+def _file_version(path):
+    path = os.path.abspath(path)
+    return path, os.path.getmtime(path)
+
+@lru_cache(maxsize=16)
+def _image_bytes(path, mtime):
+    # The crests are added to every outline; read each one once per process
+    # (and again only if the file changes)
+    with open(path, 'rb') as f:
+        return f.read()
+
 # refer to docx.text.run.add_picture
 def add_float_picture(p, image_path_or_stream, width=None, height=None, pos_x=0, pos_y=0):
     """Add float picture at fixed position `pos_x` and `pos_y` to the top-left point of page."""
     run = p.add_run()
-    anchor = new_pic_anchor(run.part, image_path_or_stream, width, height, pos_x, pos_y)
+    filename = None
+    if isinstance(image_path_or_stream, str):
+        filename = os.path.basename(image_path_or_stream)
+        image_path_or_stream = io.BytesIO(_image_bytes(*_file_version(image_path_or_stream)))
+    anchor = new_pic_anchor(run.part, image_path_or_stream, width, height, pos_x, pos_y, filename)
     run._r.add_drawing(anchor)
 
 def set_cell_background_color(cell, color):
@@ -95,10 +114,20 @@ def set_cell_background_color(cell, color):
     tcPr.append(shd)
 
 def set_document_font(document, font_name):
-    styles = document.styles
-    for style in styles:
-        if style.type == 1:
-            style.font.name = font_name
+    """
+    Sets the document-wide default font once in docDefaults, which every
+    paragraph style inherits, instead of writing it into each style.
+    """
+    rFonts = document.styles.element.find(
+        f"{qn('w:docDefaults')}/{qn('w:rPrDefault')}/{qn('w:rPr')}/{qn('w:rFonts')}"
+    )
+    if rFonts is None:
+        document.styles['Normal'].font.name = font_name
+        return
+    for theme in ('w:asciiTheme', 'w:hAnsiTheme'):
+        rFonts.attrib.pop(qn(theme), None)
+    rFonts.set(qn('w:ascii'), font_name)
+    rFonts.set(qn('w:hAnsi'), font_name)
 
 def set_cell_borders(cell):
     tcPr = cell._element.get_or_add_tcPr()
@@ -110,13 +139,82 @@ def set_cell_borders(cell):
         border.set(qn('w:color'), '000000')
         tcPr.append(border)
 
-def set_font(run, font_name='Times New Roman', size=11, bold=False):
-    run.font.name = font_name
-    run.font.size = Pt(size)
-    run.bold = bold
+class StyleSheet:
+    """
+    The character and paragraph styles used by the outlines, defined once per
+    document and cached so runs and paragraphs only reference a style.
+    """
+    CHARACTER_STYLES = {
+        ('Times New Roman', 26, True): 'Outline Title',
+        ('Times New Roman', 20, True): 'Outline Chapter',
+        ('Times New Roman', 14, False): 'Outline Subtitle',
+        ('Times New Roman', 12, False): 'Outline Meeting',
+        ('Times New Roman', 11, False): 'Outline Text',
+        ('Times New Roman', 11, True): 'Outline Heading',
+        ('Helvetica Neue', 11, False): 'Agenda Text',
+        ('Helvetica Neue', 11, True): 'Agenda Heading',
+    }
+    # level -> (style name, base style, left indent in points)
+    BULLET_STYLES = {
+        1: ('Outline Bullet', 'List Bullet', 36),
+        2: ('Outline Bullet 2', 'List Bullet 2', 72),
+    }
+
+    def __init__(self, styles):
+        self.styles = styles
+        self._character = {}
+        self._paragraph = {}
+
+    def character(self, font_name='Times New Roman', size=11, bold=False):
+        key = (font_name, size, bold)
+        style = self._character.get(key)
+        if style is None:
+            name = self.CHARACTER_STYLES.get(key) or f'{font_name} {size}{" Bold" if bold else ""}'
+            # A reopened (e.g. patched) outline already defines its styles
+            if name in self.styles:
+                style = self.styles[name]
+            else:
+                style = self.styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+                style.font.name = font_name
+                style.font.size = Pt(size)
+                style.font.bold = bold
+            self._character[key] = style
+        return style
 
-def set_paragraph_indentation(paragraph, left_indent):
-    paragraph.paragraph_format.left_indent = Pt(left_indent)
+    def paragraph(self, name):
+        style = self._paragraph.get(name)
+        if style is None:
+            style = self._paragraph[name] = self.styles[name]
+        return style
+
+    def bullet(self, level=1):
+        name, base, indent = self.BULLET_STYLES[level]
+        style = self._paragraph.get(name)
+        if style is None:
+            if name in self.styles:
+                style = self.styles[name]
+            else:
+                style = self.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+                style.base_style = self.paragraph(base)
+                style.paragraph_format.left_indent = Pt(indent)
+            self._paragraph[name] = style
+        return style
+
+_stylesheets = weakref.WeakKeyDictionary()
+
+def get_stylesheet(obj):
+    """
+    Returns the cached StyleSheet for the document that owns `obj`
+    (a Document, a run, a paragraph or any of their parts).
+    """
+    part = getattr(obj, 'part', obj).package.main_document_part
+    stylesheet = _stylesheets.get(part)
+    if stylesheet is None:
+        stylesheet = _stylesheets[part] = StyleSheet(part.styles)
+    return stylesheet
+
+def set_font(run, font_name='Times New Roman', size=11, bold=False):
+    run.style = get_stylesheet(run).character(font_name, size, bold)
 
 def insertHR(paragraph, position='bottom'):
     """
@@ -142,40 +240,41 @@ def insertHR(paragraph, position='bottom'):
     border.set(qn('w:color'), 'auto')
     pBdr.append(border)
 
-def get_positions(row, delimiter=','):
+def parliamentary_line(title, role, active):
     """
-    Splits a string field of roles (e.g., 'Alpha/Beta') into a list.
-    Based on delimiter for our Roster we tend to use '/'
+    The 'Title: names' line listing the members who hold any of the
+    comma-separated `role`s.
     """
-    if pd.isna(row):
-        return []
-    return [pos.strip() for pos in row.split(delimiter)]
+    names = []
+    seen = set()
+    target_roles = [r.strip().lower() for r in role.split(', ')]
+    for member in as_members(active):
+        positions = [p.lower() for p in member.positions]
+        if any(r in positions for r in target_roles):
+            # Compare normalized keys so 'Smith ' and 'smith' aren't listed twice
+            key = (name_key(member.first_name), name_key(member.last_name))
+            if key not in seen:
+                seen.add(key)
+                names.append(member.name)
+    return f"{title}: {', '.join(names)}\n"
 
-def add_parliamentary_officers(paragraph, title, role, active_df):
+def add_parliamentary_officers(paragraph, title, role, active):
     """
     Adds a formatted list of names who hold specified roles to a paragraph.
     """
-    names = []
-    target_roles = [r.strip().lower() for r in role.split(', ')]
-    for _, row in active_df.iterrows():
-        positions = [p.lower() for p in get_positions(row['Current Office'], '/')]
-        if any(r in positions for r in target_roles):
-            name = f'{row["First Name"]} {row["Last Name"]}'
-            if name not in names:
-                names.append(name)
-    names_text = ', '.join(names)
-    run = paragraph.add_run(f'{title}: {names_text}\n')
-    set_font(run)
+    set_font(paragraph.add_run(parliamentary_line(title, role, active)))
 
 def add_header(document, header_text, different_header, font_name='Times New Roman', font_size=11, alignment=WD_ALIGN_PARAGRAPH.RIGHT):
     """
-    Adds a header to the document, optionally supporting a different first page header.
+    Adds a header to the document's last section, optionally supporting a different first page header.
     """
-    section = document.sections[0]
+    section = document.sections[-1]
     section.different_first_page_header_footer = different_header
 
     if different_header:
         first_page_header = section.first_page_header
+        # A later section would otherwise write into the previous section's header
+        first_page_header.is_linked_to_previous = False
         for paragraph in first_page_header.paragraphs:
             p = paragraph._element
             p.getparent().remove(p)
@@ -197,9 +296,9 @@ def add_header(document, header_text, different_header, font_name='Times New Rom
 def add_bullet_section(doc, title, bullets):
         p = doc.add_paragraph()
         set_font(p.add_run(title), 'Times New Roman', 11, True)
+        bullet_style = get_stylesheet(doc).bullet()
         for b in bullets:
-            bullet = doc.add_paragraph(b, style='List Bullet')
-            set_paragraph_indentation(bullet, 36)
+            doc.add_paragraph(b, style=bullet_style)
     
 def set_table_headers(table, headers):
     hdr_cells = table.rows[0].cells
@@ -235,61 +334,10 @@ def add_table_row(table, texts, r_index, center_cols=None):
             paragraph.alignment = align
     return r_index + 1
 
-def filter_sorted_brothers(active_df, exclude_roles):
-    return (active_df[~active_df['Current Office'].str.contains('|'.join(exclude_roles), na=False)]
-            .assign(last_lower=active_df['Last Name'].str.lower(),
-                    first_lower=active_df['First Name'].str.lower())
-            .sort_values(by=['last_lower', 'first_lower'])
-            .drop(columns=['last_lower', 'first_lower']))
-
-def get_officers_from_df(df, officer_roles):
-      for officer in officer_roles:
-        for _, row in df.iterrows():
-            positions = [p.strip().lower() for p in get_positions(row['Current Office'], '/')]
-            if officer.lower() in positions:
-                yield officer, row
-                
-def auto_adjust_column_widths(ws, df, start_row, start_column):
-    for i, col_idx in enumerate(range(start_column + 1, start_column + len(df.columns) + 1)):
-        max_length = 0
-        col_letter = get_column_letter(col_idx)
-        for row in ws.iter_rows(min_row=start_row + 1, max_row=start_row + 2 + len(df), min_col=col_idx, max_col=col_idx):
-            for cell in row:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-        ws.column_dimensions[col_letter].width = max_length + 7
-
-def create_df(active_df, roles):
+def add_table_rows(table, rows, center_cols=None):
     """
-    Filters and formats a DataFrame for a list of roles, assigns roll values,
-    and orders results based on original role priority.
+    Adds banded rows, one per list of cell texts.
     """
-    rows = []
-    roles_lower = [r.lower() for r in roles]
-
-    for _, row in active_df.iterrows():
-        positions = get_positions(row['Current Office'], '/')
-        for position in positions:
-            position_clean = position.strip()
-            if position_clean.lower() in roles_lower:
-                full_name = f"{row['First Name']} {row['Last Name']}"
-                rows.append({
-                    'Officers': position_clean,
-                    'Full Name': full_name,
-                    'Opening Roll': 'P',
-                    'Closing Roll': 'P'
-                })
-
-    df = pd.DataFrame(rows)
-
-    if not df.empty:
-        # Assign a rank based on position in the roles list for sorting
-        df["Rank"] = df["Officers"].apply(
-            lambda role: next((i for i, r in enumerate(roles) if r.lower() == role.lower()), len(roles))
-        )
-        df = df.sort_values("Rank").drop(columns=["Rank"])
-
-    return df
\ No newline at end of file
+    r_index = 0
+    for texts in rows:
+        r_index = add_table_row(table, texts, r_index, center_cols)
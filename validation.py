@@ -0,0 +1,157 @@
+from collections import namedtuple
+
+import constants
+from readers import ROSTER_COLUMNS
+from members import find_member_duplicates
+
+ValidationIssue = namedtuple('ValidationIssue', ['severity', 'rule', 'message', 'rows'])
+
+class ValidationReport:
+    """
+    Every problem found in a roster, so all of them can be fixed in one pass.
+    Errors block generation; warnings are only reported.
+    """
+    def __init__(self, issues=None):
+        self.issues = list(issues or [])
+
+    def add(self, severity, rule, message, rows=()):
+        self.issues.append(ValidationIssue(severity, rule, message, list(rows)))
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i.severity == 'error']
+
+    @property
+    def warnings(self):
+        return [i for i in self.issues if i.severity == 'warning']
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __str__(self):
+        lines = []
+        for issue in self.issues:
+            rows = f" (rows {', '.join(map(str, issue.rows[:10]))}{', ...' if len(issue.rows) > 10 else ''})" if issue.rows else ''
+            lines.append(f'{issue.severity.upper()}: {issue.message}{rows}')
+        return '\n'.join(lines) or 'Roster is valid.'
+
+class RosterValidationError(ValueError):
+    def __init__(self, report):
+        super().__init__(f'The roster has {len(report.errors)} problem(s):\n{report}')
+        self.report = report
+
+def _check_offices(report, held):
+    """
+    Adds the office errors for `held`, (row, office) for every office an
+    active member holds, in roster order.
+    """
+    known = {o.lower() for o in constants.officers + constants.advisors}
+    unknown = {}
+    holders = {}
+    for row, office in held:
+        if office.lower() not in known:
+            unknown.setdefault(office, []).append(row)
+        holders.setdefault(office.lower(), []).append(row)
+
+    for office in sorted(unknown):
+        report.add('error', 'unknown-office', f"Unknown office '{office}'", unknown[office])
+
+    for office in constants.required_offices:
+        rows = holders.get(office.lower(), [])
+        if not rows:
+            report.add('error', 'vacant-office', f"No active member holds {office}")
+        elif len(rows) > 1:
+            report.add('error', 'duplicate-office', f"{office} is held by {len(rows)} active members", rows)
+
+def validate_roster(df):
+    """
+    Checks a freshly read roster before anything is generated, in a few
+    vectorized passes, and returns a ValidationReport of every problem.
+    Row labels in the report are the DataFrame's index labels.
+    """
+    report = ValidationReport()
+
+    missing = [c for c in ROSTER_COLUMNS if c not in df.columns]
+    if missing:
+        report.add('error', 'missing-columns', f"Missing column(s): {', '.join(missing)}")
+        if 'Current Office' in missing or 'Status' in missing:
+            return report  # Nothing below can be checked without these
+
+    active = df[df['Status'] == 'Active']
+
+    for column in ('Last Name', 'First Name'):
+        if column in df.columns:
+            blank = active[column].isna() | (active[column].astype(str).str.strip() == '')
+            if blank.any():
+                report.add('error', 'missing-name', f"Active member(s) without a {column}", active.index[blank])
+
+    no_office = active['Current Office'].isna()
+    if no_office.any():
+        report.add('warning', 'missing-office', 'Active member(s) without a Current Office (listed as brothers)', active.index[no_office])
+
+    # One row per (member, office) held, e.g. 'Alpha/Beta' -> 'Alpha', 'Beta'
+    held = active['Current Office'].dropna().str.split('/').explode().str.strip()
+    held = held[held != '']
+    _check_offices(report, zip(held.index, held))
+
+    if 'Last Name' in df.columns and 'First Name' in df.columns:
+        # Needs pandas, like everything on this DataFrame path
+        from names import find_duplicates
+        for pair in find_duplicates(df).itertuples():
+            report.add('warning', 'possible-duplicate',
+                       f"'{pair.name_a}' and '{pair.name_b}' may be the same person", [pair.row_a, pair.row_b])
+
+    return report
+
+def check_roster(df):
+    """
+    Raises RosterValidationError if the roster has any errors; returns the report otherwise.
+    """
+    report = validate_roster(df)
+    if not report.ok:
+        raise RosterValidationError(report)
+    return report
+
+def validate_members(members, columns=ROSTER_COLUMNS):
+    """
+    validate_roster for Member records (see members.py), without pandas.
+    `columns` are the roster columns the file had. The checks match
+    validate_roster's, possible duplicates included.
+    """
+    report = ValidationReport()
+
+    missing = [c for c in ROSTER_COLUMNS if c not in columns]
+    if missing:
+        report.add('error', 'missing-columns', f"Missing column(s): {', '.join(missing)}")
+        if 'Current Office' in missing or 'Status' in missing:
+            return report
+
+    # Former office holders (see assignments.roster_as_of) fill their offices too
+    active = [m for m in members if m.status == 'Active' or m.former]
+
+    for column, field in (('Last Name', 'last_name'), ('First Name', 'first_name')):
+        if column in columns:
+            blank = [m.row for m in active if not str(getattr(m, field) or '').strip()]
+            if blank:
+                report.add('error', 'missing-name', f"Active member(s) without a {column}", blank)
+
+    no_office = [m.row for m in active if m.office is None]
+    if no_office:
+        report.add('warning', 'missing-office', 'Active member(s) without a Current Office (listed as brothers)', no_office)
+
+    _check_offices(report, ((m.row, p) for m in active for p in m.positions if p != ''))
+
+    if 'Last Name' in columns and 'First Name' in columns:
+        for a, b, _ in find_member_duplicates(members):
+            report.add('warning', 'possible-duplicate', f"'{a.name}' and '{b.name}' may be the same person", [a.row, b.row])
+    return report
+
+def check_members(members, columns=ROSTER_COLUMNS):
+    """
+    Raises RosterValidationError if the records have any errors; returns the report otherwise.
+    """
+    report = validate_members(members, columns)
+    if not report.ok:
+        raise RosterValidationError(report)
+    return report